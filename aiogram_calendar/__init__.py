@@ -1,4 +1,17 @@
 # flake8: noqa
-from aiogram_calendar.common import get_user_locale
+from aiogram_calendar.common import get_user_locale, get_calendar_labels, CalendarWindow, Clock, FixedClock
 from aiogram_calendar.calendar import Calendar
-from aiogram_calendar.schemas import CalendarCallback, CalendarLabels
+from aiogram_calendar.schemas import CalendarCallback, CalendarLabels, CalendarPayload, decode_callback, packed
+from aiogram_calendar.cache import KeyboardCache, default_keyboard_cache
+from aiogram_calendar.filters import CalendarFilter
+from aiogram_calendar.edits import BackgroundEditor, EditCoalescer, edit_reply_markup_json, send_message_json
+from aiogram_calendar.metrics import CalendarObserver, MetricsAggregator
+from aiogram_calendar.registry import CalendarRegistry, default_registry
+from aiogram_calendar.middleware import CalendarMiddleware
+from aiogram_calendar.keyboard import Button, Keyboard
+from aiogram_calendar.range_calendar import RangeCalendar
+from aiogram_calendar.state import CalendarStateStore, FSMStateStore, MemoryStateStore, TTLCache, message_token
+from aiogram_calendar.availability import AvailabilityCache, AvailabilityProvider, default_availability_cache
+from aiogram_calendar.warmup import WarmUpReport, schedule_warm_up, warm_up
+from aiogram_calendar.navigation_calendar import NavigationCalendar
+from aiogram_calendar.shared_cache import SharedKeyboardCache
@@ -0,0 +1,116 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable
+
+from .keyboard import Keyboard
+from .state import TTLCache
+
+AVAILABILITY_TTL = 60  # seconds unavailable days of a month are cached for
+AVAILABILITY_MAX_MONTHS = 4096  # max number of (provider key, year, month) entries kept
+AVAILABILITY_MAX_OVERLAYS = 1024  # max number of keyboards with unavailable days laid over kept
+
+
+class AvailabilityProvider(ABC):
+    """Source of days that can't be selected, e.g. booked dates or holidays from your backend
+
+    unavailable_days is called once per rendered month with the whole month as a single batch,
+    results are cached by AvailabilityCache under (key, year, month). Without `key` the provider
+    object itself is the key. Set it to share cached days between instances with the same data,
+    e.g. to id of the booked resource.
+    """
+
+    key: Hashable = None
+
+    @abstractmethod
+    async def unavailable_days(self, year: int, month: int) -> Iterable[int]:
+        """Returns numbers of days of month that can't be selected"""
+
+
+def _cache_key(provider: AvailabilityProvider, year: int, month: int) -> Hashable:
+    return (provider.key if provider.key is not None else provider), year, month
+
+
+class AvailabilityCache:
+    """TTL cache of unavailable days per (provider key, year, month)
+
+    Entries expire `ttl` seconds after they were fetched. Concurrent lookups of the same month
+    share a single provider call, so a burst of renders still costs one backend request.
+    Keyboards with unavailable days laid over are memoized for the same time (see `overlay`).
+    """
+
+    def __init__(
+        self,
+        ttl: float = AVAILABILITY_TTL,
+        maxsize: int = AVAILABILITY_MAX_MONTHS,
+        max_overlays: int = AVAILABILITY_MAX_OVERLAYS
+    ) -> None:
+        self._cache = TTLCache(maxsize, ttl, sliding=False)
+        self._overlays = TTLCache(max_overlays, ttl, sliding=False)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, provider: AvailabilityProvider, year: int, month: int) -> FrozenSet[int]:
+        """Returns unavailable days of month, asking provider only on cache miss"""
+        key = _cache_key(provider, year, month)
+        days = self._cache.get(key)
+        if days is not None:
+            self.hits += 1
+            return days
+        future = self._inflight.get(key)
+        if future is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+        self.misses += 1
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            days = frozenset(await provider.unavailable_days(year, month))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here, so it isn't reported if nobody else waits for it
+            raise
+        else:
+            self._cache.set(key, days)
+            future.set_result(days)
+            return days
+        finally:
+            del self._inflight[key]
+
+    def overlay(
+        self,
+        keyboard: Keyboard,
+        days: FrozenSet[int],
+        build: Callable[..., Keyboard],
+        *args
+    ) -> Keyboard:
+        """Returns build(keyboard, days, *args) memoized per (keyboard, days)
+
+        Memoized keyboard keeps its markup and JSON, so they aren't rebuilt on every render of a month
+        with unavailable days. Entries hold the base keyboard, so its id can't be reused while they live.
+        """
+        key = (id(keyboard), days)
+        item = self._overlays.get(key)
+        if item is not None:
+            return item[1]
+        overlaid = build(keyboard, days, *args)
+        self._overlays.set(key, (keyboard, overlaid))
+        return overlaid
+
+    def invalidate(self, provider: AvailabilityProvider, year: int, month: int) -> None:
+        """Drops cached days of month, e.g. after a booking was made"""
+        self._cache.pop(_cache_key(provider, year, month))
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._overlays.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+default_availability_cache = AvailabilityCache()
@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Hashable, Optional
+
+KEYBOARD_CACHE_SIZE = 1024  # max number of rendered keyboards kept (per partition if partitioned)
+# local dates of one moment differ by up to 2 days between timezones (UTC-12 to UTC+14),
+# keyboards of dates older than that before the newest date seen can't be shown anymore
+DATE_SPREAD = timedelta(days=2)
+
+
+class KeyboardCache:
+    """LRU cache of rendered calendar keyboards
+
+    Keyboards depend on the current date, so entries are keyed by the date passed in as well: calendars
+    with clocks in different timezones share the cache without dropping each other's keyboards.
+    Keyboards of dates more than DATE_SPREAD before the newest date seen are dropped at once,
+    other past ones are evicted as least recently used.
+    With `per_locale=True` every labels partition gets its own LRU of `maxsize` entries,
+    so popular locales can't evict keyboards of less popular ones.
+    Cached keyboards are shared between calendars and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = KEYBOARD_CACHE_SIZE, per_locale: bool = False) -> None:
+        self.maxsize = maxsize
+        self.per_locale = per_locale
+        self.hits = 0
+        self.misses = 0
+        self._newest: Optional[date] = None
+        self._partitions: dict = {}  # partition -> OrderedDict of (date, key) -> keyboard
+        self._lock = threading.Lock()  # cache is shared between calendars, possibly in different threads
+
+    def _partition(self, today: date, partition: Hashable) -> OrderedDict:
+        if self._newest is None or today > self._newest:
+            # date rolled over - keyboards of dates no clock shows anymore are stale now
+            self._newest = today
+            self._drop_before(today - DATE_SPREAD)
+        if not self.per_locale:
+            partition = None
+        entries = self._partitions.get(partition)
+        if entries is None:
+            entries = self._partitions[partition] = OrderedDict()
+        return entries
+
+    def _drop_before(self, oldest: date) -> None:
+        for entries in self._partitions.values():
+            for key in [key for key in entries if key[0] < oldest]:
+                del entries[key]
+
+    def get(self, key: Hashable, today: date, partition: Hashable = None) -> Optional[Any]:
+        """Returns cached keyboard of key for today or None"""
+        key = (today, key)
+        with self._lock:
+            entries = self._partition(today, partition)
+            value = entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable, today: date, partition: Hashable = None) -> Optional[Any]:
+        """Returns cached keyboard of key for today or None, without counting it and refreshing its LRU position"""
+        with self._lock:
+            return self._partitions.get(partition if self.per_locale else None, {}).get((today, key))
+
+    def set(self, key: Hashable, today: date, value: Any, partition: Hashable = None) -> None:
+        """Stores keyboard of key for today, evicting least recently used ones over the size limit"""
+        key = (today, key)
+        with self._lock:
+            entries = self._partition(today, partition)
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+            self._newest = None
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._partitions.values())
+
+
+default_keyboard_cache = KeyboardCache()
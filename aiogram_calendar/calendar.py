@@ -1,47 +1,96 @@
-import calendar
 from datetime import datetime, timedelta
+from time import perf_counter
+from functools import partial
+from typing import Awaitable, Callable, FrozenSet, Iterable, List, Optional, Tuple
 
-from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from aiogram.types import CallbackQuery
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import CallbackQuery, Message
 
-from .schemas import CalendarCallback, CalendarActions, highlight
-from .common import GenericCalendar
+from .schemas import CalendarCallback, CalendarActions, highlight, packed
+from .common import CalendarWindow, GenericCalendar
+from .edits import edit_reply_markup_json, message_key
+from .grid import MONTH_STRIKE, DayCell, day_positions, month_grid, strikethrough
+from .keyboard import Button, Keyboard
+
+NOT_SELECTED = (False, None)
+DAYS_FIRST_ROW = 3  # index of first row of days in days keyboard, after year, month and weekdays rows
+MAX_ROW_BUTTONS = 8  # Telegram rejects inline keyboard rows with more buttons
 
 
 class Calendar(GenericCalendar):
 
-    ignore_callback = CalendarCallback(act=CalendarActions.ignore).pack()  # placeholder for no answer buttons
+    ignore_callback = packed(CalendarActions.ignore)  # placeholder for no answer buttons
+    days_view = "days"  # name of days keyboard in keyboard cache and observer events
+    days_first_row = DAYS_FIRST_ROW
+
+    def _cached_kb(self, key: tuple, build, window: CalendarWindow, *args) -> Keyboard:
+        """Returns keyboard from keyboard cache or builds and caches it"""
+        if self.observer is None:
+            return self._lookup_kb(key, build, window, *args)[0]
+        started = perf_counter()
+        kb, cached = self._lookup_kb(key, build, window, *args)
+        self.observer.on_render(key[0], perf_counter() - started, cached)
+        return kb
+
+    def _lookup_kb(self, key: tuple, build, window: CalendarWindow, *args) -> Tuple[Keyboard, bool]:
+        if self.keyboard_cache is None and self.shared_cache is None:
+            return build(window, *args), False
+        labels = self._labels
+        today = window.today.date()
+        key = self._cache_key(key, window)
+        if self.keyboard_cache is not None:
+            kb = self.keyboard_cache.get(key, today, labels)
+            if kb is not None:
+                return kb, True
+        # on local miss keyboard is read from the file shared by worker processes, rendered if it isn't there
+        kb = self.shared_cache.get(key, today) if self.shared_cache is not None else None
+        cached = kb is not None
+        if kb is None:
+            kb = build(window, *args)
+        if self.keyboard_cache is not None:
+            self.keyboard_cache.set(key, today, kb, labels)
+        return kb, cached
+
+    def _cache_key(self, key: tuple, window: CalendarWindow) -> tuple:
+        # keyed on resolved labels, so locales with the same names (e.g. "en", "en_US", unknown ones) share keyboards
+        return (self._labels, window.bounds) + key
 
-    async def _get_month_kb(self, year: int):
+    async def _get_month_kb(self, year: int, window: CalendarWindow = None):
         """Creates an inline keyboard with months for specified year"""
-        today = datetime.now()
-        now_month, now_year = today.month, today.year
-        min_year, max_year = now_year, now_year + 1  # Restrict to current and next year
-        min_month = now_month if year == min_year else 1  # Minimum month is current month in min_year
+        return (await self._month_keyboard(year, window or self.get_window())).markup_copy()
+
+    async def _month_keyboard(self, year: int, window: CalendarWindow) -> Keyboard:
+        return self._cached_kb(("month", year), self._build_month_kb, window, year)
+
+    def _build_month_kb(self, window: CalendarWindow, year: int) -> Keyboard:
+        now_month, now_year = window.today.month, window.today.year
+        min_year, max_year = window.min_year, window.max_year
+        min_month = window.min_month if year == min_year else 1  # Months before min_month in min_year are disabled
+        max_month = window.max_month if year == max_year else 12  # Months after max_month in max_year are disabled
 
         kb = []
         # First row with year navigation
         nav_row = []
         if year > min_year:
-            nav_row.append(InlineKeyboardButton(
+            nav_row.append(Button(
                 text="<<",
-                callback_data=CalendarCallback(act=CalendarActions.prev_y, year=year, month=-1, day=-1).pack()
+                callback_data=packed(CalendarActions.prev_y, year, -1, -1)
             ))
         else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            nav_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
-        nav_row.append(InlineKeyboardButton(
+        nav_row.append(Button(
             text=str(year) if year != now_year else highlight(year),
-            callback_data=CalendarCallback(act=CalendarActions.start, year=year, month=-1, day=-1).pack()
+            callback_data=packed(CalendarActions.start, year, -1, -1)
         ))
         
         if year < max_year:
-            nav_row.append(InlineKeyboardButton(
+            nav_row.append(Button(
                 text=">>",
-                callback_data=CalendarCallback(act=CalendarActions.next_y, year=year, month=-1, day=-1).pack()
+                callback_data=packed(CalendarActions.next_y, year, -1, -1)
             ))
         else:
-            nav_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            nav_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
         kb.append(nav_row)
 
@@ -49,113 +98,124 @@ class Calendar(GenericCalendar):
         month6_row = []
         def highlight_month(month):
             month_str = self._labels.months[month - 1]
-            # Strikethrough months before min_month in min_year
-            if year == min_year and month < min_month:
-                return ''.join(c + '\u0336' for c in month_str)
+            # Strikethrough months out of navigable window
+            if month < min_month or month > max_month:
+                return strikethrough(month_str, MONTH_STRIKE)
             elif now_month == month and now_year == year:
                 return highlight(month_str)
             return month_str
 
         for month in range(1, 7):
-            if year == min_year and month < min_month:
-                month6_row.append(InlineKeyboardButton(
+            if month < min_month or month > max_month:
+                month6_row.append(Button(
                     text=highlight_month(month),
                     callback_data=self.ignore_callback
                 ))
             else:
-                month6_row.append(InlineKeyboardButton(
+                month6_row.append(Button(
                     text=highlight_month(month),
-                    callback_data=CalendarCallback(
-                        act=CalendarActions.set_m, year=year, month=month, day=-1
-                    ).pack()
+                    callback_data=packed(CalendarActions.set_m, year, month, -1)
                 ))
         kb.append(month6_row)
 
         month12_row = []
         for month in range(7, 13):
-            if year == min_year and month < min_month:
-                month12_row.append(InlineKeyboardButton(
+            if month < min_month or month > max_month:
+                month12_row.append(Button(
                     text=highlight_month(month),
                     callback_data=self.ignore_callback
                 ))
             else:
-                month12_row.append(InlineKeyboardButton(
+                month12_row.append(Button(
                     text=highlight_month(month),
-                    callback_data=CalendarCallback(
-                        act=CalendarActions.set_m, year=year, month=month, day=-1
-                    ).pack()
+                    callback_data=packed(CalendarActions.set_m, year, month, -1)
                 ))
         kb.append(month12_row)
 
         # Last row with cancel button only
         cancel_row = [
-            InlineKeyboardButton(
+            Button(
                 text=self._labels.cancel_caption,
-                callback_data=CalendarCallback(act=CalendarActions.cancel, year=year, month=1, day=1).pack()
+                callback_data=packed(CalendarActions.cancel, year, 1, 1)
             )
         ]
         kb.append(cancel_row)
 
-        return InlineKeyboardMarkup(row_width=6, inline_keyboard=kb)
+        return Keyboard(kb, row_width=6)
 
-    async def _get_days_kb(self, year: int, month: int):
+    async def _get_days_kb(self, year: int, month: int, window: CalendarWindow = None):
         """Creates an inline keyboard with calendar days of month for specified year and month"""
-        today = datetime.now()
-        now_weekday = self._labels.days_of_week[today.weekday()]
-        now_month, now_year, now_day = today.month, today.year, today.day
-        min_year, max_year = now_year, now_year + 1  # Restrict to current and next year
-        min_month = now_month if year == min_year else 1  # Minimum month in min_year
-        max_month = 12  # Maximum month in max_year
-
-        def highlight_month():
-            month_str = self._labels.months[month - 1]
-            if now_month == month and now_year == year:
-                return highlight(month_str)
-            return month_str
+        return (await self._days_keyboard(year, month, window or self.get_window())).markup_copy()
+
+    async def _days_keyboard(self, year: int, month: int, window: CalendarWindow) -> Keyboard:
+        keyboard = self._cached_kb((self.days_view, year, month), self._build_days_kb, window, year, month)
+        # unavailable days of the whole month are fetched at once and laid over the cached keyboard
+        unavailable = await self._unavailable_days(year, month)
+        if not unavailable:
+            return keyboard
+        return self.availability_cache.overlay(keyboard, unavailable, self._disable_days, year, month)
+
+    def _disable_days(self, keyboard: Keyboard, days: FrozenSet[int], year: int, month: int) -> Keyboard:
+        return self._replace_days(keyboard, year, month, days, self._disabled_button)
+
+    def _disabled_button(self, cell: DayCell, button: Button) -> Button:
+        return Button(text=cell.struck, callback_data=self.ignore_callback)
+
+    def _replace_days(
+        self,
+        keyboard: Keyboard,
+        year: int,
+        month: int,
+        days: Iterable[int],
+        replace: Callable[[DayCell, Button], Button]
+    ) -> Keyboard:
+        """Returns copy of days keyboard with buttons of days replaced, only affected rows are rebuilt"""
+        positions = day_positions(year, month)
+        weeks = month_grid(year, month)
+        rows = {}
+        for day in days:
+            position = positions.get(day)
+            if position is None:
+                continue
+            week_idx, day_idx = position
+            row_idx = self.days_first_row + week_idx
+            row = rows.get(row_idx)
+            if row is None:
+                row = rows[row_idx] = list(keyboard.rows[row_idx])
+            row[day_idx] = replace(weeks[week_idx][day_idx], row[day_idx])
+        return keyboard.replace_rows(rows) if rows else keyboard
 
-        def highlight_weekday():
-            if now_month == month and now_year == year and now_weekday == weekday:
-                return highlight(weekday)
-            return weekday
-
-        def format_day_string():
-            # For edge case (last week with empty Sunday), don't pad days in last row
-            if is_edge_case and week_idx == len(month_calendar) - 1:
-                return f"{day}"  # No padding in edge case row
-            return f" {day:2} "  # Normal padding for other row
-
-        def highlight_day():
-            day_string = format_day_string()
-            # Strikethrough days before today in the current month and year
-            if year == now_year and month == now_month and day < now_day:
-                return ''.join(c + '\u0335' for c in day_string)  # Short stroke overlay
-            elif now_month == month and now_year == year and now_day == day:
-                return highlight(day_string.strip() if len(day_string.strip()) == 2 else day_string)
-            return day_string
+    def _build_days_kb(self, window: CalendarWindow, year: int, month: int) -> Keyboard:
+        today = window.today
+        now_month, now_year = today.month, today.year
+        min_year, max_year = window.min_year, window.max_year
+        min_month = window.min_month if year == min_year else 1  # Minimum month in min_year
+        max_month = window.max_month  # Maximum month in max_year
+        is_current_month = now_month == month and now_year == year
 
         kb = []
         # First row - Year navigation
         year_row = []
         if year > min_year:
-            year_row.append(InlineKeyboardButton(
+            year_row.append(Button(
                 text="<<",
-                callback_data=CalendarCallback(act=CalendarActions.prev_y, year=year, month=month, day=1).pack()
+                callback_data=packed(CalendarActions.prev_y, year, month, 1)
             ))
         else:
-            year_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            year_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
-        year_row.append(InlineKeyboardButton(
+        year_row.append(Button(
             text=str(year) if year != now_year else highlight(year),
-            callback_data=CalendarCallback(act=CalendarActions.start, year=year, month=-1, day=-1).pack()
+            callback_data=packed(CalendarActions.start, year, -1, -1)
         ))
         
         if year < max_year:
-            year_row.append(InlineKeyboardButton(
+            year_row.append(Button(
                 text=">>",
-                callback_data=CalendarCallback(act=CalendarActions.next_y, year=year, month=month, day=1).pack()
+                callback_data=packed(CalendarActions.next_y, year, month, 1)
             ))
         else:
-            year_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            year_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
         kb.append(year_row)
 
@@ -163,167 +223,283 @@ class Calendar(GenericCalendar):
         month_row = []
         # Show "<" only if not at min boundary (min_month of min_year)
         if not (year == min_year and month <= min_month):
-            month_row.append(InlineKeyboardButton(
+            month_row.append(Button(
                 text="<",
-                callback_data=CalendarCallback(act=CalendarActions.prev_m, year=year, month=month, day=1).pack()
+                callback_data=packed(CalendarActions.prev_m, year, month, 1)
             ))
         else:
-            month_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            month_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
-        month_row.append(InlineKeyboardButton(
-            text=highlight_month(),
-            callback_data=CalendarCallback(act=CalendarActions.set_y, year=year, month=-1, day=-1).pack()
+        month_row.append(Button(
+            text=highlight(self._labels.months[month - 1]) if is_current_month else self._labels.months[month - 1],
+            callback_data=packed(CalendarActions.set_y, year, -1, -1)
         ))
         
         # Show ">" only if not at max boundary (max_month of max_year)
         if not (year == max_year and month >= max_month):
-            month_row.append(InlineKeyboardButton(
+            month_row.append(Button(
                 text=">",
-                callback_data=CalendarCallback(act=CalendarActions.next_m, year=year, month=month, day=1).pack()
+                callback_data=packed(CalendarActions.next_m, year, month, 1)
             ))
         else:
-            month_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+            month_row.append(Button(text=" ", callback_data=self.ignore_callback))
         
         kb.append(month_row)
 
         # Third row - Weekday labels
+        now_weekday = today.weekday() if is_current_month else -1
         week_days_labels_row = []
-        for weekday in self._labels.days_of_week:
-            week_days_labels_row.append(InlineKeyboardButton(
-                text=highlight_weekday(), callback_data=self.ignore_callback))
+        for weekday_idx, weekday in enumerate(self._labels.days_of_week):
+            week_days_labels_row.append(Button(
+                text=highlight(weekday) if weekday_idx == now_weekday else weekday,
+                callback_data=self.ignore_callback
+            ))
         kb.append(week_days_labels_row)
 
-        # Calendar days
-        month_calendar = calendar.monthcalendar(year, month)
-        for week_idx, week in enumerate(month_calendar):
-            days_row = []
-            
-            # Check if this is the last week with only first cell empty (month ends on Sunday)
-            is_edge_case = (week_idx == len(month_calendar) - 1 and  # Last week
-                week[6] == 0 and  # Sunday is empty
-                all(d > 0 for d in week[:6]))  # Monday-Saturday are non-empty
-            
-            for day_idx, day in enumerate(week):
-                if day == 0:
-                    if is_edge_case and day_idx == 6:
-                        # Use a special invisible character that maintains width
-                        display_text = " ⠀ "  # U+202F (narrow no-break space)
-                    else:
-                        display_text = "    "  # Normal empty cell
-                    callback = self.ignore_callback
-                else:
-                    display_text = highlight_day()
-                    if year == now_year and month == now_month and day < now_day:
-                        callback = self.ignore_callback
-                    else:
-                        callback = CalendarCallback(
-                            act=CalendarActions.day, 
-                            year=year, 
-                            month=month, 
-                            day=day
-                        ).pack()
-                
-                days_row.append(InlineKeyboardButton(
-                    text=display_text,
-                    callback_data=callback
-                ))
-            kb.append(days_row)
+        # Calendar days, texts of cells are prebuilt in month grid
+        kb.extend(self._days_rows(today, year, month))
 
         # Last row with cancel button only
         cancel_row = [
-            InlineKeyboardButton(
+            Button(
                 text=self._labels.cancel_caption,
-                callback_data=CalendarCallback(act=CalendarActions.cancel, year=year, month=month, day=1).pack()
+                callback_data=packed(CalendarActions.cancel, year, month, 1)
             )
         ]
         kb.append(cancel_row)
 
-        return InlineKeyboardMarkup(row_width=7, inline_keyboard=kb, resize_keyboard=True)
+        return Keyboard(kb, row_width=7, resize_keyboard=True)
+
+    def _days_rows(self, today: datetime, year: int, month: int) -> List[List[Button]]:
+        """Rows of day buttons of month, days before today are struck and can't be selected"""
+        is_current_month = today.month == month and today.year == year
+        now_day = today.day
+        rows = []
+        for week in month_grid(year, month):
+            days_row = []
+            for cell in week:
+                if cell.day == 0:
+                    days_row.append(Button(text=cell.text, callback_data=self.ignore_callback))
+                elif is_current_month and cell.day < now_day:
+                    # Strikethrough days before today in the current month and year
+                    days_row.append(Button(text=cell.struck, callback_data=self.ignore_callback))
+                else:
+                    days_row.append(Button(
+                        text=cell.today if is_current_month and cell.day == now_day else cell.text,
+                        callback_data=packed(CalendarActions.day, year, month, cell.day)
+                    ))
+            rows.append(days_row)
+        return rows
 
     async def start_calendar(
         self,
-        year: int = datetime.now().year,
-        month: int = None
+        year: int = None,
+        month: int = None,
+        window: CalendarWindow = None
     ) -> InlineKeyboardMarkup:
-        today = datetime.now()
-        now_year = today.year
+        """Creates an inline keyboard to start date selection with, years selection or days of month if set
+
+        Parameters:
+        year (int): year of the keyboard, current year if None
+        month (int): if set, days keyboard of this month is returned
+        window (CalendarWindow): today's snapshot and navigable range, taken from calendar's clock if None
+        """
+        return (await self._start_keyboard(year, month, window or self.get_window())).markup_copy()
+
+    async def start_calendar_json(self, year: int = None, month: int = None, window: CalendarWindow = None) -> str:
+        """Same as start_calendar, but returns keyboard serialized to JSON, see `send_message_json`"""
+        return (await self._start_keyboard(year, month, window or self.get_window())).to_json()
 
+    async def _start_keyboard(self, year: Optional[int], month: Optional[int], window: CalendarWindow) -> Keyboard:
+        if year is None:
+            year = window.today.year
         if month:
-            return await self._get_days_kb(year, month)
+            return await self._days_keyboard(year, month, window)
+        return self._cached_kb(("start", year), self._build_start_kb, window, year)
+
+    def _build_start_kb(self, window: CalendarWindow, year: int) -> Keyboard:
+        now_year = window.today.year
 
         kb = []
-        # Year selection (current year and next year only)
-        years_row = []
-        for value in range(now_year, now_year + 2):  # Only current year and next year
-            years_row.append(InlineKeyboardButton(
+        # Year selection (years of navigable window only), wrapped as Telegram allows at most 8 buttons in a row
+        years = []
+        for value in range(window.min_year, window.max_year + 1):
+            years.append(Button(
                 text=str(value) if value != now_year else highlight(value),
-                callback_data=CalendarCallback(act=CalendarActions.set_y, year=value, month=-1, day=-1).pack()
+                callback_data=packed(CalendarActions.set_y, value, -1, -1)
             ))
-        kb.append(years_row)
+        for start in range(0, len(years), MAX_ROW_BUTTONS):
+            kb.append(years[start:start + MAX_ROW_BUTTONS])
 
         # Last row with cancel button only
         cancel_row = [
-            InlineKeyboardButton(
+            Button(
                 text=self._labels.cancel_caption,
-                callback_data=CalendarCallback(act=CalendarActions.cancel, year=year, month=1, day=1).pack()
+                callback_data=packed(CalendarActions.cancel, year, 1, 1)
             )
         ]
         kb.append(cancel_row)
 
-        return InlineKeyboardMarkup(row_width=2, inline_keyboard=kb)
+        return Keyboard(kb, row_width=2)
+
+    def warm_keyboards(self, months_ahead: int = 1, window: CalendarWindow = None) -> List[Keyboard]:
+        """Renders and caches keyboards users open first, see `_warm_views`
+
+        Markup of keyboards (JSON with serialized_markup) is built as well. Blocking,
+        meant to be run in executor, see `warm_up`.
+        """
+        window = window or self.get_window()
+        keyboards = [
+            self._cached_kb(key, build, window, *args) for key, build, args in self._warm_views(months_ahead, window)
+        ]
+        for keyboard in keyboards:
+            self._prebuild(keyboard)
+        return keyboards
+
+    def _prebuild(self, keyboard: Keyboard) -> None:
+        """Builds memoized markup of keyboard, or its JSON if edits are sent serialized"""
+        if self.serialized_markup:
+            keyboard.to_json()
+        else:
+            keyboard.markup()
+
+    def _warm_views(self, months_ahead: Optional[int], window: CalendarWindow) -> List[tuple]:
+        """Returns (cache key, builder, builder args) of keyboards users open first: years and months of the window,
+        days of the first month and `months_ahead` following ones (all months of window if None)
+        """
+        views = []
+        for year in range(window.min_year, window.max_year + 1):
+            views.append((("start", year), self._build_start_kb, (year,)))
+            views.append((("month", year), self._build_month_kb, (year,)))
+        return views + self._days_views(months_ahead, window)
+
+    def _days_views(self, months_ahead: Optional[int], window: CalendarWindow) -> List[tuple]:
+        views = []
+        year, month = window.min_year, window.min_month
+        while (year, month) <= (window.max_year, window.max_month):
+            views.append(((self.days_view, year, month), self._build_days_kb, (year, month)))
+            if months_ahead is not None and len(views) > months_ahead:
+                break
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return views
+
+    async def _show_keyboard(self, query: CallbackQuery, render: Callable[[], Awaitable[Keyboard]]) -> None:
+        """Renders keyboard and shows it in the message of query
+
+        With background editor the query is answered right away, rendering and editing run in background.
+        """
+        if self.background_editor is not None:
+            await self._answer_early(query)
+            self.background_editor.spawn(self._edit_keyboard(query, render), message_key(query.message))
+        else:
+            await self._edit_keyboard(query, render)
+
+    async def _edit_keyboard(self, query: CallbackQuery, render: Callable[[], Awaitable[Keyboard]]) -> None:
+        """Shows rendered keyboard in the message of query, through edit coalescer if set"""
+        keyboard = await render()
+        if self.edit_coalescer is not None:
+            # coalescer may send the edit later or skip it, so the sender is timed, not the coalescer
+            await self.edit_coalescer.edit(query.message, keyboard, self._timed_send)
+        else:
+            await self._timed_send(query.message, keyboard)
+
+    async def _timed_send(self, message: Message, keyboard: Keyboard):
+        return await self._api_call("editMessageReplyMarkup", self._send_keyboard(message, keyboard))
+
+    async def _send_keyboard(self, message: Message, keyboard: Keyboard):
+        if self.serialized_markup:
+            return await edit_reply_markup_json(message, keyboard.to_json())
+        return await message.edit_reply_markup(reply_markup=keyboard.markup())
+
+    async def _process_ignore(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self._api_call("answerCallbackQuery", query.answer(cache_time=60))
+        return NOT_SELECTED
+
+    async def _process_set_y(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self._show_keyboard(query, partial(self._month_keyboard, data.year, window))
+        return NOT_SELECTED
+
+    async def _process_start(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self._show_keyboard(query, partial(self._start_keyboard, data.year, None, window))
+        return NOT_SELECTED
+
+    async def _process_set_m(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self._show_keyboard(query, partial(self._days_keyboard, data.year, data.month, window))
+        return NOT_SELECTED
+
+    async def _process_day(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        return await self.process_day_select(data, query)
+
+    async def _process_cancel(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self._answer_early(query)
+        await self._drop_pending_edits(query.message)
+        await self._api_call("editMessageReplyMarkup", query.message.delete_reply_markup())
+        return NOT_SELECTED
+
+    async def _process_prev_y(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        new_year = max(data.year - 1, window.min_year)
+        if data.month == -1:
+            # From month keyboard: change year and show months
+            await self._show_keyboard(query, partial(self._month_keyboard, new_year, window))
+        else:
+            # From days keyboard: change year, keep month (within window), show days
+            new_year, new_month = window.clamp(new_year, data.month)
+            await self._show_keyboard(query, partial(self._days_keyboard, new_year, new_month, window))
+        return NOT_SELECTED
+
+    async def _process_next_y(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        new_year = min(data.year + 1, window.max_year)
+        if data.month == -1:
+            # From month keyboard: change year and show months
+            await self._show_keyboard(query, partial(self._month_keyboard, new_year, window))
+        else:
+            # From days keyboard: change year, keep month (within window), show days
+            new_year, new_month = window.clamp(new_year, data.month)
+            await self._show_keyboard(query, partial(self._days_keyboard, new_year, new_month, window))
+        return NOT_SELECTED
+
+    async def _process_prev_m(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        temp_date = datetime(data.year, data.month, 1) - timedelta(days=1)
+        # Stay at the first month of window
+        new_year, new_month = window.clamp(temp_date.year, temp_date.month)
+        await self._show_keyboard(query, partial(self._days_keyboard, new_year, new_month, window))
+        return NOT_SELECTED
+
+    async def _process_next_m(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        temp_date = datetime(data.year, data.month, 1) + timedelta(days=31)
+        # Stay at the last month of window
+        new_year, new_month = window.clamp(temp_date.year, temp_date.month)
+        await self._show_keyboard(query, partial(self._days_keyboard, new_year, new_month, window))
+        return NOT_SELECTED
+
+    # Dispatch table of callback actions, looked up once per callback instead of comparing actions one by one
+    _selection_handlers = {
+        CalendarActions.ignore: _process_ignore,
+        CalendarActions.set_y: _process_set_y,
+        CalendarActions.start: _process_start,
+        CalendarActions.set_m: _process_set_m,
+        CalendarActions.day: _process_day,
+        CalendarActions.cancel: _process_cancel,
+        CalendarActions.prev_y: _process_prev_y,
+        CalendarActions.next_y: _process_next_y,
+        CalendarActions.prev_m: _process_prev_m,
+        CalendarActions.next_m: _process_next_m,
+    }
 
     async def process_selection(self, query: CallbackQuery, data: CalendarCallback) -> tuple:
-        return_data = (False, None)
-        today = datetime.now()
-        min_year, max_year = today.year, today.year + 1  # Restrict to current and next year
-        min_month = today.month  # Minimum month in min_year is current month
-
-        if data.act == CalendarActions.ignore:
-            await query.answer(cache_time=60)
-        elif data.act == CalendarActions.set_y:
-            await query.message.edit_reply_markup(reply_markup=await self._get_month_kb(int(data.year)))
-        elif data.act == CalendarActions.start:
-            await query.message.edit_reply_markup(reply_markup=await self.start_calendar(int(data.year)))
-        elif data.act == CalendarActions.set_m:
-            await query.message.edit_reply_markup(reply_markup=await self._get_days_kb(int(data.year), int(data.month)))
-        elif data.act == CalendarActions.day:
-            return await self.process_day_select(data, query)
-        elif data.act == CalendarActions.cancel:
-            await query.message.delete_reply_markup()
-        elif data.act == CalendarActions.prev_y:
-            if data.month == -1:
-                # From month keyboard: change year and show months
-                new_year = max(int(data.year) - 1, min_year)
-                await query.message.edit_reply_markup(reply_markup=await self._get_month_kb(new_year))
-            else:
-                # From days keyboard: change year, keep month, show days
-                new_year = max(int(data.year) - 1, min_year)
-                new_month = min(data.month, 12) if new_year > min_year else max(data.month, min_month)
-                await query.message.edit_reply_markup(reply_markup=await self._get_days_kb(new_year, new_month))
-        elif data.act == CalendarActions.next_y:
-            if data.month == -1:
-                # From month keyboard: change year and show months
-                new_year = min(int(data.year) + 1, max_year)
-                await query.message.edit_reply_markup(reply_markup=await self._get_month_kb(new_year))
-            else:
-                # From days keyboard: change year, keep month, show days
-                new_year = min(int(data.year) + 1, max_year)
-                new_month = min(data.month, 12) if new_year > min_year else max(data.month, min_month)
-                await query.message.edit_reply_markup(reply_markup=await self._get_days_kb(new_year, new_month))
-        elif data.act == CalendarActions.prev_m:
-            temp_date = datetime(int(data.year), int(data.month), 1) - timedelta(days=1)
-            new_year = temp_date.year
-            new_month = temp_date.month
-            if new_year < min_year or (new_year == min_year and new_month < min_month):
-                new_year = min_year
-                new_month = min_month  # Stay at min_month of min_year
-            await query.message.edit_reply_markup(reply_markup=await self._get_days_kb(new_year, new_month))
-        elif data.act == CalendarActions.next_m:
-            temp_date = datetime(int(data.year), int(data.month), 1) + timedelta(days=31)
-            new_year = temp_date.year
-            new_month = temp_date.month
-            if new_year > max_year:
-                new_year = max_year
-                new_month = 12  # Stay at December of max_year
-            await query.message.edit_reply_markup(reply_markup=await self._get_days_kb(new_year, new_month))
-        return return_data
+        """Processes callback of calendar keyboard
+
+        data can be either CalendarCallback or CalendarPayload produced by CalendarFilter.
+        Returns (True, date) once the date is selected, (False, None) otherwise.
+        """
+        handler = self._selection_handlers.get(data.act)
+        if handler is None:
+            return NOT_SELECTED
+        if self.observer is None:
+            # one snapshot of today is used for the whole callback
+            return await handler(self, query, data, self.get_window())
+        started = perf_counter()
+        try:
+            return await handler(self, query, data, self.get_window())
+        finally:
+            self.observer.on_action(data.act, perf_counter() - started)
@@ -1,9 +1,15 @@
-from babel import Locale
-from babel.core import UnknownLocaleError
 from aiogram.types import User
 from datetime import datetime
+from functools import lru_cache
+from time import perf_counter
+from typing import Awaitable, Dict, FrozenSet, NamedTuple, Optional, Tuple
 
-from .schemas import CalendarLabels
+from .availability import AvailabilityCache, AvailabilityProvider, default_availability_cache
+from .cache import KeyboardCache, default_keyboard_cache
+from .edits import BackgroundEditor, EditCoalescer, message_key
+from .metrics import CalendarObserver
+from .shared_cache import SharedKeyboardCache
+from .schemas import Labels
 
 
 async def get_user_locale(user: User) -> str:
@@ -11,13 +17,138 @@ async def get_user_locale(user: User) -> str:
     return user.language_code or "en_US"
 
 
+DEFAULT_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+DEFAULT_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+LABELS_CACHE_SIZE = 256  # max number of distinct (locale, cancel, today) label sets kept in memory
+
+
+def normalize_locale(locale: str) -> str:
+    """Returns locale identifier with "_" separators, e.g. "pt_br" for "pt-br" Telegram sends"""
+    return locale.replace("-", "_")
+
+
+@lru_cache(maxsize=1)
+def _table_index() -> Dict[str, int]:
+    """Label set indexes of table locales by lowercase identifier, Babel matches identifiers in any case as well"""
+    from .locale_data import LOCALES  # loaded on first non-default locale only
+
+    return {identifier.lower(): index for identifier, index in LOCALES.items()}
+
+
+def table_labels(locale: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Returns (days, months) names of locale from prebuilt locale table, None if it isn't there"""
+    from .locale_data import LABEL_SETS
+
+    index = _table_index().get(normalize_locale(locale).lower())
+    return LABEL_SETS[index] if index is not None else None
+
+
+def babel_labels(locale: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+    """Returns (days, months) names of locale from Babel CLDR data, None for unknown locales"""
+    try:
+        from babel import Locale
+        from babel.core import UnknownLocaleError
+    except ImportError:
+        # Babel is needed only for locales missing in the table
+        return None
+
+    try:
+        babel_locale = Locale.parse(normalize_locale(locale), sep="_")
+    except (UnknownLocaleError, ValueError):
+        # Fallback to English if locale is unrecognized
+        return None
+    # Get day names with fallback (0-based indexing: 0 = Mon, 6 = Sun)
+    days = babel_locale.days["format"]["abbreviated"]
+    days_of_week = tuple(days.get(i, DEFAULT_DAYS[i]) for i in range(0, 7))
+    # Get full month names (1-based indexing: 1 = Jan, 12 = Dec)
+    stand_alone_months = babel_locale.months["stand-alone"]["abbreviated"]
+    months = tuple(stand_alone_months.get(i, DEFAULT_MONTHS[i-1]) for i in range(1, 13))
+    return days_of_week, months
+
+
+@lru_cache(maxsize=LABELS_CACHE_SIZE)
+def get_calendar_labels(locale: str = None, cancel_btn: str = None, today_btn: str = None) -> Labels:
+    """Resolves calendar labels for locale and captions, results are shared process-wide
+
+    Unknown locales are cached as well (they resolve to English), so table and Babel are looked up once per locale.
+    Hits and misses are available via `get_calendar_labels.cache_info()`.
+    """
+    days_of_week, months = DEFAULT_DAYS, DEFAULT_MONTHS
+    if locale:
+        # prebuilt table covers all CLDR locales, Babel is imported only for identifiers it doesn't have
+        names = table_labels(locale) or babel_labels(locale)
+        if names is not None:
+            days_of_week, months = names
+
+    labels = Labels(days_of_week, months)
+    if cancel_btn:
+        labels = labels._replace(cancel_caption=cancel_btn)
+    if today_btn:
+        labels = labels._replace(today_caption=today_btn)
+    return labels
+
+
+class Clock:
+    "Source of current date and time, subclass to use another timezone"
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class FixedClock(Clock):
+    "Clock stopped at specified moment, useful for tests and benchmarks"
+
+    def __init__(self, now: datetime) -> None:
+        self._now = now
+
+    def now(self) -> datetime:
+        return self._now
+
+
+class CalendarWindow(NamedTuple):
+    "Snapshot of today and the range of months a calendar can be navigated in"
+    today: datetime
+    min_year: int
+    min_month: int
+    max_year: int
+    max_month: int
+
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        return self.min_year, self.min_month, self.max_year, self.max_month
+
+    def clamp(self, year: int, month: int) -> Tuple[int, int]:
+        """Returns (year, month) moved inside the window"""
+        if (year, month) < (self.min_year, self.min_month):
+            return self.min_year, self.min_month
+        if (year, month) > (self.max_year, self.max_month):
+            return self.max_year, self.max_month
+        return year, month
+
+
+system_clock = Clock()
+
+
 class GenericCalendar:
     def __init__(
         self,
         locale: str = None,
         cancel_btn: str = None,
         today_btn: str = None,
-        show_alerts: bool = False
+        show_alerts: bool = False,
+        keyboard_cache: Optional[KeyboardCache] = default_keyboard_cache,
+        edit_coalescer: Optional[EditCoalescer] = None,
+        background_editor: Optional[BackgroundEditor] = None,
+        clock: Clock = system_clock,
+        years_ahead: int = 1,
+        observer: Optional[CalendarObserver] = None,
+        serialized_markup: bool = False,
+        availability: Optional[AvailabilityProvider] = None,
+        availability_cache: AvailabilityCache = default_availability_cache,
+        shared_cache: Optional[SharedKeyboardCache] = None
     ) -> None:
         """Pass labels if you need to have alternative language of buttons
 
@@ -26,70 +157,136 @@ class GenericCalendar:
         cancel_btn (str): label for button Cancel to cancel date input
         today_btn (str): label for button Today to set calendar back to today's date
         show_alerts (bool): defines how the date range error would be shown (defaults to False)
+        keyboard_cache (KeyboardCache): cache for rendered keyboards shared between instances, None disables caching
+        edit_coalescer (EditCoalescer): deduplicates and coalesces keyboard edits of navigation clicks, off if None
+        background_editor (BackgroundEditor): if set, callbacks are answered at once and navigation
+            keyboards are rendered and edited in background
+        clock (Clock): source of today's date, system local time by default
+        years_ahead (int): number of years after current one that can be navigated to (unless limited by dates range)
+        observer (CalendarObserver): receives action counts, render and API timings, e.g. MetricsAggregator
+        serialized_markup (bool): send keyboard edits as prebuilt JSON, skipping aiogram serialization of markup
+        availability (AvailabilityProvider): source of booked/disabled days, rendered struck and rejected on click
+        availability_cache (AvailabilityCache): TTL cache of provider results shared between instances
+        shared_cache (SharedKeyboardCache): memory-mapped keyboards shared by worker processes, read on local cache miss
         """
-        self._labels = CalendarLabels()
-        default_days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        default_months = [
-            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
-        ]
-
-        if locale:
-            try:
-                babel_locale = Locale.parse(locale, sep="_")
-                # Get day names with fallback (0-based indexing: 0 = Mon, 6 = Sun)
-                days = babel_locale.days["format"]["abbreviated"]
-                self._labels.days_of_week = [
-                    days.get(i, default_days[i]) for i in range(0, 7)
-                ]
-                # Get full month names (1-based indexing: 1 = Jan, 12 = Dec)
-                months = babel_locale.months["stand-alone"]["abbreviated"]
-                self._labels.months = [
-                    months.get(i, default_months[i-1]) for i in range(1, 13)
-                ]
-            except UnknownLocaleError:
-                # Fallback to English if locale is unrecognized
-                self._labels.days_of_week = default_days
-                self._labels.months = default_months
-        else:
-            # Default to English if no locale provided
-            self._labels.days_of_week = default_days
-            self._labels.months = default_months
-
-        if cancel_btn:
-            self._labels.cancel_caption = cancel_btn
-        if today_btn:
-            self._labels.today_caption = today_btn
+        # labels are resolved once per locale and shared between instances
+        self._labels_key = (locale or None, cancel_btn or None, today_btn or None)
+        self._labels = get_calendar_labels(*self._labels_key)
+        self.keyboard_cache = keyboard_cache
+        self.edit_coalescer = edit_coalescer
+        self.background_editor = background_editor
+        self.clock = clock
+        self.years_ahead = years_ahead
+        self.observer = observer
+        self.serialized_markup = serialized_markup
+        self.availability = availability
+        self.availability_cache = availability_cache
+        self.shared_cache = shared_cache
 
         self.min_date = None
         self.max_date = None
         self.show_alerts = show_alerts
+        self._frozen = False
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is frozen and shared, can't set {name}")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> None:
+        """Makes calendar read-only, so it can be shared between concurrent tasks"""
+        self._frozen = True
 
     def set_dates_range(self, min_date: datetime, max_date: datetime):
-        """Sets range of minimum & maximum dates"""
+        """Sets range of minimum & maximum dates, navigable window is limited to their months as well"""
         self.min_date = min_date
         self.max_date = max_date
 
+    def get_window(self) -> CalendarWindow:
+        """Takes snapshot of today and returns months range the calendar can be navigated in
+
+        Window starts at current month (or month of min_date if it's later) and ends at December of
+        `years_ahead` years later (or month of max_date if set).
+        """
+        today = self.clock.now()
+        start = (today.year, today.month)
+        if self.min_date and (self.min_date.year, self.min_date.month) > start:
+            start = (self.min_date.year, self.min_date.month)
+        end = (today.year + self.years_ahead, 12)
+        if self.max_date:
+            end = (self.max_date.year, self.max_date.month)
+        # window of min_date later than years_ahead (or than max_date) is its single month
+        end = max(end, start)
+        return CalendarWindow(today, start[0], start[1], end[0], end[1])
+
     async def process_day_select(self, data, query):
         """Checks selected date is in allowed range of dates"""
         date = datetime(int(data.year), int(data.month), int(data.day))
+        if not await self._check_date(date, query):
+            return False, None
+        await self._answer_early(query)
+        await self._drop_pending_edits(query.message)
+        await self._api_call("editMessageReplyMarkup", query.message.delete_reply_markup())
+        return True, date
+
+    async def _answer_early(self, query) -> None:
+        """Answers query right away if background editor is set, before slower API calls of the action"""
+        if self.background_editor is not None:
+            await self._api_call("answerCallbackQuery", query.answer())
+
+    async def _drop_pending_edits(self, message) -> None:
+        """Drops keyboard edits of message which are pending or running, before its keyboard is removed"""
+        if self.edit_coalescer is not None:
+            self.edit_coalescer.discard(message)
+        if self.background_editor is not None:
+            await self.background_editor.cancel(message_key(message))
+
+    async def _check_date(self, date: datetime, query) -> bool:
+        """Returns True if date is in allowed range of dates, otherwise answers query with the reason"""
         if self.min_date and self.min_date > date:
-            await query.answer(
+            if self.observer is not None:
+                self.observer.on_rejected(date, "min_date")
+            await self._api_call("answerCallbackQuery", query.answer(
                 f'The date has to be later than {self.min_date.strftime("%d/%m/%Y")}',
                 show_alert=self.show_alerts
-            )
-            return False, None
+            ))
+            return False
         elif self.max_date and self.max_date < date:
-            await query.answer(
+            if self.observer is not None:
+                self.observer.on_rejected(date, "max_date")
+            await self._api_call("answerCallbackQuery", query.answer(
                 f'The date has to be earlier than {self.max_date.strftime("%d/%m/%Y")}',
                 show_alert=self.show_alerts
-            )
-            return False, None
-        await query.message.delete_reply_markup()
-        return True, date
+            ))
+            return False
+        elif date.day in await self._unavailable_days(date.year, date.month):
+            if self.observer is not None:
+                self.observer.on_rejected(date, "unavailable")
+            await self._api_call("answerCallbackQuery", query.answer(
+                f'The date {date.strftime("%d/%m/%Y")} is not available',
+                show_alert=self.show_alerts
+            ))
+            return False
+        return True
+
+    async def _unavailable_days(self, year: int, month: int) -> FrozenSet[int]:
+        """Returns days of month blocked by availability provider, empty if there's no provider"""
+        if self.availability is None:
+            return frozenset()
+        return await self.availability_cache.get(self.availability, year, month)
+
+    async def _api_call(self, method: str, call: Awaitable):
+        """Awaits Telegram API call, timing it if observer is set"""
+        if self.observer is None:
+            return await call
+        started = perf_counter()
+        try:
+            return await call
+        finally:
+            self.observer.on_api_call(method, perf_counter() - started)
 
 
-# To run test: make `from .schemas import CalendarLabels` use absolute path: `from schemas ...` 
+# To run test: make `from .schemas import Labels` use absolute path: `from schemas ...` 
 # class MockUser:
 #     def __init__(self, language_code):
 #         self.language_code = language_code
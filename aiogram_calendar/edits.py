@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set, Tuple, Union
+
+from aiogram import Bot
+from aiogram.methods import EditMessageReplyMarkup, SendMessage
+from aiogram.types import Message
+
+from .keyboard import Keyboard
+
+logger = logging.getLogger(__name__)
+
+COALESCE_WINDOW = 0.3  # seconds to collect navigation clicks of one message before editing it
+COALESCE_MAX_MESSAGES = 10000  # max number of messages remembered for deduplication
+
+
+def message_key(message: Message) -> Hashable:
+    return message.chat.id, message.message_id
+
+
+async def edit_reply_markup_json(message: Message, reply_markup: str):
+    """Edits reply markup of message with already serialized JSON markup
+
+    Method is constructed without validation, aiogram sends string values as they are,
+    so the markup isn't serialized again on every edit.
+    """
+    method = EditMessageReplyMarkup.model_construct(
+        business_connection_id=message.business_connection_id,
+        chat_id=message.chat.id,
+        message_id=message.message_id,
+        reply_markup=reply_markup
+    )
+    return await message.bot(method)
+
+
+async def send_message_json(bot: Bot, chat_id: Union[int, str], text: str, reply_markup: str, **kwargs) -> Message:
+    """Sends message with already serialized JSON reply markup, e.g. from Calendar.start_calendar_json
+
+    Other keyword arguments are passed to SendMessage as they are, without validation.
+    """
+    method = SendMessage.model_construct(chat_id=chat_id, text=text, reply_markup=reply_markup, **kwargs)
+    return await bot(method)
+
+
+KeyboardSender = Callable[[Message, Keyboard], Awaitable[Any]]
+
+
+class EditCoalescer:
+    """Per-message layer in front of keyboard edits
+
+    Edits whose keyboard is identical to the one already shown are skipped, so clamped navigation
+    (e.g. ">" on the last month) doesn't cost an API call and "message is not modified" error.
+    With positive `window` edits are sent in background: clicks arriving within the window after the first one
+    only replace the pending keyboard, and a single edit with the final state is sent when the window ends.
+    """
+
+    def __init__(self, window: float = COALESCE_WINDOW, maxsize: int = COALESCE_MAX_MESSAGES) -> None:
+        self.window = window
+        self.maxsize = maxsize
+        self.sent = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self._last: OrderedDict = OrderedDict()  # message key -> last keyboard sent
+        self._pending: Dict[Hashable, Tuple[Message, Keyboard, KeyboardSender]] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    async def edit(self, message: Message, keyboard: Keyboard, send: KeyboardSender) -> None:
+        """Shows keyboard in message with send(message, keyboard), deduplicated and coalesced"""
+        key = message_key(message)
+        if self.window <= 0:
+            await self._send(key, message, keyboard, send)
+            return
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = (message, keyboard, send)
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    def discard(self, message: Message) -> None:
+        """Drops pending edit and remembered keyboard of message, e.g. when its keyboard is removed"""
+        key = message_key(message)
+        self._pending.pop(key, None)
+        self._last.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    async def _flush_later(self, key: Hashable) -> None:
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        try:
+            await self._send(key, *pending)
+        except Exception:
+            logger.exception("Failed to edit calendar keyboard of message %s", key)
+
+    async def _send(self, key: Hashable, message: Message, keyboard: Keyboard, send: KeyboardSender) -> None:
+        last = self._last.get(key)
+        if last is None and message.reply_markup is not None:
+            last = Keyboard.from_markup(message.reply_markup)
+        # cached keyboards are shared, so identical views are usually the very same object. Only buttons
+        # are compared, markup sent back by Telegram doesn't have our options (row_width, resize_keyboard)
+        if keyboard is last or (last is not None and keyboard.rows == last.rows):
+            self.skipped += 1
+            return
+        await send(message, keyboard)
+        self.sent += 1
+        self._last[key] = keyboard
+        self._last.move_to_end(key)
+        while len(self._last) > self.maxsize:
+            self._last.popitem(last=False)
+
+
+BACKGROUND_CONCURRENCY = 16  # max number of keyboard edits running at once
+BACKGROUND_ERRORS_KEPT = 100
+
+
+class BackgroundEditor:
+    """Runs keyboard renders and edits as background tasks
+
+    Lets calendar answer callback query right away, so handler latency doesn't depend on Telegram API latency.
+    At most `limit` edits run at once, the rest wait on a semaphore. Failed edits are logged, kept in `errors`
+    and passed to `on_error` if set. Edits spawned with a message key are cancelled by `cancel(key)`,
+    calendars do it before removing keyboard of the message, so a late edit can't bring it back.
+    """
+
+    def __init__(
+        self,
+        limit: int = BACKGROUND_CONCURRENCY,
+        on_error: Optional[Callable[[BaseException], Any]] = None
+    ) -> None:
+        self.limit = limit
+        self.on_error = on_error
+        self.errors: Deque[BaseException] = deque(maxlen=BACKGROUND_ERRORS_KEPT)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._keyed: Dict[Hashable, Set[asyncio.Task]] = {}  # message key -> its scheduled and running edits
+
+    def spawn(self, coro: Awaitable, key: Hashable = None) -> asyncio.Task:
+        """Schedules coroutine in background, `key` (e.g. message_key) lets it be cancelled with `cancel`"""
+        if self._semaphore is None:
+            # created lazily to bind to the running event loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        task = asyncio.ensure_future(self._run(coro))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if key is not None:
+            self._keyed.setdefault(key, set()).add(task)
+            task.add_done_callback(partial(self._forget, key))
+        return task
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        tasks = self._keyed.get(key)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                del self._keyed[key]
+
+    async def cancel(self, key: Hashable) -> None:
+        """Cancels scheduled and running edits spawned with key and waits until they are done"""
+        tasks = self._keyed.pop(key, None)
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, coro: Awaitable) -> None:
+        try:
+            async with self._semaphore:
+                await coro
+        except asyncio.CancelledError:
+            if asyncio.iscoroutine(coro):
+                coro.close()  # never started if cancelled while waiting for the semaphore
+            raise
+        except Exception as e:
+            logger.exception("Background calendar edit failed")
+            self.errors.append(e)
+            if self.on_error is not None:
+                self.on_error(e)
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def wait(self) -> None:
+        """Waits for all scheduled edits, e.g. on shutdown"""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
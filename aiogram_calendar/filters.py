@@ -0,0 +1,22 @@
+from typing import Union
+
+from aiogram.filters import Filter
+from aiogram.types import CallbackQuery
+
+from .schemas import decode_callback
+
+
+class CalendarFilter(Filter):
+    """Fast replacement of CalendarCallback.filter()
+
+    Decodes callback data with decode_callback instead of pydantic unpacking and
+    passes CalendarPayload to handler as `callback_data`, which process_selection accepts.
+    """
+
+    async def __call__(self, query: CallbackQuery) -> Union[bool, dict]:
+        if not query.data:
+            return False
+        payload = decode_callback(query.data)
+        if payload is None:
+            return False
+        return {"callback_data": payload}
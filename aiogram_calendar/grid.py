@@ -0,0 +1,70 @@
+import calendar
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+from .schemas import highlight, highlight_range
+
+DAY_STRIKE = '̵'  # short stroke overlay used for past days
+MONTH_STRIKE = '̶'  # long stroke overlay used for past months
+GRID_CACHE_SIZE = 64  # enough for the whole navigable range of several years
+
+
+def strikethrough(text: str, mark: str = DAY_STRIKE) -> str:
+    """Adds strikethrough overlay after every character of text"""
+    return ''.join(c + mark for c in text)
+
+
+class DayCell(NamedTuple):
+    "Prebuilt texts of one calendar cell, day is 0 for empty cells"
+    day: int
+    text: str
+    struck: str
+    today: str
+    selected: str
+
+
+def _day_cell(day: int, text: str) -> DayCell:
+    return DayCell(
+        day=day,
+        text=text,
+        struck=strikethrough(text),
+        today=highlight(text.strip() if len(text.strip()) == 2 else text),
+        selected=highlight_range(text.strip())
+    )
+
+
+# Padded day strings and their variants, indexed by day number
+PADDED_DAYS = tuple(_day_cell(day, f" {day:2} ") if day else None for day in range(32))
+# Last week of months ending on Saturday isn't padded (see month_grid)
+UNPADDED_DAYS = tuple(_day_cell(day, f"{day}") if day else None for day in range(32))
+EMPTY_CELL = DayCell(day=0, text="    ", struck="    ", today="    ", selected="    ")
+EDGE_EMPTY_CELL = DayCell(day=0, text=" ⠀ ", struck=" ⠀ ", today=" ⠀ ", selected=" ⠀ ")  # invisible char that maintains width
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def month_grid(year: int, month: int) -> Tuple[Tuple[DayCell, ...], ...]:
+    """Returns weeks of month as rows of prebuilt cells"""
+    month_calendar = calendar.monthcalendar(year, month)
+    last_week = month_calendar[-1]
+    # Last week with only Sunday empty (month ends on Saturday) is rendered without padding
+    is_edge_case = last_week[6] == 0 and all(d > 0 for d in last_week[:6])
+
+    weeks = []
+    for week in month_calendar[:-1]:
+        weeks.append(tuple(PADDED_DAYS[day] if day else EMPTY_CELL for day in week))
+    if is_edge_case:
+        weeks.append(tuple(UNPADDED_DAYS[day] for day in last_week[:6]) + (EDGE_EMPTY_CELL,))
+    else:
+        weeks.append(tuple(PADDED_DAYS[day] if day else EMPTY_CELL for day in last_week))
+    return tuple(weeks)
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def day_positions(year: int, month: int) -> Dict[int, Tuple[int, int]]:
+    """Returns (week index, weekday index) of every day of month in month_grid"""
+    return {
+        cell.day: (week_idx, day_idx)
+        for week_idx, week in enumerate(month_grid(year, month))
+        for day_idx, cell in enumerate(week)
+        if cell.day
+    }
@@ -0,0 +1,94 @@
+import json
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+
+class Button(NamedTuple):
+    "Lightweight inline button, calendar keyboards are built of these instead of aiogram models"
+    text: str
+    callback_data: str
+
+
+class Keyboard:
+    """Immutable inline keyboard of Button rows
+
+    It's converted to aiogram InlineKeyboardMarkup or serialized to JSON only at the boundary, both are built once
+    and memoized, so a cached keyboard is converted once however many times it's shown.
+    Memoized markup is shared, markups returned to library users are copies (see `markup_copy`).
+    `options` are extra InlineKeyboardMarkup fields (e.g. row_width).
+    """
+
+    __slots__ = ("rows", "options", "_markup", "_json")
+
+    def __init__(self, rows: Sequence[Sequence[Button]], **options: Any) -> None:
+        self.rows: Tuple[Tuple[Button, ...], ...] = tuple(tuple(row) for row in rows)
+        self.options = options
+        self._markup: Optional[InlineKeyboardMarkup] = None
+        self._json: Optional[str] = None
+
+    @classmethod
+    def from_markup(cls, markup: InlineKeyboardMarkup) -> "Keyboard":
+        """Builds keyboard from aiogram markup, e.g. the one message was received with"""
+        return cls(
+            [[Button(button.text, button.callback_data) for button in row] for row in markup.inline_keyboard],
+            **(markup.model_extra or {})
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "Keyboard":
+        """Builds keyboard from JSON produced by to_json, which is kept as its memoized JSON"""
+        fields = json.loads(data)
+        rows = fields.pop("inline_keyboard")
+        keyboard = cls([[Button(button["text"], button["callback_data"]) for button in row] for row in rows], **fields)
+        keyboard._json = data
+        return keyboard
+
+    def replace_rows(self, rows: Dict[int, Sequence[Button]]) -> "Keyboard":
+        """Returns copy of keyboard with rows at specified indexes replaced, other rows are shared"""
+        new_rows = list(self.rows)
+        for index, row in rows.items():
+            new_rows[index] = tuple(row)
+        return Keyboard(new_rows, **self.options)
+
+    def markup(self) -> InlineKeyboardMarkup:
+        """Returns aiogram markup of keyboard, built on first call"""
+        if self._markup is None:
+            self._markup = InlineKeyboardMarkup(
+                inline_keyboard=[
+                    [InlineKeyboardButton(text=button.text, callback_data=button.callback_data) for button in row]
+                    for row in self.rows
+                ],
+                **self.options
+            )
+        return self._markup
+
+    def markup_copy(self) -> InlineKeyboardMarkup:
+        """Returns copy of markup the caller may modify, memoized one is shared with everyone using the keyboard"""
+        markup = self.markup()
+        return markup.model_copy(update={
+            "inline_keyboard": [[button.model_copy() for button in row] for row in markup.inline_keyboard]
+        })
+
+    def to_json(self) -> str:
+        """Returns keyboard serialized to JSON Telegram expects as reply_markup, built on first call"""
+        if self._json is None:
+            self._json = json.dumps({
+                "inline_keyboard": [
+                    [{"text": button.text, "callback_data": button.callback_data} for button in row]
+                    for row in self.rows
+                ],
+                **self.options
+            })
+        return self._json
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Keyboard):
+            return NotImplemented
+        return self.rows == other.rows and self.options == other.options
+
+    def __hash__(self) -> int:
+        return hash(self.rows)
+
+    def __repr__(self) -> str:
+        return f"Keyboard(rows={self.rows!r})"
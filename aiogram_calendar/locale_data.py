@@ -0,0 +1,1413 @@
+# Generated by tools/build_locale_table.py from Babel 2.18.0 CLDR data, do not edit
+# (days, months) abbreviated names, shared by locales with identical names
+LABEL_SETS = (
+    (('Etl', 'Tal', 'Arb', 'Kam', 'Gum', 'Sab', 'Aca'), ('Qun', 'Nah', 'Cig', 'Agd', 'Cax', 'Qas', 'Qad', 'Leq', 'Way', 'Dit', 'Xim', 'Kax')),
+    (('Ашә', 'Аҩ', 'Ах', 'Аԥ', 'Ахә', 'Ас', 'Ам'), ('Ажь', 'Жəаб', 'Хəажә', 'Мш', 'Лаҵ', 'Рашә', 'Ԥхынгә', 'Нанҳә', 'Цəыб', 'Жьҭ', 'Абҵ', 'Ԥхынҷ')),
+    (('Ma.', 'Di.', 'Wo.', 'Do.', 'Vr.', 'Sa.', 'So.'), ('Jan.', 'Feb.', 'Mrt.', 'Apr.', 'Mei', 'Jun.', 'Jul.', 'Aug.', 'Sep.', 'Okt.', 'Nov.', 'Des.')),
+    (('kpa', 'ghɔ', 'tɔm', 'ume', 'ghɨ', 'dzk', 'nts'), ('nùm', 'kɨz', 'tɨd', 'taa', 'see', 'nzu', 'dum', 'fɔe', 'dzu', 'lɔm', 'kaa', 'fwo')),
+    (('Dwo', 'Ben', 'Wuk', 'Yaw', 'Fia', 'Mem', 'Kwe'), ('Ɔpɛpɔn', 'Ɔgyefoɔ', 'Ɔbɛnem', 'Oforisuo', 'Kɔtɔnimma', 'Ayɛwohomumu', 'Kutawonsa', 'Ɔsanaa', 'Ɛbɔ', 'Ahinime', 'Obubuo', 'Ɔpɛnimma')),
+    (('ሰኞ', 'ማክሰ', 'ረቡዕ', 'ሐሙስ', 'ዓርብ', 'ቅዳሜ', 'እሑድ'), ('ጃን', 'ፌብ', 'ማርች', 'ኤፕሪ', 'ሜይ', 'ጁን', 'ጁላይ', 'ኦገስ', 'ሴፕቴ', 'ኦክቶ', 'ኖቬም', 'ዲሴም')),
+    (('lun', 'mar', 'mie', 'chu', 'vie', 'sab', 'dom'), ('chi.', 'feb.', 'mar.', 'abr.', 'may.', 'chn.', 'chl.', 'ago.', 'set.', 'oct.', 'nov.', 'avi.')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('M01', 'M02', 'M03', 'M04', 'M05', 'M06', 'M07', 'M08', 'M09', 'M10', 'M11', 'M12')),
+    (('التنين', 'التلاتا', 'الأربعا', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('كانون التاني', 'شباط', 'أذار', 'نيسان', 'أيار', 'حزيران', 'تموز', 'آب', 'أيلول', 'تشرين الأول', 'تشرين التاني', 'كانون الأول')),
+    (('الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو', 'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر')),
+    (('الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('جانفي', 'فيفري', 'مارس', 'أفريل', 'ماي', 'جوان', 'جويلية', 'أوت', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر')),
+    (('الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('كانون الثاني', 'شباط', 'آذار', 'نيسان', 'أيار', 'حزيران', 'تموز', 'آب', 'أيلول', 'تشرين الأول', 'تشرين الثاني', 'كانون الأول')),
+    (('الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('يناير', 'فبراير', 'مارس', 'أبريل', 'ماي', 'يونيو', 'يوليوز', 'غشت', 'شتنبر', 'أكتوبر', 'نونبر', 'دجنبر')),
+    (('الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد'), ('يناير', 'فبراير', 'مارس', 'إبريل', 'مايو', 'يونيو', 'يوليو', 'أغشت', 'شتمبر', 'أكتوبر', 'نوفمبر', 'دجمبر')),
+    (('সোম', 'মঙ্গল', 'বুধ', 'বৃহ', 'শুক্ৰ', 'শনি', 'দেও'), ('জানু', 'ফেব্ৰু', 'মাৰ্চ', 'এপ্ৰিল', 'মে’', 'জুন', 'জুলাই', 'আগ', 'ছেপ্তে', 'অক্টো', 'নৱে', 'ডিচে')),
+    (('Jtt', 'Jnn', 'Jtn', 'Alh', 'Ijm', 'Jmo', 'Jpi'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Dec')),
+    (('llu', 'mar', 'mié', 'xue', 'vie', 'sáb', 'dom'), ('Xin', 'Feb', 'Mar', 'Abr', 'May', 'Xun', 'Xnt', 'Ago', 'Set', 'Och', 'Pay', 'Avi')),
+    (('B.e.', 'Ç.a.', 'Ç.', 'C.a.', 'C.', 'Ş.', 'B.'), ('yan', 'fev', 'mar', 'apr', 'may', 'iyn', 'iyl', 'avq', 'sen', 'okt', 'noy', 'dek')),
+    (('Б.Е.', 'Ч.А.', 'Ч.', 'Ҹ.А.', 'Ҹ.', 'Ш.', 'Б.'), ('јан', 'фев', 'мар', 'апр', 'май', 'ијн', 'ијл', 'авг', 'сен', 'окт', 'ној', 'дек')),
+    (('دو', 'سئے', 'چار', 'پنچ', 'جمه', 'شم', 'یک'), ('جن', 'پر', 'مار', 'اپر', 'مئیی', 'جون', 'جۆل', 'اگست', 'ستم', 'اکت', 'نئوم', 'دسم')),
+    (('Do', 'Say', 'Chá', 'Pan', 'Jom', 'Sha', 'Yak'), ('Jan', 'Par', 'Már', 'Apr', 'Mai', 'Jun', 'Jól', 'Aga', 'Sat', 'Akt', 'Naw', 'Das')),
+    (('nja', 'uum', 'ŋge', 'mbɔ', 'kɔɔ', 'jon', 'nɔy'), ('kɔn', 'mac', 'mat', 'mto', 'mpu', 'hil', 'nje', 'hik', 'dip', 'bio', 'may', 'liɓ')),
+    (('пн', 'аў', 'ср', 'чц', 'пт', 'сб', 'нд'), ('сту', 'лют', 'сак', 'кра', 'май', 'чэр', 'ліп', 'жні', 'вер', 'кас', 'ліс', 'сне')),
+    (('пан', 'аўт', 'сер', 'чац', 'пят', 'суб', 'няд'), ('сту', 'лют', 'сак', 'кра', 'тра', 'чэр', 'ліп', 'жні', 'вер', 'кас', 'ліс', 'сьн')),
+    (('Palichimo', 'Palichibuli', 'Palichitatu', 'Palichine', 'Palichisano', 'Pachibelushi', 'Pa Mulungu'), ('Jan', 'Feb', 'Mac', 'Epr', 'Mei', 'Jun', 'Jul', 'Oga', 'Sep', 'Okt', 'Nov', 'Dis')),
+    (('Sen', 'Sel', 'Reb', 'Kem', 'Jum', 'Sap', 'Min'), ('Jan', 'Pèb', 'Mar', 'Apr', 'Méi', 'Jun', 'Jul', 'Ags', 'Sèp', 'Okt', 'Nop', 'Dés')),
+    (('Vil', 'Hiv', 'Hid', 'Hit', 'Hih', 'Lem', 'Mul'), ('Hut', 'Vil', 'Dat', 'Tai', 'Han', 'Sit', 'Sab', 'Nan', 'Tis', 'Kum', 'Kmj', 'Kmb')),
+    (('пн', 'вт', 'ср', 'чт', 'пт', 'сб', 'нд'), ('яну', 'фев', 'март', 'апр', 'май', 'юни', 'юли', 'авг', 'сеп', 'окт', 'ное', 'дек')),
+    (('सोमवार', 'मंगलवार', 'बुधवार', 'बृहस्पतवार', 'शुक्रवार', 'शनिवार', 'ऐतवार'), ('जनवरी', 'फरवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई', 'अगस्त', 'सितम्बर', 'अक्टूबर', 'नवम्बर', 'दिसंबर')),
+    (('सोमबार', 'मंगलबार', 'बुधबार', 'बृहस्पतिबार', 'शुक्रबार', 'सनीचर', 'रबीबार'), ('जनवरी', 'फरवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई', 'अगस्त', 'सितम्बर', 'अक्टूबर', 'नवंबर', 'दिसंबर')),
+    (('aɖɩt', 'atal', 'alar', 'alam', 'arɩs', 'asib', 'alah'), ('kaw', 'kpa', 'ci', 'ɖʊ', 'ɖu5', 'ɖu6', 'la', 'kǝu', 'fʊm', 'cim', 'pom', 'bʊn')),
+    (('ntɛ', 'tar', 'ara', 'ala', 'jum', 'sib', 'kar'), ('zan', 'feb', 'mar', 'awi', 'mɛ', 'zuw', 'zul', 'uti', 'sɛt', 'ɔku', 'now', 'des')),
+    (('সোম', 'মঙ্গল', 'বুধ', 'বৃহস্পতি', 'শুক্র', 'শনি', 'রবি'), ('জানু', 'ফেব', 'মার্চ', 'এপ্রিল', 'মে', 'জুন', 'জুলাই', 'আগস্ট', 'সেপ্টেম্বর', 'অক্টোবর', 'নভেম্বর', 'ডিসেম্বর')),
+    (('সোম', 'মঙ্গল', 'বুধ', 'বৃহস্পতি', 'শুক্র', 'শনি', 'রবি'), ('জানু', 'ফেব', 'মার্চ', 'এপ্রিল', 'মে', 'জুন', 'জুলাই', 'আগস্ট', 'সেপ্টেঃ', 'অক্টোঃ', 'নভেঃ', 'ডিসেঃ')),
+    (('ཟླ་བ་', 'མིག་དམར་', 'ལྷག་པ་', 'ཕུར་བུ་', 'པ་སངས་', 'སྤེན་པ་', 'ཉི་མ་'), ('ཟླ་༡', 'ཟླ་༢', 'ཟླ་༣', 'ཟླ་༤', 'ཟླ་༥', 'ཟླ་༦', 'ཟླ་༧', 'ཟླ་༨', 'ཟླ་༩', 'ཟླ་༡༠', 'ཟླ་༡༡', 'ཟླ་༡༢')),
+    (('Lun', 'Meu.', 'Mer.', 'Yaou', 'Gwe.', 'Sad.', 'Sul'), ('Gen.', 'Cʼhwe.', 'Meur.', 'Ebr.', 'Mae', 'Mezh.', 'Goue.', 'Eost', 'Gwen.', 'Here', 'Du', 'Kzu.')),
+    (('सम', 'मंगल', 'बुध', 'बिस्थि', 'सुखुर', 'सनि', 'रबि'), ('जान', 'फेब', 'मार्च', 'एप्रि', 'मे', 'जुन', 'जुल', 'आग', 'सेप', 'अक्ट’', 'नवे', 'डिसे')),
+    (('pon', 'uto', 'sri', 'čet', 'pet', 'sub', 'ned'), ('jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sep', 'okt', 'nov', 'dec')),
+    (('пон', 'уто', 'сри', 'чет', 'пет', 'суб', 'нед'), ('јан', 'феб', 'мар', 'апр', 'мај', 'јун', 'јул', 'ауг', 'сеп', 'окт', 'нов', 'дец')),
+    (('ሰኑ', 'ሰሊጝ', 'ለጓ', 'ኣምድ', 'ኣርብ', 'ሰ/ሽ', 'ሰ/ቅ'), ('ልደት', 'ካብኽ', 'ክብላ', 'ፋጅኺ', 'ክቢቅ', 'ም/ት', 'ኰር', 'ማርያ', 'ያኸኒ', 'መተሉ', 'ም/ም', 'ተሕሳ')),
+    (('dl.', 'dt.', 'dc.', 'dj.', 'dv.', 'ds.', 'dg.'), ('gen.', 'febr.', 'març', 'abr.', 'maig', 'juny', 'jul.', 'ag.', 'set.', 'oct.', 'nov.', 'des.')),
+    (('Wísts’i hayashuh', 'Bít hayashuh', 'Dahó hayashuh', 'Hiwí hayashuh', 'Dissik’an hayashuh', 'Inikuˀtiˀtiˀ', 'Inikuˀ'), ('Cháykáhday Haˀimay', 'Tsahkápbiˀ', 'Wánit', 'Háshnihtiˀtiˀ', 'Háshnih Haˀimay', 'Háshnihtsiˀ', 'Násˀahˀatsus', 'Dahósikah nish', 'Híisikah nish', 'Nípbaatiˀtiˀ', 'Nípbaa Haˀimay', 'Cháykáhdaytiˀtiˀ')),
+    (('Tung', 'Gitung', 'Tsan', 'Nas', 'Nat', 'Chir', 'Yok'), ('Dyon', 'Baa', 'Atat', 'Anas', 'Atyo', 'Achi', 'Atar', 'Awur', 'Shad', 'Shak', 'Naba', 'Nata')),
+    (('𑄥𑄧𑄟𑄴', '𑄟𑄧𑄁𑄉𑄧𑄣𑄴', '𑄝𑄪𑄖𑄴', '𑄝𑄳𑄢𑄨𑄥𑄪𑄛𑄴', '𑄥𑄪𑄇𑄴𑄇𑄮𑄢𑄴', '𑄥𑄧𑄚𑄨', '𑄢𑄧𑄝𑄨'), ('𑄎𑄚𑄪𑄠𑄢𑄨', '𑄜𑄬𑄛𑄴𑄝𑄳𑄢𑄪𑄠𑄢𑄨', '𑄟𑄢𑄴𑄌𑄧', '𑄃𑄬𑄛𑄳𑄢𑄨𑄣𑄴', '𑄟𑄬', '𑄎𑄪𑄚𑄴', '𑄎𑄪𑄣𑄭', '𑄃𑄉𑄧𑄌𑄴𑄑𑄴', '𑄥𑄬𑄛𑄴𑄑𑄬𑄟𑄴𑄝𑄧𑄢𑄴', '𑄃𑄧𑄇𑄴𑄑𑄮𑄝𑄧𑄢𑄴', '𑄚𑄧𑄞𑄬𑄟𑄴𑄝𑄧𑄢𑄴', '𑄓𑄨𑄥𑄬𑄟𑄴𑄝𑄧𑄢𑄴')),
+    (('ор', 'ши', 'кха', 'еа', 'пӀе', 'шуо', 'кӀи'), ('янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен', 'окт', 'ноя', 'дек')),
+    (('Lun', 'Mar', 'Miy', 'Huw', 'Biy', 'Sab', 'Dom'), ('Ene', 'Peb', 'Mar', 'Abr', 'May', 'Hun', 'Hul', 'Ago', 'Sep', 'Okt', 'Nob', 'Dis')),
+    (('ORK', 'OKB', 'OKS', 'OKN', 'OKT', 'OMK', 'SAN'), ('KBZ', 'KBR', 'KST', 'KKN', 'KTN', 'KMK', 'KMS', 'KMN', 'KMW', 'KKM', 'KNK', 'KNB')),
+    (('ᏉᏅᎯ', 'ᏔᎵᏁ', 'ᏦᎢᏁ', 'ᏅᎩᏁ', 'ᏧᎾᎩ', 'ᏈᏕᎾ', 'ᏆᏍᎬ'), ('ᎤᏃ', 'ᎧᎦ', 'ᎠᏅ', 'ᎧᏬ', 'ᎠᏂ', 'ᏕᎭ', 'ᎫᏰ', 'ᎦᎶ', 'ᏚᎵ', 'ᏚᏂ', 'ᏅᏓ', 'ᎥᏍ')),
+    (('Mantiʼ', 'Chostiʼ', 'Winstiʼ', 'Soistiʼ', 'Nannalhchifaʼ Nittak', 'Nittak Holloʼ Nakfish', 'Nittak Holloʼ'), ('Hashiʼ Ammoʼnaʼ', 'Hashiʼ Atokloʼ', 'Hashiʼ Atochchíʼnaʼ', 'Iiplal', 'Mih', 'Choon', 'Choola', 'Akaas', 'Siptimpaʼ', 'Aaktopaʼ', 'Nofimpaʼ', 'Tiisimpaʼ')),
+    (('دووشەممە', 'سێشەممە', 'چوارشەممە', 'پێنجشەممە', 'ھەینی', 'شەممە', 'یەکشەممە'), ('کانوونی دووەم', 'شوبات', 'ئازار', 'نیسان', 'ئایار', 'حوزەیران', 'تەمووز', 'ئاب', 'ئەیلوول', 'تشرینی یەکەم', 'تشرینی دووەم', 'کانونی یەکەم')),
+    (('lun.', 'mar.', 'mer.', 'ghj.', 'ven.', 'sab.', 'dum.'), ('ghj.', 'fer.', 'mar.', 'apr.', 'mag.', 'ghju.', 'lug.', 'aos.', 'sit.', 'ott.', 'nuv.', 'dic.')),
+    (('po', 'út', 'st', 'čt', 'pá', 'so', 'ne'), ('led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp', 'zář', 'říj', 'lis', 'pro')),
+    (('ᐴᓂ\xa0ᐊᔭᒥᐦᐁᑮᓯᑳᐤ', 'ᓃᓱᑮᓯᑳᐤ', 'ᐋᐱᐦᑕᐘᐣ', 'ᐴᓂᐋᐱᐦᑕᐘᐣ', 'ᑫᑳᐨ ᒫᑎᓇᐍᑮᓯᑳᐤ', 'ᒫᑎᓇᐍᑮᓯᑳᐤ', 'ᐊᔭᒥᐦᐁᑮᓯᑳᐤ'), ('ᐅᒉᒥᑮᓯᑳᐏᐲᓯᒼ', 'ᐸᐚᐦᒐᑭᓇᓰᐢ', 'ᒥᑭᓯᐏᐲᓯᒼ', 'ᓂᐢᑭᐲᓯᒼ', 'ᐊᓃᑭᐲᓯᒼ', 'ᐚᐏᐲᓯᒼ', 'ᐹᐢᑲᐦᐋᐏᐲᓯᒼ', 'ᐅᐸᐦᐅᐏᐲᓯᒼ', 'ᓄᒌᑐᐏᐲᓯᒼ', 'ᐱᓈᐢᑯᐏᐲᓯᒼ', 'ᐋᕽᐘᑎᓄᐏᐲᓯᒼ', 'ᒪᑯᓭᑮᓭᑳᐏᐲᓯᒼ')),
+    (('пнⷣе', 'втоⷬ҇', 'срⷣе', 'чеⷦ҇', 'пѧⷦ҇', 'сꙋⷠ҇', 'ндⷧ҇ѧ'), ('і҆аⷩ҇', 'феⷡ҇', 'маⷬ҇', 'а҆пⷬ҇', 'маꙵ', 'і҆ꙋⷩ҇', 'і҆ꙋⷧ҇', 'а҆́ѵⷢ҇', 'сеⷫ҇', 'ѻ҆кⷮ', 'ноеⷨ', 'деⷦ҇')),
+    (('тун.', 'ытл.', 'юн.', 'кӗҫ.', 'эр.', 'шӑм.', 'выр.'), ('кӑр.', 'нар.', 'пуш', 'ака', 'ҫу', 'ҫӗр.', 'утӑ', 'ҫур.', 'авӑн', 'юпа', 'чӳк', 'раш.')),
+    (('Llun', 'Maw', 'Mer', 'Iau', 'Gwen', 'Sad', 'Sul'), ('Ion', 'Chw', 'Maw', 'Ebr', 'Mai', 'Meh', 'Gor', 'Awst', 'Medi', 'Hyd', 'Tach', 'Rhag')),
+    (('man.', 'tirs.', 'ons.', 'tors.', 'fre.', 'lør.', 'søn.'), ('jan.', 'feb.', 'mar.', 'apr.', 'maj', 'jun.', 'jul.', 'aug.', 'sep.', 'okt.', 'nov.', 'dec.')),
+    (('Jim', 'Kaw', 'Kad', 'Kan', 'Kas', 'Ngu', 'Jum'), ('Imb', 'Kaw', 'Kad', 'Kan', 'Kas', 'Kar', 'Mfu', 'Wun', 'Ike', 'Iku', 'Imw', 'Iwi')),
+    (('Mo.', 'Di.', 'Mi.', 'Do.', 'Fr.', 'Sa.', 'So.'), ('Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez')),
+    (('Mo.', 'Di.', 'Mi.', 'Do.', 'Fr.', 'Sa.', 'So.'), ('Jän', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez')),
+    (('Ati', 'Ata', 'Ala', 'Alm', 'Alz', 'Asi', 'Alh'), ('Žan', 'Fee', 'Mar', 'Awi', 'Me', 'Žuw', 'Žuy', 'Ut', 'Sek', 'Okt', 'Noo', 'Dee')),
+    (('सोम', 'मंगल', 'बुध', 'बीर', 'शुक्र', 'शनि', 'ऐत'), ('जन.', 'फर.', 'मार्च', 'अप्रैल', 'मेई', 'जून', 'जुलाई', 'अग.', 'सित.', 'अक्तू.', 'नव.', 'दिस.')),
+    (('pón', 'wał', 'srj', 'stw', 'pět', 'sob', 'nje'), ('jan', 'feb', 'měr', 'apr', 'maj', 'jun', 'jul', 'awg', 'sep', 'okt', 'now', 'dec')),
+    (('mɔ́s', 'kwa', 'muk', 'ŋgi', 'ɗón', 'esa', 'ét'), ('di', 'ŋgɔn', 'sɔŋ', 'diɓ', 'emi', 'esɔ', 'mad', 'diŋ', 'nyɛt', 'may', 'tin', 'elá')),
+    (('Ten', 'Tal', 'Ala', 'Ara', 'Arj', 'Sib', 'Dim'), ('Sa', 'Fe', 'Ma', 'Ab', 'Me', 'Su', 'Sú', 'Ut', 'Se', 'Ok', 'No', 'De')),
+    (('མིར་', 'ལྷག་', 'ཕུར་', 'སངས་', 'སྤེན་', 'ཉི་', 'ཟླ་'), ('ཟླ་༡', 'ཟླ་༢', 'ཟླ་༣', 'ཟླ་༤', 'ཟླ་༥', 'ཟླ་༦', 'ཟླ་༧', 'ཟླ་༨', 'ཟླ་༩', 'ཟླ་༡༠', 'ཟླ་༡༡', 'ཟླ་༡༢')),
+    (('Tat', 'Ine', 'Tan', 'Arm', 'Maa', 'NMM', 'Kma'), ('Mbe', 'Kai', 'Kat', 'Kan', 'Gat', 'Gan', 'Mug', 'Knn', 'Ken', 'Iku', 'Imw', 'Igi')),
+    (('dzo', 'bla', 'kuɖ', 'yaw', 'fiɖ', 'mem', 'kɔs'), ('dzv', 'dzd', 'ted', 'afɔ', 'dam', 'mas', 'sia', 'dea', 'any', 'kel', 'ade', 'dzm')),
+    (('Δευ', 'Τρί', 'Τετ', 'Πέμ', 'Παρ', 'Σάβ', 'Κυρ'), ('Ιαν', 'Φεβ', 'Μάρ', 'Απρ', 'Μάι', 'Ιούν', 'Ιούλ', 'Αύγ', 'Σεπ', 'Οκτ', 'Νοέ', 'Δεκ')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'June', 'July', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec')),
+    (('𐐣𐐲𐑌', '𐐓𐐭𐑆', '𐐎𐐯𐑌', '𐐛𐐲𐑉', '𐐙𐑉𐐴', '𐐝𐐰𐐻', '𐐝𐐲𐑌'), ('𐐖𐐰𐑌', '𐐙𐐯𐐺', '𐐣𐐪𐑉', '𐐁𐐹𐑉', '𐐣𐐩', '𐐖𐐭𐑌', '𐐖𐐭𐑊', '𐐂𐑀', '𐐝𐐯𐐹', '𐐉𐐿𐐻', '𐐤𐐬𐑂', '𐐔𐐨𐑅')),
+    (('·𐑥𐑭', '·𐑑𐑵', '·𐑢𐑧', '·𐑔𐑻', '·𐑓𐑮', '·𐑕𐑨', '·𐑕𐑭'), ('·𐑡𐑨', '·𐑓𐑧', '·𐑥𐑸', '·𐑱𐑐', '·𐑥𐑱', '·𐑡𐑵', '·𐑡𐑫', '·𐑪𐑜', '·𐑕𐑧', '·𐑷𐑒', '·𐑯𐑴', '·𐑛𐑭')),
+    (('lu', 'ma', 'me', 'ĵa', 've', 'sa', 'di'), ('Jan', 'Feb', 'Mar', 'Apr', 'Maj', 'Jun', 'Jul', 'Aŭg', 'Sep', 'Okt', 'Nov', 'Dec')),
+    (('lun', 'mar', 'mié', 'jue', 'vie', 'sáb', 'dom'), ('ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sept', 'oct', 'nov', 'dic')),
+    (('lun', 'mar', 'mié', 'jue', 'vie', 'sáb', 'dom'), ('ene.', 'feb.', 'mar.', 'abr.', 'may.', 'jun.', 'jul.', 'ago.', 'sept.', 'oct.', 'nov.', 'dic.')),
+    (('lun', 'mar', 'mié', 'jue', 'vie', 'sáb', 'dom'), ('ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sep', 'oct', 'nov', 'dic')),
+    (('lun', 'mar', 'mié', 'jue', 'vie', 'sáb', 'dom'), ('Ene.', 'Feb.', 'Mar.', 'Abr.', 'May.', 'Jun.', 'Jul.', 'Ago.', 'Set.', 'Oct.', 'Nov.', 'Dic.')),
+    (('E', 'T', 'K', 'N', 'R', 'L', 'P'), ('jaan', 'veebr', 'märts', 'apr', 'mai', 'juuni', 'juuli', 'aug', 'sept', 'okt', 'nov', 'dets')),
+    (('al.', 'ar.', 'az.', 'og.', 'or.', 'lr.', 'ig.'), ('urt.', 'ots.', 'mar.', 'api.', 'mai.', 'eka.', 'uzt.', 'abu.', 'ira.', 'urr.', 'aza.', 'abe.')),
+    (('mɔ́n', 'smb', 'sml', 'smn', 'fúl', 'sér', 'sɔ́n'), ('ngo', 'ngb', 'ngl', 'ngn', 'ngt', 'ngs', 'ngz', 'ngm', 'nge', 'nga', 'ngad', 'ngab')),
+    (('دوشنبه', 'سه\u200cشنبه', 'چهارشنبه', 'پنجشنبه', 'جمعه', 'شنبه', 'یکشنبه'), ('ژانویه', 'فوریه', 'مارس', 'آوریل', 'مه', 'ژوئن', 'ژوئیه', 'اوت', 'سپتامبر', 'اکتبر', 'نوامبر', 'دسامبر')),
+    (('دوشنبه', 'سه\u200cشنبه', 'چهارشنبه', 'پنجشنبه', 'جمعه', 'شنبه', 'یکشنبه'), ('جنوری', 'فبروری', 'مارچ', 'اپریل', 'می', 'جون', 'جولای', 'اگست', 'سپتمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('aaɓ', 'maw', 'nje', 'naa', 'mwd', 'hbi', 'dew'), ('sii', 'col', 'mbo', 'see', 'duu', 'kor', 'mor', 'juk', 'slt', 'yar', 'jol', 'bow')),
+    (('𞤀𞥄𞤩𞤵', '𞤃𞤢𞤦', '𞤔𞤫𞤧', '𞤐𞤢𞥄𞤧', '𞤃𞤢𞤣', '𞤖𞤮𞤪', '𞤈𞤫𞤬'), ('𞤅𞤭𞥅𞤤', '𞤕𞤮𞤤', '𞤐𞤦𞤮𞥅𞤴', '𞤅𞤫𞥅𞤼', '𞤁𞤵𞥅𞤶', '𞤑𞤮𞤪', '𞤃𞤮𞤪', '𞤔𞤵𞤳', '𞤅𞤭𞤤', '𞤒𞤢𞤪', '𞤔𞤮𞤤', '𞤄𞤮𞤱')),
+    (('ma', 'ti', 'ke', 'to', 'pe', 'la', 'su'), ('tammi', 'helmi', 'maalis', 'huhti', 'touko', 'kesä', 'heinä', 'elo', 'syys', 'loka', 'marras', 'joulu')),
+    (('Lun', 'Mar', 'Miy', 'Huw', 'Biy', 'Sab', 'Lin'), ('Ene', 'Peb', 'Mar', 'Abr', 'May', 'Hun', 'Hul', 'Ago', 'Set', 'Okt', 'Nob', 'Dis')),
+    (('mán.', 'týs.', 'mik.', 'hós.', 'frí.', 'ley.', 'sun.'), ('jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep', 'okt', 'nov', 'des')),
+    (('lun.', 'mar.', 'mer.', 'jeu.', 'ven.', 'sam.', 'dim.'), ('janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.', 'août', 'sept.', 'oct.', 'nov.', 'déc.')),
+    (('lun.', 'mar.', 'mer.', 'jeu.', 'ven.', 'sam.', 'dim.'), ('janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juill.', 'août', 'sept.', 'oct.', 'nov.', 'déc.')),
+    (('lun.', 'mar.', 'mer.', 'jeu.', 'ven.', 'sam.', 'dim.'), ('jan.', 'fév.', 'mar.', 'avr.', 'mai', 'jui.', 'juil.', 'août', 'sept.', 'oct.', 'nov.', 'déc.')),
+    (('Mun', 'Tei', 'Wed', 'Tür', 'Fre', 'San', 'Sön'), ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jün', 'Jül', 'Aug', 'Sep', 'Okt', 'Nof', 'Det')),
+    (('lun', 'mar', 'mie', 'joi', 'vin', 'sab', 'dom'), ('Zen', 'Fev', 'Mar', 'Avr', 'Mai', 'Jug', 'Lui', 'Avo', 'Set', 'Otu', 'Nov', 'Dic')),
+    (('mo', 'ti', 'wo', 'to', 'fr', 'so', 'si'), ('Jan', 'Feb', 'Mrt', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('Luan', 'Máirt', 'Céad', 'Déar', 'Aoine', 'Sath', 'Domh'), ('Ean', 'Feabh', 'Márta', 'Aib', 'Beal', 'Meith', 'Iúil', 'Lún', 'MFómh', 'DFómh', 'Samh', 'Noll')),
+    (('Ju', 'Juf', 'Shɔ', 'Soo', 'Soh', 'Hɔɔ', 'Hɔg'), ('Aha', 'Ofl', 'Ots', 'Abe', 'Agb', 'Otu', 'Maa', 'Man', 'Gbo', 'Ant', 'Ale', 'Afu')),
+    (('DiL', 'DiM', 'DiC', 'Dia', 'Dih', 'DiS', 'DiD'), ('Faoi', 'Gearr', 'Màrt', 'Gibl', 'Cèit', 'Ògmh', 'Iuch', 'Lùna', 'Sult', 'Dàmh', 'Samh', 'Dùbh')),
+    (('ሰኑይ', 'ሠሉስ', 'ራብዕ', 'ሐሙስ', 'ዓርበ', 'ቀዳሚት', 'እኁድ'), ('ጠሐረ', 'ከተተ', 'መገበ', 'አኀዘ', 'ግንባት', 'ሠንየ', 'ሐመለ', 'ነሐሰ', 'ከረመ', 'ጠቀመ', 'ኀደረ', 'ኀሠሠ')),
+    (('luns', 'mar.', 'mér.', 'xov.', 'ven.', 'sáb.', 'dom.'), ('xan.', 'feb.', 'mar.', 'abr.', 'maio', 'xuño', 'xul.', 'ago.', 'set.', 'out.', 'nov.', 'dec.')),
+    (('Arakõi', 'Araapy', 'Ararundy', 'Arapo', 'Arapoteĩ', 'Arapokõi', 'Arateĩ'), ('Jasyteĩ', 'Jasykõi', 'Jasyapy', 'Jasyrundy', 'Jasypo', 'Jasypoteĩ', 'Jasypokõi', 'Jasypoapy', 'Jasyporundy', 'Jasypa', 'Jasypateĩ', 'Jasypakõi')),
+    (('Mä.', 'Zi.', 'Mi.', 'Du.', 'Fr.', 'Sa.', 'Su.'), ('Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez')),
+    (('સોમ', 'મંગળ', 'બુધ', 'ગુરુ', 'શુક્ર', 'શનિ', 'રવિ'), ('જાન્યુ', 'ફેબ્રુ', 'માર્ચ', 'એપ્રિલ', 'મે', 'જૂન', 'જુલાઈ', 'ઑગસ્ટ', 'સપ્ટે', 'ઑક્ટો', 'નવે', 'ડિસે')),
+    (('Ctt', 'Cmn', 'Cmt', 'Ars', 'Icm', 'Est', 'Cpr'), ('Can', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Cul', 'Agt', 'Sep', 'Okt', 'Nob', 'Dis')),
+    (('Jel', 'Jem', 'Jerc', 'Jerd', 'Jeh', 'Jes', 'Jed'), ('J-guer', 'T-arree', 'Mayrnt', 'Avrril', 'Boaldyn', 'M-souree', 'J-souree', 'Luanistyn', 'M-fouyir', 'J-fouyir', 'M-Houney', 'M-Nollick')),
+    (('Lit', 'Tal', 'Lar', 'Alh', 'Jum', 'Asa', 'Lah'), ('Jan', 'Fab', 'Mar', 'Afi', 'May', 'Yun', 'Yul', 'Agu', 'Sat', 'Okt', 'Nuw', 'Dis')),
+    (('لِت', 'تَل', 'لَر', 'أَلْح', 'جُم', 'أَسَ', 'لَح'), ('جَن', 'ڢَب', 'مَر', 'أَڢْر', 'مَي', 'يُون', 'يُول', 'أَغُ', 'سَت', 'أُكْت', 'نُو', 'دِس')),
+    (('P1', 'P2', 'P3', 'P4', 'P5', 'P6', 'LP'), ('Ian.', 'Pep.', 'Mal.', 'ʻAp.', 'Mei', 'Iun.', 'Iul.', 'ʻAu.', 'Kep.', 'ʻOk.', 'Now.', 'Kek.')),
+    (('יום ב׳', 'יום ג׳', 'יום ד׳', 'יום ה׳', 'יום ו׳', 'שבת', 'יום א׳'), ('ינו׳', 'פבר׳', 'מרץ', 'אפר׳', 'מאי', 'יוני', 'יולי', 'אוג׳', 'ספט׳', 'אוק׳', 'נוב׳', 'דצמ׳')),
+    (('सोम', 'मंगल', 'बुध', 'गुरु', 'शुक्र', 'शनि', 'रवि'), ('जन॰', 'फ़र॰', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुल॰', 'अग॰', 'सित॰', 'अक्टू॰', 'नव॰', 'दिस॰')),
+    (('Som', 'Mangal', 'Budh', 'Guru', 'Shukra', 'Shani', 'Ravi'), ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('𞄆𞄬', '𞄛𞄨𞄱𞄄𞄤𞄲𞄨', '𞄒𞄫𞄰𞄒𞄪𞄱', '𞄤𞄨𞄱', '𞄀𞄪𞄴', '𞄛𞄤𞄱𞄞𞄤𞄦', '𞄔𞄩𞄴𞄆𞄨𞄰', '𞄕𞄩𞄲𞄔𞄄𞄰𞄤', '𞄛𞄤𞄱𞄒𞄤𞄰', '𞄪𞄱𞄀𞄤𞄴', '𞄚𞄦𞄲𞄤𞄚𞄄𞄰𞄫', '𞄒𞄩𞄱𞄔𞄬𞄴')),
+    (('pon', 'uto', 'sri', 'čet', 'pet', 'sub', 'ned'), ('sij', 'velj', 'ožu', 'tra', 'svi', 'lip', 'srp', 'kol', 'ruj', 'lis', 'stu', 'pro')),
+    (('pón', 'wut', 'srj', 'štw', 'pja', 'sob', 'nje'), ('jan', 'feb', 'měr', 'apr', 'mej', 'jun', 'jul', 'awg', 'sep', 'okt', 'now', 'dec')),
+    (('H', 'K', 'Sze', 'Cs', 'P', 'Szo', 'V'), ('jan.', 'febr.', 'márc.', 'ápr.', 'máj.', 'jún.', 'júl.', 'aug.', 'szept.', 'okt.', 'nov.', 'dec.')),
+    (('երկ', 'երք', 'չրք', 'հնգ', 'ուր', 'շբթ', 'կիր'), ('հնվ', 'փտվ', 'մրտ', 'ապր', 'մյս', 'հնս', 'հլս', 'օգս', 'սեպ', 'հոկ', 'նոյ', 'դեկ')),
+    (('lun', 'mar', 'mer', 'jov', 'ven', 'sab', 'dom'), ('jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')),
+    (('Sen', 'Sel', 'Rab', 'Kam', 'Jum', 'Sab', 'Min'), ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('lun.', 'mar.', 'mer.', 'jov.', 'ven.', 'sat.', 'sol.'), ('jan.', 'febr.', 'mar.', 'apr.', 'may', 'jun.', 'julí', 'aug.', 'sept.', 'oct.', 'nov.', 'dec.')),
+    (('Mọn', 'Tiu', 'Wen', 'Tọọ', 'Fraị', 'Sat', 'Sọn'), ('Jen', 'Feb', 'Maa', 'Epr', 'Mee', 'Juu', 'Jul', 'Ọgọ', 'Sep', 'Ọkt', 'Nov', 'Dis')),
+    (('ꆏꋍ', 'ꆏꑍ', 'ꆏꌕ', 'ꆏꇖ', 'ꆏꉬ', 'ꆏꃘ', 'ꑬꆏ'), ('ꋍꆪ', 'ꑍꆪ', 'ꌕꆪ', 'ꇖꆪ', 'ꉬꆪ', 'ꃘꆪ', 'ꏃꆪ', 'ꉆꆪ', 'ꈬꆪ', 'ꊰꆪ', 'ꊯꊪꆪ', 'ꊰꑋꆪ')),
+    (('mán.', 'þri.', 'mið.', 'fim.', 'fös.', 'lau.', 'sun.'), ('jan.', 'feb.', 'mar.', 'apr.', 'maí', 'jún.', 'júl.', 'ágú.', 'sep.', 'okt.', 'nóv.', 'des.')),
+    (('lun', 'mar', 'mer', 'gio', 'ven', 'sab', 'dom'), ('gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago', 'set', 'ott', 'nov', 'dic')),
+    (('ᓇᒡᒐᔾᔭᐅ', 'ᓇᒡᒐᔾᔭᐅᓕᖅᑭ', 'ᐱᖓᑦᓯᖅ', 'ᓯᑕᒻᒥᖅ', 'ᑕᓪᓕᒻᒥᐅᑦ', 'ᓈᑦᓰᖑᔭᓛᕐᓂᐊᖅ', 'ᓈᑦᑏᖑᔭᖅ'), ('ᔭᓐᓄᐊᓕ', 'ᕕᕝᕗᐊᓕ', 'ᒫᑦᓯ', 'ᐊᐃᑉᐳᓗ', 'ᒪᐃ', 'ᔫᓂ', 'ᔪᓚᐃ', 'ᐊᐅᒡᒍᓯ', 'ᓯᑎᐱᕆ', 'ᐆᑦᑑᕝᕙ', 'ᓄᕕᐱᕆ', 'ᑎᓯᐱᕆ')),
+    (('月', '火', '水', '木', '金', '土', '日'), ('1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月', '11月', '12月')),
+    (('Mɔ́ndi', 'Ápta Mɔ́ndi', 'Wɛ́nɛsɛdɛ', 'Tɔ́sɛdɛ', 'Fɛlâyɛdɛ', 'Sásidɛ', 'Sɔ́ndi'), ('Nduŋmbi Saŋ', 'Pɛsaŋ Pɛ́pá', 'Pɛsaŋ Pɛ́tát', 'Pɛsaŋ Pɛ́nɛ́kwa', 'Pɛsaŋ Pataa', 'Pɛsaŋ Pɛ́nɛ́ntúkú', 'Pɛsaŋ Saambá', 'Pɛsaŋ Pɛ́nɛ́fɔm', 'Pɛsaŋ Pɛ́nɛ́pfúꞋú', 'Pɛsaŋ Nɛgɛ́m', 'Pɛsaŋ Ntsɔ̌pmɔ́', 'Pɛsaŋ Ntsɔ̌ppá')),
+    (('Jtt', 'Jnn', 'Jtn', 'Alh', 'Iju', 'Jmo', 'Jpi'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('Sen', 'Sel', 'Rab', 'Kam', 'Jum', 'Sab', 'Ahad'), ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agt', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('ორშ', 'სამ', 'ოთხ', 'ხუთ', 'პარ', 'შაბ', 'კვი'), ('იან', 'თებ', 'მარ', 'აპრ', 'მაი', 'ივნ', 'ივლ', 'აგვ', 'სექ', 'ოქტ', 'ნოე', 'დეკ')),
+    (('Дүй', 'Сий', 'Сәр', 'Пий', 'Жум', 'Шем', 'Екш'), ('Янв', 'Фев', 'Мар', 'Апр', 'Май', 'Июн', 'Июл', 'Авг', 'Сен', 'Окт', 'Ноя', 'Дек')),
+    (('San', 'Kraḍ', 'Kuẓ', 'Sam', 'Sḍis', 'Say', 'Yan'), ('Yen', 'Fur', 'Meɣ', 'Yeb', 'May', 'Yun', 'Yul', 'Ɣuc', 'Cte', 'Tub', 'Wam', 'Duǧ')),
+    (('Lin', 'Tal', 'Lar', 'Lam', 'Jum', 'Asa', 'Lad'), ('A̱yr', 'A̱hw', 'A̱ta', 'A̱na', 'A̱pf', 'A̱ki', 'A̱ty', 'A̱ni', 'A̱ku', 'Swa', 'Sby', 'Sbh')),
+    (('Wkw', 'Wkl', 'Wtũ', 'Wkn', 'Wtn', 'Wth', 'Wky'), ('Mbe', 'Kel', 'Ktũ', 'Kan', 'Ktn', 'Tha', 'Moo', 'Nya', 'Knd', 'Ĩku', 'Ĩkm', 'Ĩkl')),
+    (('Tan', 'Tal', 'Lar', 'Lam', 'Jum', 'Asa', 'Lad'), ('Juw', 'Swi', 'Tsa', 'Nya', 'Tsw', 'Ata', 'Ana', 'Ari', 'Aku', 'Swa', 'Man', 'Mas')),
+    (('Ll3', 'Ll4', 'Ll5', 'Ll6', 'Ll7', 'Ll1', 'Ll2'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('sig', 'ter', 'kua', 'kin', 'ses', 'sab', 'dum'), ('Jan', 'Feb', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Otu', 'Nuv', 'Diz')),
+    (('pir.', 'rég.', 'tẽg.', 'vẽn.', 'pén.', 'sav.', 'num.'), ('1Ky.', '2Ky.', '3Ky.', '4Ky.', '5Ky.', '6Ky.', '7Ky.', '8Ky.', '9Ky.', '10Ky.', '11Ky.', '12Ky.')),
+    (('Ati', 'Ata', 'Ala', 'Alm', 'Alj', 'Ass', 'Alh'), ('Žan', 'Fee', 'Mar', 'Awi', 'Me', 'Žuw', 'Žuy', 'Ut', 'Sek', 'Okt', 'Noo', 'Dee')),
+    (('NTT', 'NMN', 'NMT', 'ART', 'NMA', 'NMM', 'KMA'), ('JEN', 'WKR', 'WGT', 'WKN', 'WTN', 'WTD', 'WMJ', 'WNN', 'WKD', 'WIK', 'WMW', 'DIT')),
+    (('дс', 'сс', 'ср', 'бс', 'жм', 'сб', 'жс'), ('қаң.', 'ақп.', 'нау.', 'сәу.', 'мам.', 'мау.', 'шіл.', 'там.', 'қыр.', 'қаз.', 'қар.', 'жел.')),
+    (('دۇي', 'سەي', 'سار', 'بەي', 'جۇم', 'سەن', 'جەك'), ('قاڭتار', 'اقپان', 'ناۋرىز', 'ءساۋىر', 'مامىر', 'ماۋسىم', 'شىلدە', 'تامىز', 'قىركۇيەك', 'قازان', 'قاراشا', 'جەلتوقسان')),
+    (('lundi', 'mardi', 'mɛrkɛrɛdi', 'yedi', 'vaŋdɛrɛdi', 'mɔnɔ sɔndi', 'sɔndi'), ('pamba', 'wanja', 'mbiyɔ mɛndoŋgɔ', 'Nyɔlɔmbɔŋgɔ', 'Mɔnɔ ŋgbanja', 'Nyaŋgwɛ ŋgbanja', 'kuŋgwɛ', 'fɛ', 'njapi', 'nyukul', 'M11', 'ɓulɓusɛ')),
+    (('ata', 'mar', 'pin', 'sis', 'tal', 'arf', 'sap'), ('jan', 'febr', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sept', 'okt', 'nov', 'dec')),
+    (('Kot', 'Koo', 'Kos', 'Koa', 'Kom', 'Kol', 'Kts'), ('Mul', 'Ngat', 'Taa', 'Iwo', 'Mam', 'Paa', 'Nge', 'Roo', 'Bur', 'Epe', 'Kpt', 'Kpa')),
+    (('ចន្ទ', 'អង្គារ', 'ពុធ', 'ព្រហ', 'សុក្រ', 'សៅរ៍', 'អាទិត្យ'), ('មករា', 'កុម្ភៈ', 'មីនា', 'មេសា', 'ឧសភា', 'មិថុនា', 'កក្កដា', 'សីហា', 'កញ្ញា', 'តុលា', 'វិច្ឆិកា', 'ធ្នូ')),
+    (('ಸೋಮ', 'ಮಂಗಳ', 'ಬುಧ', 'ಗುರು', 'ಶುಕ್ರ', 'ಶನಿ', 'ಭಾನು'), ('ಜನ', 'ಫೆಬ್ರ', 'ಮಾರ್ಚ್', 'ಏಪ್ರಿ', 'ಮೇ', 'ಜೂನ್', 'ಜುಲೈ', 'ಆಗ', 'ಸೆಪ್ಟೆಂ', 'ಅಕ್ಟೋ', 'ನವೆಂ', 'ಡಿಸೆಂ')),
+    (('월', '화', '수', '목', '금', '토', '일'), ('1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월')),
+    (('सोमार', 'मंगळार', 'बुधवार', 'बिरेस्तार', 'शुक्रार', 'शेनवार', 'आयतार'), ('जाने', 'फेब्रु', 'मार्च', 'एप्री', 'मे', 'जून', 'जुल', 'ऑग', 'सप्टें', 'ऑक्टो', 'नो', 'डिसे')),
+    (('Som', 'Mon', 'Bud', 'Bre', 'Suk', 'Son', 'Ait'), ('Jan', 'Feb', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Otu', 'Nov', 'Dez')),
+    (('ژٔندٕروار', 'بۆموار', 'بودوار', 'برؠسوار', 'جُمہ', 'بٹوار', 'آتھوار'), ('جنؤری', 'فرؤری', 'مارٕچ', 'اپریل', 'مئی', 'جوٗن', 'جوٗلایی', 'اگست', 'ستمبر', 'اکتوٗبر', 'نومبر', 'دسمبر')),
+    (('चंदिरवार', 'बुवार', 'बोदवार', 'ब्रेसवार', 'जुमा', 'बटवार', 'आथवार'), ('जनवरी', 'फ़रवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई', 'अगस्त', 'सतुंबर', 'अकतुम्बर', 'नवूमबर', 'दसमबर')),
+    (('Jtt', 'Jmn', 'Jtn', 'Alh', 'Iju', 'Jmo', 'Jpi'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('lǝn', 'maa', 'mɛk', 'jǝǝ', 'júm', 'sam', 'sɔ́n'), ('ŋ1', 'ŋ2', 'ŋ3', 'ŋ4', 'ŋ5', 'ŋ6', 'ŋ7', 'ŋ8', 'ŋ9', 'ŋ10', 'ŋ11', 'ŋ12')),
+    (('Mo.', 'Di.', 'Me.', 'Du.', 'Fr.', 'Sa.', 'Su.'), ('Jan.', 'Fäb.', 'Mäz.', 'Apr.', 'Mai', 'Jun.', 'Jul.', 'Ouj.', 'Säp.', 'Okt.', 'Nov.', 'Dez.')),
+    (('dşm', 'sşm', 'çşm', 'pşm', 'înî', 'şem', 'yşm'), ('rbn', 'sbt', 'adr', 'nsn', 'gln', 'hzr', 'trm', 'tbx', 'îln', 'cot', 'mjd', 'brf')),
+    (('Lun', 'Mth', 'Mhr', 'Yow', 'Gwe', 'Sad', 'Sul'), ('Gen', 'Hwe', 'Meu', 'Ebr', 'Me', 'Met', 'Gor', 'Est', 'Gwn', 'Hed', 'Du', 'Kev')),
+    (('smba', 'manga', 'puda', 'laki', 'sukru', 'sani', 'aadi'), ('pusu', 'maha', 'pagu', 'hire', 'bese', 'jaṭṭa', 'aasaḍi', 'srabĩ', 'bado', 'dasara', 'divi', 'pande')),
+    (('साॅम्मा', 'मान्गा', 'पूदा', 'लाक्की', 'सुकुरु', 'सान्नि', 'आदि'), ('पुसु', 'माहा', 'पागु', 'हिर्रे', 'बेसे', 'जाट्टा', 'आसाड़ी', 'स्राबाँ', 'बाॅदो', 'दासारा', 'दिवी', 'पान्डे')),
+    (('ସମ୍ବା', 'ମାଙ୍ଗା', 'ପୁଦା', 'ଲାକି', 'ସୁକ୍ରୁ', 'ସାନି', 'ଆଦି'), ('ପୁସୁ', 'ମାହା', 'ପାଗୁ', 'ହିରେ', 'ବେସେ', 'ଜାଟା', 'ଆସାଡ଼ି', 'ସ୍ରାବାଁ', 'ବଦ', 'ଦାସାରା', 'ଦିୱି', 'ପାଣ୍ଡେ')),
+    (('నమారా', 'మాంగాడా', 'వుదారా', 'లాకివరా', 'నుక్ వరా', 'సానివరా', 'వారమి'), ('మాగ', 'గుండు', 'హిరెఇ', 'బెసెకి', 'లండి', 'రాత', 'బాన్దపాణా', 'బార్సి', 'అస్ర', 'దివెడి', 'పాండు', 'పుసు')),
+    (('дүй.', 'шейш.', 'шарш.', 'бейш.', 'жума', 'ишм.', 'жек.'), ('Янв', 'Фев', 'Мар', 'Апр', 'Май', 'Июн', 'Июл', 'Авг', 'Сен', 'Окт', 'Ноя', 'Дек')),
+    (('Lun', 'Mar', 'Mer', 'Iov', 'Ven', 'Sat', 'Sol'), ('Ian', 'Feb', 'Mar', 'Apr', 'Mai', 'Iun', 'Iul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')),
+    (('Táatu', 'Íne', 'Táano', 'Alh', 'Ijm', 'Móosi', 'Píili'), ('Fúngatɨ', 'Naanɨ', 'Keenda', 'Ikúmi', 'Inyambala', 'Idwaata', 'Mʉʉnchɨ', 'Vɨɨrɨ', 'Saatʉ', 'Inyi', 'Saano', 'Sasatʉ')),
+    (('Méi.', 'Dën.', 'Mët.', 'Don.', 'Fre.', 'Sam.', 'Son.'), ('Jan', 'Feb', 'Mäe', 'Abr', 'Mee', 'Jun', 'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez')),
+    (('Bal', 'Lw2', 'Lw3', 'Lw4', 'Lw5', 'Lw6', 'Sab'), ('Jan', 'Feb', 'Mar', 'Apu', 'Maa', 'Juu', 'Jul', 'Agu', 'Seb', 'Oki', 'Nov', 'Des')),
+    (('lun.', 'mät.', 'mäc.', 'zeu.', 'ven.', 'sab.', 'dom.'), ('zen.', 'fre.', 'mar.', 'arv.', 'maz.', 'zug.', 'lug.', 'ago.', 'set.', 'ott.', 'nov.', 'dex.')),
+    (('Aŋpétuwaŋži', 'Aŋpétunuŋpa', 'Aŋpétuyamni', 'Aŋpétutopa', 'Aŋpétuzaptaŋ', 'Owáŋgyužažapi', 'Aŋpétuwakȟaŋ'), ('Wiótheȟika Wí', 'Thiyóȟeyuŋka Wí', 'Ištáwičhayazaŋ Wí', 'Pȟežítȟo Wí', 'Čhaŋwápetȟo Wí', 'Wípazukȟa-wašté Wí', 'Čhaŋpȟásapa Wí', 'Wasútȟuŋ Wí', 'Čhaŋwápeǧi Wí', 'Čhaŋwápe-kasná Wí', 'Waníyetu Wí', 'Tȟahékapšuŋ Wí')),
+    (('lön', 'mert', 'merc', 'jöb', 'vën', 'sab', 'dom'), ('jená', 'forá', 'merz', 'aurí', 'ma', 'jügn', 'messé', 'aost', 'set', 'oto', 'nov', 'dez')),
+    (('lundì', 'mardì', 'mercoldì', 'sgiovedì', 'venerdì', 'sabet', 'domenega'), ('sginer', 'fevrer', 'marz', 'avril', 'masg', 'sgiugn', 'luj', 'avost', 'setember', 'otover', 'november', 'dicember')),
+    (('ybo', 'mbl', 'mst', 'min', 'mtn', 'mps', 'eye'), ('yan', 'fbl', 'msi', 'apl', 'mai', 'yun', 'yul', 'agt', 'stb', 'ɔtb', 'nvb', 'dsb')),
+    (('ຈັນ', 'ອັງຄານ', 'ພຸດ', 'ພະຫັດ', 'ສຸກ', 'ເສົາ', 'ອາທິດ'), ('ມ.ກ.', 'ກ.ພ.', 'ມ.ນ.', 'ມ.ສ.', 'ພ.ພ.', 'ມິ.ຖ.', 'ກ.ລ.', 'ສ.ຫ.', 'ກ.ຍ.', 'ຕ.ລ.', 'ພ.ຈ.', 'ທ.ວ.')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('جانڤیە', 'فئڤریە', 'مارس', 'آڤریل', 'مئی', 'جوٙأن', 'جوٙلا', 'آگوست', 'سئپتامر', 'ئوکتوڤر', 'نوڤامر', 'دئسامر')),
+    (('pr', 'an', 'tr', 'kt', 'pn', 'št', 'sk'), ('saus.', 'vas.', 'kov.', 'bal.', 'geg.', 'birž.', 'liep.', 'rugp.', 'rugs.', 'spal.', 'lapkr.', 'gruod.')),
+    (('pyrmūdīne', 'ūtardīne', 'trešdīne', 'catūrtdīne', 'pīktdīne', 'sastdīne', 'svātdīne'), ('janvars', 'februars', 'marts', 'apreļs', 'majs', 'juņs', 'juļs', 'augusts', 'septembris', 'oktobris', 'novembris', 'decembris')),
+    (('Nko', 'Ndy', 'Ndg', 'Njw', 'Ngv', 'Lub', 'Lum'), ('Cio', 'Lui', 'Lus', 'Muu', 'Lum', 'Luf', 'Kab', 'Lush', 'Lut', 'Lun', 'Kas', 'Cis')),
+    (('WUT', 'TAR', 'TAD', 'TAN', 'TAB', 'NGS', 'JMP'), ('DAC', 'DAR', 'DAD', 'DAN', 'DAH', 'DAU', 'DAO', 'DAB', 'DOC', 'DAP', 'DGI', 'DAG')),
+    (('J3', 'J4', 'J5', 'Al', 'Ij', 'J1', 'J2'), ('Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('pirmd.', 'otrd.', 'trešd.', 'ceturtd.', 'piektd.', 'sestd.', 'svētd.'), ('janv.', 'febr.', 'marts', 'apr.', 'maijs', 'jūn.', 'jūl.', 'aug.', 'sept.', 'okt.', 'nov.', 'dec.')),
+    (('सोम', 'मंगल', 'बुध', 'गुरु', 'शुक्र', 'शनि', 'रवि'), ('जन॰', 'फर॰', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुल॰', 'अग॰', 'सित॰', 'अक्तू॰', 'नव॰', 'दिस॰')),
+    (('Jtt', 'Jnn', 'Jtn', 'Alh', 'Iju', 'Jmo', 'Jpi'), ('Dal', 'Ará', 'Ɔɛn', 'Doy', 'Lép', 'Rok', 'Sás', 'Bɔ́r', 'Kús', 'Gís', 'Shʉ́', 'Ntʉ́')),
+    (('MRA', 'WAI', 'WET', 'WEN', 'WTN', 'JUM', 'KIU'), ('JAN', 'FEB', 'MAC', 'ĨPU', 'MĨĨ', 'NJU', 'NJR', 'AGA', 'SPT', 'OKT', 'NOV', 'DEC')),
+    (('lin', 'mar', 'mer', 'ze', 'van', 'sam', 'dim'), ('zan', 'fev', 'mar', 'avr', 'me', 'zin', 'zil', 'out', 'sep', 'okt', 'nov', 'des')),
+    (('Alats', 'Tal', 'Alar', 'Alak', 'Zom', 'Asab', 'Alah'), ('Jan', 'Feb', 'Mar', 'Apr', 'Mey', 'Jon', 'Jol', 'Aog', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('Jtt', 'Jnn', 'Jtn', 'Ara', 'Iju', 'Jmo', 'Sab'), ('Kwa', 'Una', 'Rar', 'Che', 'Tha', 'Moc', 'Sab', 'Nan', 'Tis', 'Kum', 'Moj', 'Yel')),
+    (('Aneg 2', 'Aneg 3', 'Aneg 4', 'Aneg 5', 'Aneg 6', 'Aneg 7', 'Aneg 1'), ('mbegtug', 'imeg àbùbì', 'imeg mbəŋchubi', 'iməg ngwə̀t', 'iməg fog', 'iməg ichiibɔd', 'iməg àdùmbə̀ŋ', 'iməg ichika', 'iməg kud', 'iməg tèsiʼe', 'iməg zò', 'iməg krizmed')),
+    (('Man', 'Tūr', 'Wen', 'Tāi', 'Par', 'Rāh', 'Rāt'), ('Hān', 'Pēp', 'Māe', 'Āpe', 'Mei', 'Hun', 'Hūr', 'Āku', 'Hep', 'Oke', 'Noe', 'Tīh')),
+    (('пон.', 'вто.', 'сре.', 'чет.', 'пет.', 'саб.', 'нед.'), ('јан.', 'фев.', 'мар.', 'апр.', 'мај', 'јун.', 'јул.', 'авг.', 'сеп.', 'окт.', 'ное.', 'дек.')),
+    (('തിങ്കൾ', 'ചൊവ്വ', 'ബുധൻ', 'വ്യാഴം', 'വെള്ളി', 'ശനി', 'ഞായർ'), ('ജനു', 'ഫെബ്രു', 'മാർ', 'ഏപ്രി', 'മേയ്', 'ജൂൺ', 'ജൂലൈ', 'ഓഗ', 'സെപ്റ്റം', 'ഒക്ടോ', 'നവം', 'ഡിസം')),
+    (('Да', 'Мя', 'Лх', 'Пү', 'Ба', 'Бя', 'Ня'), ('1-р сар', '2-р сар', '3-р сар', '4-р сар', '5-р сар', '6-р сар', '7-р сар', '8-р сар', '9-р сар', '10-р сар', '11-р сар', '12-р сар')),
+    (('ᠲᠠ', 'ᠮᠢᠭ', 'ᡀᠠ', 'ᠫᠥᠷ', 'ᠪᠠ', 'ᠪᠢᠮ', 'ᠨᠢ'), ('1\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '2\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '3᠊ᠷ ᠰᠠᠷ\u180eᠠ', '4\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '5\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '6\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '7\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '8\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '9\u202f᠊ᠷ ᠰᠠᠷ\u180eᠠ', '10 ᠊ᠷ ᠰᠠᠷ\u180eᠠ', '11᠊ᠷ ᠰᠠᠷ\u180eᠠ', '12᠊ᠷ ᠰᠠᠷ\u180eᠠ')),
+    (('নিংথৌকাবা', 'লৈবাকপোকপা', 'য়ুমশকৈশা', 'শগোলশেন', 'ইরাই', 'থাংজ', 'নোংমাইজিং'), ('জানু', 'ফেব্রু', 'মার', 'এপ্রি', 'মে', 'জুন', 'জুলা', 'আগ', 'সেপ্ট', 'ওক্টো', 'নভে', 'ডিসে')),
+    (('सोम', 'मंगळ', 'बुध', 'गुरु', 'शुक्र', 'शनि', 'रवि'), ('जाने', 'फेब्रु', 'मार्च', 'एप्रि', 'मे', 'जून', 'जुलै', 'ऑग', 'सप्टें', 'ऑक्टो', 'नोव्हें', 'डिसें')),
+    (('Isn', 'Sel', 'Rab', 'Kha', 'Jum', 'Sab', 'Ahd'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ogo', 'Sep', 'Okt', 'Nov', 'Dis')),
+    (('اثنين', 'ثلاث', 'رابو', 'خميس', 'جمعة', 'سبتو', 'احد'), ('جانواري', 'فيبواري', 'مچ', 'اڤريل', 'مي', 'جون', 'جولاي', 'ݢوس', 'سيڤتيمبر', 'اوکتوبر', 'نوۏيمبر', 'ديسيمبر')),
+    (('Tne', 'Tli', 'Erb', 'Ħam', 'Ġim', 'Sib', 'Ħad'), ('Jan', 'Fra', 'Mar', 'Apr', 'Mej', 'Ġun', 'Lul', 'Aww', 'Set', 'Ott', 'Nov', 'Diċ')),
+    (('Cla', 'Czi', 'Cko', 'Cka', 'Cga', 'Cze', 'Cya'), ('FLO', 'CLA', 'CKI', 'FMF', 'MAD', 'MBI', 'MLI', 'MAM', 'FDE', 'FMU', 'FGW', 'FYU')),
+    (('Enhvteceskv', 'Enhvteceskv Enhvyvtke', 'Ennvrkvpv', 'Ennvrkvpv Enhvyvtke', 'Nak Okkoskv Nettv', 'Nettv Cakʼcuse', 'Nettvʼcako'), ('Rvfo Cuse', 'Hotvle Hvse', 'Tasahcuce', 'Tasahce Rakko', 'Ke Hvse', 'Kvco Hvse', 'Hiyuce', 'Hiyo Rakko', 'Otowoskuce', 'Otowoskv Rakko', 'Ehole', 'Rvfo Rakko')),
+    (('တနင်္လာ', 'အင်္ဂါ', 'ဗုဒ္ဓဟူး', 'ကြာသပတေး', 'သောကြာ', 'စနေ', 'တနင်္ဂနွေ'), ('ဇန်', 'ဖေ', 'မတ်', 'ဧ', 'မေ', 'ဇွန်', 'ဇူ', 'ဩ', 'စက်', 'အောက်', 'နို', 'ဒီ')),
+    (('атя', 'вас', 'кун', 'кал', 'сюк', 'шля', 'тар'), ('якш', 'дав', 'эйз', 'чад', 'пан', 'ашт', 'мед', 'ума', 'таш', 'ожо', 'сун', 'аца')),
+    (('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), ('ژانویه', 'فوریه', 'مارس', 'آوریل', 'مه', 'ژوئن', 'ژوئیه', 'اوت', 'سپتامبر', 'اکتبر', 'نوامبر', 'دسامبر')),
+    (('Ma', 'De', 'Wu', 'Do', 'Fr', 'Sat', 'Son'), ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')),
+    (('man.', 'tir.', 'ons.', 'tor.', 'fre.', 'lør.', 'søn.'), ('jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep', 'okt', 'nov', 'des')),
+    (('Mvu', 'Sib', 'Sit', 'Sin', 'Sih', 'Mgq', 'Son'), ('Zib', 'Nhlo', 'Mbi', 'Mab', 'Nkw', 'Nhla', 'Ntu', 'Ncw', 'Mpan', 'Mfu', 'Lwe', 'Mpal')),
+    (('Ma.', 'Di.', 'Mi.', 'Du.', 'Fr.', 'Sa.', 'Sü.'), ('Jan.', 'Feb.', 'März', 'Apr.', 'Mai', 'Juni', 'Juli', 'Aug.', 'Sep.', 'Okt.', 'Nov.', 'Dez.')),
+    (('सोम', 'मङ्गल', 'बुध', 'बिहि', 'शुक्र', 'शनि', 'आइत'), ('जनवरी', 'फेब्रुअरी', 'मार्च', 'अप्रिल', 'मे', 'जुन', 'जुलाई', 'अगस्ट', 'सेप्टेम्बर', 'अक्टोबर', 'नोभेम्बर', 'डिसेम्बर')),
+    (('ma', 'di', 'wo', 'do', 'vr', 'za', 'zo'), ('jan', 'feb', 'mrt', 'apr', 'mei', 'jun', 'jul', 'aug', 'sep', 'okt', 'nov', 'dec')),
+    (('mɔ́n', 'smb', 'sml', 'smn', 'mbs', 'sas', 'sɔ́n'), ('ng1', 'ng2', 'ng3', 'ng4', 'ng5', 'ng6', 'ng7', 'ng8', 'ng9', 'ng10', 'ng11', 'kris')),
+    (('må.', 'ty.', 'on.', 'to.', 'fr.', 'la.', 'sø.'), ('jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep', 'okt', 'nov', 'des')),
+    (('mvfò lyɛ̌ʼ', 'mbɔ́ɔntè mvfò lyɛ̌ʼ', 'tsètsɛ̀ɛ lyɛ̌ʼ', 'mbɔ́ɔntè tsetsɛ̀ɛ lyɛ̌ʼ', 'mvfò màga lyɛ̌ʼ', 'màga lyɛ̌ʼ', 'lyɛʼɛ́ sẅíŋtè'), ('saŋ tsetsɛ̀ɛ lùm', 'saŋ kàg ngwóŋ', 'saŋ lepyè shúm', 'saŋ cÿó', 'saŋ tsɛ̀ɛ cÿó', 'saŋ njÿoláʼ', 'saŋ tyɛ̀b tyɛ̀b mbʉ̀ŋ', 'saŋ mbʉ̀ŋ', 'saŋ ngwɔ̀ʼ mbÿɛ', 'saŋ tàŋa tsetsáʼ', 'saŋ mejwoŋó', 'saŋ lùm')),
+    (('ߞߐ߬ߓ', 'ߞߐ߬ߟߏ߲', 'ߞߎߣ', 'ߓߌߟ', 'ߛߌ߬ߣ', 'ߞߍ߲ߘ', 'ߞߊ߯ߙ'), ('ߓߌ߲ߠ', 'ߞߏ߲ߞ', 'ߕߙߊ', 'ߞߏ߲ߘ', 'ߘߓߊ߬ߕ', 'ߥߊ߬ߛ', 'ߞߊ߬ߙ', 'ߘߓߊ߬ߓ', 'ߕߎߟߊߝߌ߲', 'ߞߏ߲ߓ', 'ߣߍߣ', 'ߞߏߟ')),
+    (('Mvu', 'Bil', 'Tha', 'Ne', 'Hla', 'Gqi', 'Son'), ('Jan', 'Feb', 'Mat', 'Apr', 'Mey', 'Jun', 'Jul', 'Arh', 'Sep', 'Okt', 'Usi', 'Dis')),
+    (('Mos', 'Bed', 'Rar', 'Ne', 'Hla', 'Mok', 'Lam'), ('Phere', 'Dibo', 'Hlak', 'Mora', 'Mei', 'June', 'Mose', 'Agosetose', 'Lewe', 'Dipha', 'Diba', 'Manth')),
+    (('Jiec', 'Rɛw', 'Diɔ̱k', 'Ŋuaan', 'Dhieec', 'Bäkɛl', 'Cäŋ'), ('Tiop', 'Pɛt', 'Duɔ̱ɔ̱', 'Guak', 'Duä', 'Kor', 'Pay', 'Thoo', 'Tɛɛ', 'Laa', 'Kur', 'Tid')),
+    (('Lem', 'Wir', 'Tat', 'Nai', 'San', 'Wer', 'Mul'), ('Jan', 'Feb', 'Mal', 'Epu', 'Mei', 'Jun', 'Jul', 'Oga', 'Sep', 'Oku', 'Nov', 'Dis')),
+    (('diluns', 'dimars', 'dimècres', 'dijòus', 'divendres', 'dissabte', 'dimenge'), ('gen.', 'feb.', 'març', 'abr.', 'mai', 'junh', 'jul.', 'ago.', 'set.', 'oct.', 'nov.', 'dec.')),
+    (('del', 'dma', 'dmè', 'dij', 'diu', 'dis', 'dim'), ('gèr', 'her', 'mar', 'abr', 'mai', 'jun', 'jur', 'ago', 'set', 'oct', 'nov', 'dec')),
+    (('Wix', 'Kib', 'Rob', 'Kam', 'Jim', 'San', 'Dil'), ('Ama', 'Gur', 'Bitootessa', 'Elb', 'Cam', 'Wax', 'Ado', 'Hag', 'Ful', 'Onk', 'Sadaasa', 'Mud')),
+    (('ସୋମ', 'ମଙ୍ଗଳ', 'ବୁଧ', 'ଗୁରୁ', 'ଶୁକ୍ର', 'ଶନି', 'ରବି'), ('ଜାନୁଆରୀ', 'ଫେବୃଆରୀ', 'ମାର୍ଚ୍ଚ', 'ଅପ୍ରେଲ', 'ମଇ', 'ଜୁନ', 'ଜୁଲାଇ', 'ଅଗଷ୍ଟ', 'ସେପ୍ଟେମ୍ବର', 'ଅକ୍ଟୋବର', 'ନଭେମ୍ବର', 'ଡିସେମ୍ବର')),
+    (('крс', 'дцг', 'ӕрт', 'цпр', 'мрб', 'сбт', 'хцб'), ('Янв.', 'Февр.', 'Март.', 'Апр.', 'Май', 'Июнь', 'Июль', 'Авг.', 'Сент.', 'Окт.', 'Нояб.', 'Дек.')),
+    (('𐒹𐓘͘𐓬𐓘 𐓄𐓘𐓡𐓛͘𐓧𐓣', '𐒹𐓘͘𐓬𐓘 𐓏𐓟𐓵𐓪͘𐓬𐓘', '𐒹𐓘͘𐓬𐓘 𐓏𐓟𐓵𐓘𐓜𐓣', '𐒹𐓘͘𐓬𐓘 𐓏𐓟𐓰𐓪𐓬𐓘', '𐒹𐓘͘𐓬𐓘 𐓈𐓘 𐓵𐓘𐓲𐓘 𐓻𐓣͘', '𐒹𐓘͘𐓬𐓘 𐓂𐓤𐓘𐓸𐓟 𐓣͘𐓤𐓟', '𐒹𐓘͘𐓬𐓘 𐓏𐓘𐓤𐓘͘𐓰𐓘𐓤𐓣'), ('𐓄𐓘𐓡𐓛͘𐓧𐓟', '𐓵𐓪͘𐓬𐓘', '𐓵𐓘𐓜𐓣', '𐓰𐓪𐓬𐓘', '𐓮𐓘𐓰𐓘', '𐓯𐓘𐓬𐓟', '𐓄𐓟𐓵𐓪͘𐓬𐓘', '𐒼𐓣𐓟𐓰𐓪𐓬𐓘', '𐒿𐓟𐓜𐓛𐓲𐓟𐓷𐓣͘𐓤𐓟', '𐒿𐓟𐓜𐓛', '𐒰𐓧𐓣 𐓏𐓣͘𐓸𐓲𐓣', '𐒰𐓧𐓣 𐓍𐓪͘𐓬𐓘')),
+    (('ਸੋਮ', 'ਮੰਗਲ', 'ਬੁੱਧ', 'ਵੀਰ', 'ਸ਼ੁੱਕਰ', 'ਸ਼ਨਿੱਚਰ', 'ਐਤ'), ('ਜਨ', 'ਫ਼ਰ', 'ਮਾਰਚ', 'ਅਪ੍ਰੈ', 'ਮਈ', 'ਜੂਨ', 'ਜੁਲਾ', 'ਅਗ', 'ਸਤੰ', 'ਅਕਤੂ', 'ਨਵੰ', 'ਦਸੰ')),
+    (('پیر', 'منگل', 'بُدھ', 'جمعرات', 'جمعہ', 'ہفتہ', 'اتوار'), ('جنوری', 'فروری', 'مارچ', 'اپریل', 'مئ', 'جون', 'جولائی', 'اگست', 'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('djaluna', 'djamars', 'djarason', 'djaweps', 'djabièrnè', 'djasabra', 'djadumingu'), ('yan', 'feb', 'mar', 'apr', 'mei', 'yün', 'yül', 'oug', 'sèp', 'òkt', 'nov', 'des')),
+    (('Mọ́n', 'Tiú', 'Wẹ́n', 'Tọ́z', 'Fraí', 'Sát', 'Sọ́n'), ('Jén', 'Fẹ́b', 'Mach', 'Épr', 'Mee', 'Jun', 'Jul', 'Ọ́gọ', 'Sẹp', 'Ọkt', 'Nọv', 'Dis')),
+    (('Mande', 'Tiusde', 'Wenesde', 'Tosde', 'Fraede', 'Satade', 'Sande'), ('Januare', 'Febuare', 'Mas', 'Eprel', 'Mei', 'Jun', 'Julae', 'Ogus', 'Septemba', 'Oktoba', 'Novemba', 'Disemba')),
+    (('pon.', 'wt.', 'śr.', 'czw.', 'pt.', 'sob.', 'niedz.'), ('sty', 'lut', 'mar', 'kwi', 'maj', 'cze', 'lip', 'sie', 'wrz', 'paź', 'lis', 'gru')),
+    (('pan', 'wis', 'pus', 'ket', 'pēn', 'sab', 'nad'), ('rag', 'was', 'pūl', 'sak', 'zal', 'sīm', 'līp', 'dag', 'sil', 'spa', 'lap', 'sal')),
+    (('دونۍ', 'درېنۍ', 'څلرنۍ', 'پينځنۍ', 'جمعه', 'اونۍ', 'يونۍ'), ('جنوري', 'فبروري', 'مارچ', 'اپریل', 'مۍ', 'جون', 'جولای', 'اګست', 'سپتمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('seg.', 'ter.', 'qua.', 'qui.', 'sex.', 'sáb.', 'dom.'), ('jan.', 'fev.', 'mar.', 'abr.', 'mai.', 'jun.', 'jul.', 'ago.', 'set.', 'out.', 'nov.', 'dez.')),
+    (('segunda', 'terça', 'quarta', 'quinta', 'sexta', 'sábado', 'domingo'), ('jan.', 'fev.', 'mar.', 'abr.', 'mai.', 'jun.', 'jul.', 'ago.', 'set.', 'out.', 'nov.', 'dez.')),
+    (('Lun', 'Mar', 'Mié', 'Jue', 'Vie', 'Sab', 'Dom'), ('Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Jul', 'Ago', 'Set', 'Oct', 'Nov', 'Dic')),
+    (('सोमवार', 'मंगलवार', 'बुधवार', 'गुरुवार', 'शुक्रवार', 'शनिवार', 'रविवार'), ('जनवरी', 'फरवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई', 'अगस्त', 'सितम्बर', 'अक्टूबर', 'नवंबर', 'दिसंबर')),
+    (('let', 'ttl', 'lar', 'lex', 'jje', 'sse', 'lḥe'), ('yen', 'feb', 'mar', 'yeb', 'may', 'yun', 'yul', 'ɣuc', 'cut', 'kṭu', 'nuw', 'duj')),
+    (('gli', 'ma', 'me', 'gie', 've', 'so', 'du'), ('schan.', 'favr.', 'mars', 'avr.', 'matg', 'zercl.', 'fan.', 'avust', 'sett.', 'oct.', 'nov.', 'dec.')),
+    (('mbe.', 'kab.', 'gtu.', 'kan.', 'gnu.', 'gnd.', 'cu.'), ('Mut.', 'Gas.', 'Wer.', 'Mat.', 'Gic.', 'Kam.', 'Nya.', 'Kan.', 'Nze.', 'Ukw.', 'Ugu.', 'Uku.')),
+    (('lun.', 'mar.', 'mie.', 'joi', 'vin.', 'sâm.', 'dum.'), ('ian.', 'feb.', 'mar.', 'apr.', 'mai', 'iun.', 'iul.', 'aug.', 'sept.', 'oct.', 'nov.', 'dec.')),
+    (('Lun', 'Mar', 'Mie', 'Joi', 'Vin', 'Sâm', 'Dum'), ('ian.', 'feb.', 'mar.', 'apr.', 'mai', 'iun.', 'iul.', 'aug.', 'sept.', 'oct.', 'nov.', 'dec.')),
+    (('Ijt', 'Ijn', 'Ijtn', 'Alh', 'Iju', 'Ijm', 'Ijp'), ('M1', 'M2', 'M3', 'M4', 'M5', 'M6', 'M7', 'M8', 'M9', 'M10', 'M11', 'M12')),
+    (('пн', 'вт', 'ср', 'чт', 'пт', 'сб', 'вс'), ('янв.', 'февр.', 'март', 'апр.', 'май', 'июнь', 'июль', 'авг.', 'сент.', 'окт.', 'нояб.', 'дек.')),
+    (('mbe.', 'kab.', 'gtu.', 'kan.', 'gnu.', 'gnd.', 'cyu.'), ('mut.', 'gas.', 'wer.', 'mat.', 'gic.', 'kam.', 'nya.', 'kan.', 'nze.', 'ukw.', 'ugu.', 'uku.')),
+    (('सोम', 'मंगल', 'बुध', 'गुरु', 'शुक्र', 'शनि', 'रवि'), ('जनवरी:', 'फरवरी:', 'मार्च:', 'अप्रैल:', 'मई', 'जून:', 'जुलाई:', 'अगस्त:', 'सितंबर:', 'अक्तूबर:', 'नवंबर:', 'दिसंबर:')),
+    (('бн', 'оп', 'сэ', 'чп', 'бэ', 'сб', 'бс'), ('Тохс', 'Олун', 'Клн', 'Мсу', 'Ыам', 'Бэс', 'Отй', 'Атр', 'Блҕ', 'Алт', 'Сэт', 'Ахс')),
+    (('Kun', 'Ong', 'Ine', 'Ile', 'Sap', 'Kwe', 'Are'), ('Obo', 'Waa', 'Oku', 'Ong', 'Ime', 'Ile', 'Sap', 'Isi', 'Saa', 'Tom', 'Tob', 'Tow')),
+    (('ᱚᱛ', 'ᱵᱟ', 'ᱥᱟᱹ', 'ᱥᱟᱹᱨ', 'ᱡᱟᱹ', 'ᱧᱩ', 'ᱥᱤᱸ'), ('ᱡᱟᱱ', 'ᱯᱷᱟ', 'ᱢᱟᱨ', 'ᱟᱯᱨ', 'ᱢᱮ', 'ᱡᱩᱱ', 'ᱡᱩᱞ', 'ᱟᱜᱟ', 'ᱥᱮᱯ', 'ᱚᱠᱴ', 'ᱱᱟᱣ', 'ᱫᱤᱥ')),
+    (('Jtt', 'Jnn', 'Jtn', 'Alh', 'Iju', 'Jmo', 'Mul'), ('Mup', 'Mwi', 'Msh', 'Mun', 'Mag', 'Muj', 'Msp', 'Mpg', 'Mye', 'Mok', 'Mus', 'Muh')),
+    (('lun', 'mar', 'mèr', 'giò', 'che', 'sàb', 'dom'), ('ghe', 'fre', 'mar', 'abr', 'maj', 'làm', 'trì', 'aus', 'cab', 'stG', 'stA', 'nad')),
+    (('lun', 'mar', 'mer', 'jov', 'ven', 'sab', 'dum'), ('jin', 'fri', 'mar', 'apr', 'maj', 'giu', 'gnt', 'agu', 'sit', 'utt', 'nuv', 'dic')),
+    (('سومر', 'اڱارو', 'اربع', 'خميس', 'جمعو', 'ڇنڇر', 'آچر'), ('جنوري', 'فيبروري', 'مارچ', 'اپريل', 'مئي', 'جون', 'جولاءِ', 'آگسٽ', 'سيپٽمبر', 'آڪٽوبر', 'نومبر', 'ڊسمبر')),
+    (('सू', 'मंग', 'बु॒ध', 'विस', 'जुम', 'छंछ', 'आर्त'), ('जन', 'फर', 'मार्च', 'अप्रै', 'मई', 'जून', 'जुला', 'अग', 'सप्टे', 'ऑक्टो', 'नवं', 'डिसं')),
+    (('vuos', 'maŋ', 'gask', 'duor', 'bear', 'láv', 'sotn'), ('ođđj', 'guov', 'njuk', 'cuo', 'mies', 'geas', 'suoi', 'borg', 'čakč', 'golg', 'skáb', 'juov')),
+    (('má', 'di', 'ga', 'du', 'be', 'lá', 'so'), ('ođđj', 'guov', 'njuk', 'cuoŋ', 'mies', 'geas', 'suoi', 'borg', 'čakč', 'golg', 'skáb', 'juov')),
+    (('Pos', 'Pir', 'Tat', 'Nai', 'Sha', 'Sab', 'Dim'), ('Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Aug', 'Set', 'Otu', 'Nov', 'Dec')),
+    (('Bk2', 'Bk3', 'Bk4', 'Bk5', 'Lâp', 'Lây', 'Bk1'), ('Nye', 'Ful', 'Mbä', 'Ngu', 'Bêl', 'Fön', 'Len', 'Kük', 'Mvu', 'Ngb', 'Nab', 'Kak')),
+    (('ⴰⵢⵏ', 'ⴰⵙⵉ', 'ⴰⴽⵕ', 'ⴰⴽⵡ', 'ⴰⵙⵉⵎ', 'ⴰⵙⵉⴹ', 'ⴰⵙⴰ'), ('ⵉⵏⵏ', 'ⴱⵕⴰ', 'ⵎⴰⵕ', 'ⵉⴱⵔ', 'ⵎⴰⵢ', 'ⵢⵓⵏ', 'ⵢⵓⵍ', 'ⵖⵓⵛ', 'ⵛⵓⵜ', 'ⴽⵜⵓ', 'ⵏⵓⵡ', 'ⴷⵓⵊ')),
+    (('ayn', 'asi', 'akṛ', 'akw', 'asim', 'asiḍ', 'asa'), ('inn', 'bṛa', 'maṛ', 'ibr', 'may', 'yun', 'yul', 'ɣuc', 'cut', 'ktu', 'nuw', 'duj')),
+    (('සඳුදා', 'අඟහ', 'බදාදා', 'බ්\u200dරහස්', 'සිකු', 'සෙන', 'ඉරිදා'), ('ජන', 'පෙබ', 'මාර්', 'අප්\u200dරේල්', 'මැයි', 'ජූනි', 'ජූලි', 'අගෝ', 'සැප්', 'ඔක්', 'නොවැ', 'දෙසැ')),
+    (('San', 'Mak', 'Row', 'Ham', 'Arb', 'Qid', 'Sam'), ('M01', 'M02', 'M03', 'M04', 'M05', 'M06', 'M07', 'M08', 'M09', 'M10', 'M11', 'M12')),
+    (('po', 'ut', 'st', 'št', 'pi', 'so', 'ne'), ('jan', 'feb', 'mar', 'apr', 'máj', 'jún', 'júl', 'aug', 'sep', 'okt', 'nov', 'dec')),
+    (('سوموار', 'منگل', 'ٻدھ', 'خمیس', 'جمعہ', 'چھݨ چھݨ', 'اتوار'), ('جنوری', 'فروری', 'مارچ', 'اپریل', 'مئی', 'جون', 'جولائی', 'اگست', 'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('pon.', 'tor.', 'sre.', 'čet.', 'pet.', 'sob.', 'ned.'), ('jan.', 'feb.', 'mar.', 'apr.', 'maj', 'jun.', 'jul.', 'avg.', 'sep.', 'okt.', 'nov.', 'dec.')),
+    (('vuo', 'maj', 'kos', 'tuo', 'vás', 'láv', 'pas'), ('uđiv', 'kuovâ', 'njuhčâ', 'cuáŋui', 'vyesi', 'kesi', 'syeini', 'porge', 'čohčâ', 'roovvâd', 'skammâ', 'juovlâ')),
+    (('Muv', 'Chp', 'Cht', 'Chn', 'Chs', 'Mug', 'Svo'), ('Ndi', 'Kuk', 'Kur', 'Kub', 'Chv', 'Chk', 'Chg', 'Nya', 'Gun', 'Gum', 'Mbu', 'Zvi')),
+    (('Isn', 'Tldo', 'Arbc', 'Khms', 'Jmc', 'Sbti', 'Axd'), ('Jan', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 'Lul', 'Ogs', 'Seb', 'Okt', 'Nof', 'Dis')),
+    (('hën', 'mar', 'mër', 'enj', 'pre', 'sht', 'die'), ('jan', 'shk', 'mar', 'pri', 'maj', 'qer', 'korr', 'gush', 'sht', 'tet', 'nën', 'dhj')),
+    (('пон', 'уто', 'сре', 'чет', 'пет', 'суб', 'нед'), ('јан', 'феб', 'мар', 'апр', 'мај', 'јун', 'јул', 'авг', 'сеп', 'окт', 'нов', 'дец')),
+    (('пон', 'уто', 'сри', 'чет', 'пет', 'суб', 'нед'), ('јан', 'феб', 'мар', 'апр', 'мај', 'јун', 'јул', 'авг', 'сеп', 'окт', 'нов', 'дец')),
+    (('пон', 'уто', 'сре', 'чет', 'пет', 'суб', 'нед'), ('јан', 'феб', 'март', 'апр', 'мај', 'јун', 'јул', 'авг', 'септ', 'окт', 'нов', 'дец')),
+    (('pon', 'uto', 'sre', 'čet', 'pet', 'sub', 'ned'), ('jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'avg', 'sep', 'okt', 'nov', 'dec')),
+    (('pon', 'uto', 'sri', 'čet', 'pet', 'sub', 'ned'), ('jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'avg', 'sep', 'okt', 'nov', 'dec')),
+    (('pon', 'uto', 'sre', 'čet', 'pet', 'sub', 'ned'), ('jan', 'feb', 'mart', 'apr', 'maj', 'jun', 'jul', 'avg', 'sept', 'okt', 'nov', 'dec')),
+    (('Mso', 'Bil', 'Tsa', 'Ne', 'Hla', 'Mgc', 'Son'), ('Bhi', 'Van', 'Vol', 'Mab', 'Nkh', 'Nhl', 'Kho', 'Ngc', 'Nyo', 'Mph', 'Lwe', 'Ngo')),
+    (('San', 'Sal', 'Rab', 'Cam', 'Jum', 'Qun', 'Nab'), ('Qun', 'Nah', 'Cig', 'Agd', 'Cax', 'Qas', 'Qad', 'Leq', 'Way', 'Dit', 'Xim', 'Kax')),
+    (('Mma', 'Bed', 'Rar', 'Ne', 'Hla', 'Moq', 'Son'), ('Phe', 'Kol', 'Ube', 'Mme', 'Mot', 'Jan', 'Upu', 'Pha', 'Leo', 'Mph', 'Pun', 'Tsh')),
+    (('Sen', 'Sal', 'Reb', 'Kem', 'Jum', 'Sap', 'Mng'), ('Jan', 'Péb', 'Mar', 'Apr', 'Méi', 'Jun', 'Jul', 'Ags', 'Sép', 'Okt', 'Nop', 'Dés')),
+    (('mån', 'tis', 'ons', 'tors', 'fre', 'lör', 'sön'), ('jan.', 'feb.', 'mars', 'apr.', 'maj', 'juni', 'juli', 'aug.', 'sep.', 'okt.', 'nov.', 'dec.')),
+    (('Jumatatu', 'Jumanne', 'Jumatano', 'Alhamisi', 'Ijumaa', 'Jumamosi', 'Jumapili'), ('Jan', 'Feb', 'Mac', 'Apr', 'Mei', 'Jun', 'Jul', 'Ago', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('ܬܪܝܢ', 'ܬܠܬ', 'ܐܪܒܥ', 'ܚܡܫ', 'ܥܪܘ', 'ܫܒܬܐ', 'ܚܕ'), ('ܟܢܘܢ ܒ', 'ܫܒܛ', 'ܐܕܪ', 'ܢܝܣܢ', 'ܐܝܪ', 'ܚܙܝܪܢ', 'ܬܡܘܙ', 'ܐܒ', 'ܐܝܠܘܠ', 'ܬܫܪܝܢ ܐ', 'ܬܫܪܝܢ ܒ', 'ܟܢܘܢ ܐ')),
+    (('pyń', 'wto', 'str', 'szt', 'piō', 'sob', 'niy'), ('sty', 'lut', 'mar', 'kwi', 'moj', 'czy', 'lip', 'siy', 'wrz', 'paź', 'lis', 'gru')),
+    (('திங்.', 'செவ்.', 'புத.', 'வியா.', 'வெள்.', 'சனி', 'ஞாயி.'), ('ஜன.', 'பிப்.', 'மார்.', 'ஏப்.', 'மே', 'ஜூன்', 'ஜூலை', 'ஆக.', 'செப்.', 'அக்.', 'நவ.', 'டிச.')),
+    (('సోమ', 'మంగళ', 'బుధ', 'గురు', 'శుక్ర', 'శని', 'ఆది'), ('జన', 'ఫిబ్ర', 'మార్చి', 'ఏప్రి', 'మే', 'జూన్', 'జులై', 'ఆగ', 'సెప్టెం', 'అక్టో', 'నవం', 'డిసెం')),
+    (('Bar', 'Aar', 'Uni', 'Ung', 'Kan', 'Sab', 'Jum'), ('Rar', 'Muk', 'Kwa', 'Dun', 'Mar', 'Mod', 'Jol', 'Ped', 'Sok', 'Tib', 'Lab', 'Poo')),
+    (('Дшб', 'Сшб', 'Чшб', 'Пшб', 'Ҷмъ', 'Шнб', 'Яшб'), ('Янв', 'Фев', 'Мар', 'Апр', 'Май', 'Июн', 'Июл', 'Авг', 'Сен', 'Окт', 'Ноя', 'Дек')),
+    (('จ.', 'อ.', 'พ.', 'พฤ.', 'ศ.', 'ส.', 'อา.'), ('ม.ค.', 'ก.พ.', 'มี.ค.', 'เม.ย.', 'พ.ค.', 'มิ.ย.', 'ก.ค.', 'ส.ค.', 'ก.ย.', 'ต.ค.', 'พ.ย.', 'ธ.ค.')),
+    (('ሰኑ', 'ሰሉ', 'ረቡ', 'ሓሙ', 'ዓር', 'ቀዳ', 'ሰን'), ('ጥሪ', 'ለካ', 'መጋ', 'ሚያ', 'ግን', 'ሰነ', 'ሓም', 'ነሓ', 'መስ', 'ጥቅ', 'ሕዳ', 'ታሕ')),
+    (('ሰኖ', 'ታላሸ', 'ኣረር', 'ከሚሽ', 'ጅምዓ', 'ሰ/ን', 'ሰ/ዓ'), ('ጃንዩ', 'ፌብሩ', 'ማርች', 'ኤፕረ', 'ሜይ', 'ጁን', 'ጁላይ', 'ኦገስ', 'ሴፕቴ', 'ኦክተ', 'ኖቬም', 'ዲሴም')),
+    (('duş', 'siş', 'çar', 'pen', 'ann', 'şen', 'ýek'), ('Ýan', 'Few', 'Mar', 'Apr', 'Maý', 'Iýun', 'Iýul', 'Awg', 'Sen', 'Okt', 'Noý', 'Dek')),
+    (('Mos', 'Labb', 'Labr', 'Labn', 'Labt', 'Mat', 'Tsh'), ('Fer', 'Tlh', 'Mop', 'Mor', 'Mot', 'See', 'Phu', 'Pha', 'Lwe', 'Dip', 'Ngw', 'Sed')),
+    (('Mōn', 'Tūs', 'Pul', 'Tuʻa', 'Fal', 'Tok', 'Sāp'), ('Sān', 'Fēp', 'Maʻa', 'ʻEpe', 'Mē', 'Sun', 'Siu', 'ʻAok', 'Sēp', 'ʻOka', 'Nōv', 'Tīs')),
+    (('suno esun #1', 'suno esun #2', 'suno esun #3', 'suno esun #4', 'suno esun #5', 'suno esun #6', 'suno esun #7'), ('mun #1', 'mun #2', 'mun #3', 'mun #4', 'mun #5', 'mun #6', 'mun #7', 'mun #8', 'mun #9', 'mun #10', 'mun #11', 'mun #12')),
+    (('Man', 'Tun', 'Tri', 'Fon', 'Fra', 'Sar', 'San'), ('Jan', 'Feb', 'Mas', 'Epr', 'Me', 'Jun', 'Jul', 'Oga', 'Sep', 'Okt', 'Nov', 'Des')),
+    (('Pzt', 'Sal', 'Çar', 'Per', 'Cum', 'Cmt', 'Paz'), ('Oca', 'Şub', 'Mar', 'Nis', 'May', 'Haz', 'Tem', 'Ağu', 'Eyl', 'Eki', 'Kas', 'Ara')),
+    (('Kin', 'Dha', 'Tru', 'Spa', 'Rim', 'Mat', 'Emp'), ('Kii', 'Dhi', 'Tri', 'Spi', 'Rii', 'Mti', 'Emi', 'Mai', 'Mni', 'Mxi', 'Mxk', 'Mxd')),
+    (('دُوشیمے', 'گھن آنگا', 'چارشیمے', 'پَئ شیمے', 'شُوگار', 'لَو آنگا', 'ایکشیمے'), ('جنوری', 'فروری', 'مارچ', 'اپریل', 'مئ', 'جون', 'جولائی', 'اگست', 'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('Mus', 'Bir', 'Har', 'Ne', 'Tlh', 'Mug', 'Son'), ('Sun', 'Yan', 'Kul', 'Dzi', 'Mud', 'Kho', 'Maw', 'Mha', 'Ndz', 'Nhl', 'Huk', 'N’w')),
+    (('дүш.', 'сиш.', 'чәр.', 'пәнҗ.', 'җом.', 'шим.', 'якш.'), ('гыйн.', 'фев.', 'мар.', 'апр.', 'май', 'июнь', 'июль', 'авг.', 'сент.', 'окт.', 'нояб.', 'дек.')),
+    (('Ayn', 'Asn', 'Akr', 'Akw', 'Asm', 'Asḍ', 'Asa'), ('Yen', 'Yeb', 'Mar', 'Ibr', 'May', 'Yun', 'Yul', 'Ɣuc', 'Cut', 'Kṭu', 'Nwa', 'Duj')),
+    (('دۈ', 'سە', 'چا', 'پە', 'جۈ', 'شە', 'يە'), ('يانۋار', 'فېۋرال', 'مارت', 'ئاپرېل', 'ماي', 'ئىيۇن', 'ئىيۇل', 'ئاۋغۇست', 'سېنتەبىر', 'ئۆكتەبىر', 'نويابىر', 'دېكابىر')),
+    (('пн', 'вт', 'ср', 'чт', 'пт', 'сб', 'нд'), ('січ.', 'лют.', 'бер.', 'квіт.', 'трав.', 'черв.', 'лип.', 'серп.', 'вер.', 'жовт.', 'лист.', 'груд.')),
+    (('پیر', 'منگل', 'بدھ', 'جمعرات', 'جمعہ', 'ہفتہ', 'اتوار'), ('جنوری', 'فروری', 'مارچ', 'اپریل', 'مئی', 'جون', 'جولائی', 'اگست', 'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر')),
+    (('Dush', 'Sesh', 'Chor', 'Pay', 'Jum', 'Shan', 'Yak'), ('Yan', 'Fev', 'Mar', 'Apr', 'May', 'Iyn', 'Iyl', 'Avg', 'Sen', 'Okt', 'Noy', 'Dek')),
+    (('د.', 'س.', 'چ.', 'پ.', 'ج.', 'ش.', 'ی.'), ('جنو', 'فبر', 'مار', 'اپر', 'می', 'جون', 'جول', 'اگس', 'سپت', 'اکت', 'نوم', 'دسم')),
+    (('душ', 'сеш', 'чор', 'пай', 'жум', 'шан', 'якш'), ('янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен', 'окт', 'ноя', 'дек')),
+    (('ꗳꗡꘉ', 'ꕚꕞꕚ', 'ꕉꕞꕒ', 'ꕉꔤꕆꕢ', 'ꕉꔤꕀꕮ', 'ꔻꔬꔳ', 'ꕞꕌꔵ'), ('ꖨꖕꔞ', 'ꕒꕡ', 'ꕾꖺ', 'ꖢꖕ', 'ꖑꕱ', 'ꖱꘋ', 'ꖱꕞ', 'ꗛꔕ', 'ꕢꕌ', 'ꕭꖃ', 'ꔞꘋ', 'ꖨꖕꗏ')),
+    (('tɛɛnɛɛ', 'talata', 'alaba', 'aimisa', 'aijima', 'siɓiti', 'lahadi'), ('M01', 'M02', 'M03', 'M04', 'M05', 'M06', 'M07', 'M08', 'M09', 'M10', 'M11', 'M12')),
+    (('Mus', 'Vhi', 'Rar', 'Ṋa', 'Ṱan', 'Mug', 'Swo'), ('Pha', 'Luh', 'Ṱhf', 'Lam', 'Shu', 'Lwi', 'Lwa', 'Ṱha', 'Khu', 'Tsh', 'Ḽar', 'Nye')),
+    (('lun', 'mar', 'mer', 'zob', 'vèn', 'sab', 'dom'), ('jen', 'feb', 'mar', 'apr', 'maj', 'jug', 'luj', 'ago', 'set', 'oto', 'nov', 'dez')),
+    (('Th 2', 'Th 3', 'Th 4', 'Th 5', 'Th 6', 'Th 7', 'CN'), ('Tháng 1', 'Tháng 2', 'Tháng 3', 'Tháng 4', 'Tháng 5', 'Tháng 6', 'Tháng 7', 'Tháng 8', 'Tháng 9', 'Tháng 10', 'Tháng 11', 'Tháng 12')),
+    (('nihiku noolempwa', 'namaanli', 'namararu', 'namaxexe', 'namathanu', 'esaabadu', 'ettiminku'), ('janeiru', 'fevereiru', 'marsu', 'abril', 'maiu', 'junyu', 'julyu', 'agostu', 'setembru', 'outubru', 'novembru', 'dezembru')),
+    (('mu.', 'tu.', 've.', 'dö.', 'fr.', 'zä.', 'su.'), ('yan', 'feb', 'mäz', 'prl', 'may', 'yun', 'yul', 'gst', 'set', 'tob', 'nov', 'dek')),
+    (('Män', 'Ziš', 'Mit', 'Fró', 'Fri', 'Sam', 'Sun'), ('Jen', 'Hor', 'Mär', 'Abr', 'Mei', 'Brá', 'Hei', 'Öig', 'Her', 'Wím', 'Win', 'Chr')),
+    (('ሳይኖ', 'ማቆሳኛ', 'አሩዋ', 'ሃሙሳ', 'አርባ', 'ቄራ', 'ወጋ'), ('ጃንዩ', 'ፌብሩ', 'ማርች', 'ኤፕረ', 'ሜይ', 'ጁን', 'ጁላይ', 'ኦገስ', 'ሴፕቴ', 'ኦክተ', 'ኖቬም', 'ዲሴም')),
+    (('Alt', 'Tal', 'Àla', 'Alx', 'Àjj', 'Ase', 'Dib'), ('Sam', 'Few', 'Mar', 'Awr', 'Mee', 'Suw', 'Sul', 'Ut', 'Sàt', 'Okt', 'Now', 'Des')),
+    (('Mvu', 'Lwesb', 'Tha', 'Sin', 'Hla', 'Mgq', 'Caw'), ('Jan', 'Feb', 'Mat', 'Epr', 'Mey', 'Jun', 'Jul', 'Aga', 'Sep', 'Okt', 'Nov', 'Dis')),
+    (('सोआर', 'मंगल', 'बुध', 'वीर', 'शुक्कर', 'शनि', 'तोआर'), ('जन॰', 'फ़र॰', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुल॰', 'अग॰', 'सित॰', 'अक्तू॰', 'नव॰', 'दिस॰')),
+    (('Bala', 'Kubi', 'Kusa', 'Kuna', 'Kuta', 'Muka', 'Sabi'), ('Jan', 'Feb', 'Mar', 'Apu', 'Maa', 'Juu', 'Jul', 'Agu', 'Seb', 'Oki', 'Nov', 'Des')),
+    (('md', 'mw', 'et', 'kl', 'fl', 'ss', 'sd'), ('o.1', 'o.2', 'o.3', 'o.4', 'o.5', 'o.6', 'o.7', 'o.8', 'o.9', 'o.10', 'o.11', 'o.12')),
+    (('מאָנטיק', 'דינסטיק', 'מיטוואך', 'דאנערשטיק', 'פֿרײַטיק', 'שבת', 'זונטיק'), ('יאַנ', 'פֿעב', 'מערץ', 'אַפּר', 'מיי', 'יוני', 'יולי', 'אויג', 'סעפּ', 'אקט', 'נאוו', 'דעצ')),
+    (('Ajé', 'Ìsẹ́gun', 'Ọjọ́rú', 'Ọjọ́bọ', 'Ẹtì', 'Àbámẹ́ta', 'Àìkú'), ('Oṣù Ṣẹ́rẹ́', 'Oṣù Èrèlè', 'Oṣù Ẹrẹ̀nà', 'Oṣù Ìgbé', 'Oṣù Ẹ̀bibi', 'Oṣù Òkúdu', 'Oṣù Agẹmọ', 'Oṣù Ògún', 'Oṣù Owewe', 'Oṣù Ọ̀wàrà', 'Oṣù Bélú', 'Oṣù Ọ̀pẹ̀')),
+    (('Ajé', 'Ìsɛ́gun', 'Ɔjɔ́rú', 'Ɔjɔ́bɔ', 'Ɛtì', 'Àbámɛ́ta', 'Àìkú'), ('Oshù Shɛ́rɛ́', 'Oshù Èrèlè', 'Oshù Ɛrɛ̀nà', 'Oshù Ìgbé', 'Oshù Ɛ̀bibi', 'Oshù Òkúdu', 'Oshù Agɛmɔ', 'Oshù Ògún', 'Oshù Owewe', 'Oshù Ɔ̀wàrà', 'Oshù Bélú', 'Oshù Ɔ̀pɛ̀')),
+    (('mur', 'mmk', 'mms', 'sup', 'yuk', 'sau', 'mit'), ('ye', 'mk', 'ms', 'id', 'pu', 'py', 'pm', 'ps', 'pi', 'yp', 'yy', 'ym')),
+    (('星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日'), ('1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月', '11月', '12月')),
+    (('周一', '周二', '周三', '周四', '周五', '周六', '周日'), ('1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月', '11月', '12月')),
+    (('singhgizit', 'singhgizngeih', 'singhgizsam', 'singhgizseiq', 'singhgizhaj', 'singhgizroek', 'ngoenzsinghgiz'), ('ndwenit', 'ndwenngeih', 'ndwensam', 'ndwenseiq', 'ndwenngux', 'ndwenloeg', 'ndwencaet', 'ndwenbet', 'ndwengouj', 'ndwencib', 'ndwencib’it', 'ndwencibngeih')),
+    (('週一', '週二', '週三', '週四', '週五', '週六', '週日'), ('1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月', '11月', '12月')),
+    (('Mso', 'Bil', 'Tha', 'Sin', 'Hla', 'Mgq', 'Son'), ('Jan', 'Feb', 'Mas', 'Eph', 'Mey', 'Jun', 'Jul', 'Aga', 'Sep', 'Okt', 'Nov', 'Dis')),
+)
+LOCALES = {
+    'aa': 0,
+    'aa_DJ': 0,
+    'aa_ER': 0,
+    'aa_ET': 0,
+    'ab': 1,
+    'ab_GE': 1,
+    'af': 2,
+    'af_NA': 2,
+    'af_ZA': 2,
+    'agq': 3,
+    'agq_CM': 3,
+    'ak': 4,
+    'ak_GH': 4,
+    'am': 5,
+    'am_ET': 5,
+    'an': 6,
+    'an_ES': 6,
+    'ann': 7,
+    'ann_NG': 7,
+    'apc': 8,
+    'apc_SY': 8,
+    'ar': 9,
+    'ar_001': 9,
+    'ar_AE': 9,
+    'ar_BH': 9,
+    'ar_DJ': 9,
+    'ar_DZ': 10,
+    'ar_EG': 9,
+    'ar_EH': 9,
+    'ar_ER': 9,
+    'ar_IL': 9,
+    'ar_IQ': 11,
+    'ar_JO': 11,
+    'ar_KM': 9,
+    'ar_KW': 9,
+    'ar_LB': 11,
+    'ar_LY': 9,
+    'ar_MA': 12,
+    'ar_MR': 13,
+    'ar_OM': 9,
+    'ar_PS': 11,
+    'ar_QA': 9,
+    'ar_SA': 9,
+    'ar_SD': 9,
+    'ar_SO': 9,
+    'ar_SS': 9,
+    'ar_SY': 11,
+    'ar_TD': 9,
+    'ar_TN': 10,
+    'ar_YE': 9,
+    'arn': 7,
+    'arn_CL': 7,
+    'as': 14,
+    'as_IN': 14,
+    'asa': 15,
+    'asa_TZ': 15,
+    'ast': 16,
+    'ast_ES': 16,
+    'az': 17,
+    'az_Arab': 7,
+    'az_Arab_IQ': 7,
+    'az_Arab_IR': 7,
+    'az_Arab_TR': 7,
+    'az_Cyrl': 18,
+    'az_Cyrl_AZ': 18,
+    'az_Latn': 17,
+    'az_Latn_AZ': 17,
+    'ba': 7,
+    'ba_RU': 7,
+    'bal': 19,
+    'bal_Arab': 19,
+    'bal_Arab_PK': 19,
+    'bal_Latn': 20,
+    'bal_Latn_PK': 20,
+    'bas': 21,
+    'bas_CM': 21,
+    'be': 22,
+    'be_BY': 22,
+    'be_TARASK': 23,
+    'bem': 24,
+    'bem_ZM': 24,
+    'bew': 25,
+    'bew_ID': 25,
+    'bez': 26,
+    'bez_TZ': 26,
+    'bg': 27,
+    'bg_BG': 27,
+    'bgc': 28,
+    'bgc_IN': 28,
+    'bgn': 7,
+    'bgn_AE': 7,
+    'bgn_AF': 7,
+    'bgn_IR': 7,
+    'bgn_OM': 7,
+    'bgn_PK': 7,
+    'bho': 29,
+    'bho_IN': 29,
+    'blo': 30,
+    'blo_BJ': 30,
+    'blt': 7,
+    'blt_VN': 7,
+    'bm': 31,
+    'bm_ML': 31,
+    'bm_Nkoo': 7,
+    'bm_Nkoo_ML': 7,
+    'bn': 32,
+    'bn_BD': 32,
+    'bn_IN': 33,
+    'bo': 34,
+    'bo_CN': 34,
+    'bo_IN': 34,
+    'br': 35,
+    'br_FR': 35,
+    'brx': 36,
+    'brx_IN': 36,
+    'bs': 37,
+    'bs_Cyrl': 38,
+    'bs_Cyrl_BA': 38,
+    'bs_Latn': 37,
+    'bs_Latn_BA': 37,
+    'bss': 7,
+    'bss_CM': 7,
+    'byn': 39,
+    'byn_ER': 39,
+    'ca': 40,
+    'ca_AD': 40,
+    'ca_ES': 40,
+    'ca_ES_VALENCIA': 40,
+    'ca_FR': 40,
+    'ca_IT': 40,
+    'cad': 41,
+    'cad_US': 41,
+    'cch': 42,
+    'cch_NG': 42,
+    'ccp': 43,
+    'ccp_BD': 43,
+    'ccp_IN': 43,
+    'ce': 44,
+    'ce_RU': 44,
+    'ceb': 45,
+    'ceb_PH': 45,
+    'cgg': 46,
+    'cgg_UG': 46,
+    'cho': 7,
+    'cho_US': 7,
+    'chr': 47,
+    'chr_US': 47,
+    'cic': 48,
+    'cic_US': 48,
+    'ckb': 49,
+    'ckb_IQ': 49,
+    'ckb_IR': 49,
+    'co': 50,
+    'co_FR': 50,
+    'cop': 7,
+    'cop_EG': 7,
+    'cs': 51,
+    'cs_CZ': 51,
+    'csw': 52,
+    'csw_CA': 52,
+    'cu': 53,
+    'cu_RU': 53,
+    'cv': 54,
+    'cv_RU': 54,
+    'cy': 55,
+    'cy_GB': 55,
+    'da': 56,
+    'da_DK': 56,
+    'da_GL': 56,
+    'dav': 57,
+    'dav_KE': 57,
+    'de': 58,
+    'de_AT': 59,
+    'de_BE': 58,
+    'de_CH': 58,
+    'de_DE': 58,
+    'de_IT': 59,
+    'de_LI': 58,
+    'de_LU': 58,
+    'dje': 60,
+    'dje_NE': 60,
+    'doi': 61,
+    'doi_IN': 61,
+    'dsb': 62,
+    'dsb_DE': 62,
+    'dua': 63,
+    'dua_CM': 63,
+    'dv': 7,
+    'dv_MV': 7,
+    'dyo': 64,
+    'dyo_SN': 64,
+    'dz': 65,
+    'dz_BT': 65,
+    'ebu': 66,
+    'ebu_KE': 66,
+    'ee': 67,
+    'ee_GH': 67,
+    'ee_TG': 67,
+    'el': 68,
+    'el_CY': 68,
+    'el_GR': 68,
+    'el_POLYTON': 68,
+    'en': 69,
+    'en_001': 70,
+    'en_150': 70,
+    'en_AE': 69,
+    'en_AG': 70,
+    'en_AI': 70,
+    'en_AS': 69,
+    'en_AT': 70,
+    'en_AU': 71,
+    'en_BB': 70,
+    'en_BE': 70,
+    'en_BI': 69,
+    'en_BM': 70,
+    'en_BS': 70,
+    'en_BW': 70,
+    'en_BZ': 70,
+    'en_CA': 69,
+    'en_CC': 70,
+    'en_CH': 70,
+    'en_CK': 70,
+    'en_CM': 70,
+    'en_CX': 70,
+    'en_CY': 70,
+    'en_CZ': 70,
+    'en_DE': 70,
+    'en_DG': 70,
+    'en_DK': 70,
+    'en_DM': 70,
+    'en_Dsrt': 72,
+    'en_Dsrt_US': 72,
+    'en_ER': 70,
+    'en_ES': 70,
+    'en_FI': 70,
+    'en_FJ': 70,
+    'en_FK': 70,
+    'en_FM': 70,
+    'en_FR': 70,
+    'en_GB': 70,
+    'en_GD': 70,
+    'en_GG': 70,
+    'en_GH': 70,
+    'en_GI': 70,
+    'en_GM': 70,
+    'en_GS': 70,
+    'en_GU': 69,
+    'en_GY': 70,
+    'en_HK': 70,
+    'en_HU': 70,
+    'en_ID': 70,
+    'en_IE': 70,
+    'en_IL': 70,
+    'en_IM': 70,
+    'en_IN': 70,
+    'en_IO': 70,
+    'en_IT': 70,
+    'en_JE': 70,
+    'en_JM': 70,
+    'en_KE': 70,
+    'en_KI': 70,
+    'en_KN': 70,
+    'en_KY': 70,
+    'en_LC': 70,
+    'en_LR': 70,
+    'en_LS': 70,
+    'en_MG': 70,
+    'en_MH': 69,
+    'en_MO': 70,
+    'en_MP': 69,
+    'en_MS': 70,
+    'en_MT': 70,
+    'en_MU': 70,
+    'en_MV': 70,
+    'en_MW': 70,
+    'en_MY': 70,
+    'en_NA': 70,
+    'en_NF': 70,
+    'en_NG': 70,
+    'en_NL': 70,
+    'en_NO': 70,
+    'en_NR': 70,
+    'en_NU': 70,
+    'en_NZ': 70,
+    'en_PG': 70,
+    'en_PH': 69,
+    'en_PK': 70,
+    'en_PL': 70,
+    'en_PN': 70,
+    'en_PR': 69,
+    'en_PT': 70,
+    'en_PW': 70,
+    'en_RO': 70,
+    'en_RW': 70,
+    'en_SB': 70,
+    'en_SC': 70,
+    'en_SD': 70,
+    'en_SE': 70,
+    'en_SG': 70,
+    'en_SH': 70,
+    'en_SI': 70,
+    'en_SK': 70,
+    'en_SL': 70,
+    'en_SS': 70,
+    'en_SX': 70,
+    'en_SZ': 70,
+    'en_Shaw': 73,
+    'en_Shaw_GB': 73,
+    'en_TC': 70,
+    'en_TK': 70,
+    'en_TO': 70,
+    'en_TT': 70,
+    'en_TV': 70,
+    'en_TZ': 70,
+    'en_UG': 70,
+    'en_UM': 69,
+    'en_US': 69,
+    'en_US_POSIX': 69,
+    'en_VC': 70,
+    'en_VG': 70,
+    'en_VI': 69,
+    'en_VU': 70,
+    'en_WS': 70,
+    'en_ZA': 70,
+    'en_ZM': 70,
+    'en_ZW': 70,
+    'eo': 74,
+    'eo_001': 74,
+    'es': 75,
+    'es_419': 75,
+    'es_AR': 75,
+    'es_BO': 75,
+    'es_BR': 75,
+    'es_BZ': 75,
+    'es_CL': 76,
+    'es_CO': 76,
+    'es_CR': 75,
+    'es_CU': 75,
+    'es_DO': 75,
+    'es_EA': 75,
+    'es_EC': 75,
+    'es_ES': 75,
+    'es_GQ': 75,
+    'es_GT': 75,
+    'es_HN': 75,
+    'es_IC': 75,
+    'es_MX': 77,
+    'es_NI': 75,
+    'es_PA': 75,
+    'es_PE': 78,
+    'es_PH': 75,
+    'es_PR': 75,
+    'es_PY': 76,
+    'es_SV': 75,
+    'es_US': 75,
+    'es_UY': 78,
+    'es_VE': 76,
+    'et': 79,
+    'et_EE': 79,
+    'eu': 80,
+    'eu_ES': 80,
+    'ewo': 81,
+    'ewo_CM': 81,
+    'fa': 82,
+    'fa_AF': 83,
+    'fa_IR': 82,
+    'ff': 84,
+    'ff_Adlm': 85,
+    'ff_Adlm_BF': 85,
+    'ff_Adlm_CM': 85,
+    'ff_Adlm_GH': 85,
+    'ff_Adlm_GM': 85,
+    'ff_Adlm_GN': 85,
+    'ff_Adlm_GW': 85,
+    'ff_Adlm_LR': 85,
+    'ff_Adlm_MR': 85,
+    'ff_Adlm_NE': 85,
+    'ff_Adlm_NG': 85,
+    'ff_Adlm_SL': 85,
+    'ff_Adlm_SN': 85,
+    'ff_Latn': 84,
+    'ff_Latn_BF': 84,
+    'ff_Latn_CM': 84,
+    'ff_Latn_GH': 84,
+    'ff_Latn_GM': 84,
+    'ff_Latn_GN': 84,
+    'ff_Latn_GW': 84,
+    'ff_Latn_LR': 84,
+    'ff_Latn_MR': 84,
+    'ff_Latn_NE': 84,
+    'ff_Latn_NG': 84,
+    'ff_Latn_SL': 84,
+    'ff_Latn_SN': 84,
+    'fi': 86,
+    'fi_FI': 86,
+    'fil': 87,
+    'fil_PH': 87,
+    'fo': 88,
+    'fo_DK': 88,
+    'fo_FO': 88,
+    'fr': 89,
+    'fr_BE': 89,
+    'fr_BF': 89,
+    'fr_BI': 89,
+    'fr_BJ': 89,
+    'fr_BL': 89,
+    'fr_CA': 90,
+    'fr_CD': 89,
+    'fr_CF': 89,
+    'fr_CG': 89,
+    'fr_CH': 89,
+    'fr_CI': 89,
+    'fr_CM': 89,
+    'fr_DJ': 89,
+    'fr_DZ': 89,
+    'fr_FR': 89,
+    'fr_GA': 89,
+    'fr_GF': 89,
+    'fr_GN': 89,
+    'fr_GP': 89,
+    'fr_GQ': 89,
+    'fr_HT': 89,
+    'fr_KM': 89,
+    'fr_LU': 89,
+    'fr_MA': 91,
+    'fr_MC': 89,
+    'fr_MF': 89,
+    'fr_MG': 89,
+    'fr_ML': 89,
+    'fr_MQ': 89,
+    'fr_MR': 89,
+    'fr_MU': 89,
+    'fr_NC': 89,
+    'fr_NE': 89,
+    'fr_PF': 89,
+    'fr_PM': 89,
+    'fr_RE': 89,
+    'fr_RW': 89,
+    'fr_SC': 89,
+    'fr_SN': 89,
+    'fr_SY': 89,
+    'fr_TD': 89,
+    'fr_TG': 89,
+    'fr_TN': 89,
+    'fr_VU': 89,
+    'fr_WF': 89,
+    'fr_YT': 89,
+    'frr': 92,
+    'frr_DE': 92,
+    'fur': 93,
+    'fur_IT': 93,
+    'fy': 94,
+    'fy_NL': 94,
+    'ga': 95,
+    'ga_GB': 95,
+    'ga_IE': 95,
+    'gaa': 96,
+    'gaa_GH': 96,
+    'gd': 97,
+    'gd_GB': 97,
+    'gez': 98,
+    'gez_ER': 98,
+    'gez_ET': 98,
+    'gl': 99,
+    'gl_ES': 99,
+    'gn': 100,
+    'gn_PY': 100,
+    'gsw': 101,
+    'gsw_CH': 101,
+    'gsw_FR': 101,
+    'gsw_LI': 101,
+    'gu': 102,
+    'gu_IN': 102,
+    'guz': 103,
+    'guz_KE': 103,
+    'gv': 104,
+    'gv_IM': 104,
+    'ha': 105,
+    'ha_Arab': 106,
+    'ha_Arab_NG': 106,
+    'ha_Arab_SD': 106,
+    'ha_GH': 105,
+    'ha_NE': 105,
+    'ha_NG': 105,
+    'haw': 107,
+    'haw_US': 107,
+    'he': 108,
+    'he_IL': 108,
+    'hi': 109,
+    'hi_IN': 109,
+    'hi_Latn': 110,
+    'hi_Latn_IN': 110,
+    'hnj': 111,
+    'hnj_Hmnp': 111,
+    'hnj_Hmnp_US': 111,
+    'hr': 112,
+    'hr_BA': 112,
+    'hr_HR': 112,
+    'hsb': 113,
+    'hsb_DE': 113,
+    'ht': 89,
+    'ht_HT': 89,
+    'hu': 114,
+    'hu_HU': 114,
+    'hy': 115,
+    'hy_AM': 115,
+    'ia': 116,
+    'ia_001': 116,
+    'id': 117,
+    'id_ID': 117,
+    'ie': 118,
+    'ie_EE': 118,
+    'ig': 119,
+    'ig_NG': 119,
+    'ii': 120,
+    'ii_CN': 120,
+    'io': 7,
+    'io_001': 7,
+    'is': 121,
+    'is_IS': 121,
+    'it': 122,
+    'it_CH': 122,
+    'it_IT': 122,
+    'it_SM': 122,
+    'it_VA': 122,
+    'iu': 123,
+    'iu_CA': 123,
+    'iu_Latn': 7,
+    'iu_Latn_CA': 7,
+    'ja': 124,
+    'ja_JP': 124,
+    'jbo': 7,
+    'jbo_001': 7,
+    'jgo': 125,
+    'jgo_CM': 125,
+    'jmc': 126,
+    'jmc_TZ': 126,
+    'jv': 127,
+    'jv_ID': 127,
+    'ka': 128,
+    'ka_GE': 128,
+    'kaa': 129,
+    'kaa_Cyrl': 129,
+    'kaa_Cyrl_UZ': 129,
+    'kaa_Latn': 7,
+    'kaa_Latn_UZ': 7,
+    'kab': 130,
+    'kab_DZ': 130,
+    'kaj': 131,
+    'kaj_NG': 131,
+    'kam': 132,
+    'kam_KE': 132,
+    'kcg': 133,
+    'kcg_NG': 133,
+    'kde': 134,
+    'kde_TZ': 134,
+    'kea': 135,
+    'kea_CV': 135,
+    'ken': 7,
+    'ken_CM': 7,
+    'kgp': 136,
+    'kgp_BR': 136,
+    'khq': 137,
+    'khq_ML': 137,
+    'ki': 138,
+    'ki_KE': 138,
+    'kk': 139,
+    'kk_Arab': 140,
+    'kk_Arab_CN': 140,
+    'kk_Cyrl': 139,
+    'kk_Cyrl_KZ': 139,
+    'kk_KZ': 139,
+    'kkj': 141,
+    'kkj_CM': 141,
+    'kl': 142,
+    'kl_GL': 142,
+    'kln': 143,
+    'kln_KE': 143,
+    'km': 144,
+    'km_KH': 144,
+    'kn': 145,
+    'kn_IN': 145,
+    'ko': 146,
+    'ko_CN': 146,
+    'ko_KP': 146,
+    'ko_KR': 146,
+    'kok': 147,
+    'kok_Deva': 147,
+    'kok_Deva_IN': 147,
+    'kok_Latn': 148,
+    'kok_Latn_IN': 148,
+    'kpe': 7,
+    'kpe_GN': 7,
+    'kpe_LR': 7,
+    'ks': 149,
+    'ks_Arab': 149,
+    'ks_Arab_IN': 149,
+    'ks_Deva': 150,
+    'ks_Deva_IN': 150,
+    'ksb': 151,
+    'ksb_TZ': 151,
+    'ksf': 152,
+    'ksf_CM': 152,
+    'ksh': 153,
+    'ksh_DE': 153,
+    'ku': 154,
+    'ku_TR': 154,
+    'kw': 155,
+    'kw_GB': 155,
+    'kxv': 156,
+    'kxv_Deva': 157,
+    'kxv_Deva_IN': 157,
+    'kxv_Latn': 156,
+    'kxv_Latn_IN': 156,
+    'kxv_Orya': 158,
+    'kxv_Orya_IN': 158,
+    'kxv_Telu': 159,
+    'kxv_Telu_IN': 159,
+    'ky': 160,
+    'ky_KG': 160,
+    'la': 161,
+    'la_VA': 161,
+    'lag': 162,
+    'lag_TZ': 162,
+    'lb': 163,
+    'lb_LU': 163,
+    'lg': 164,
+    'lg_UG': 164,
+    'lij': 165,
+    'lij_IT': 165,
+    'lkt': 166,
+    'lkt_US': 166,
+    'lld': 167,
+    'lld_IT': 167,
+    'lmo': 168,
+    'lmo_IT': 168,
+    'ln': 169,
+    'ln_AO': 169,
+    'ln_CD': 169,
+    'ln_CF': 169,
+    'ln_CG': 169,
+    'lo': 170,
+    'lo_LA': 170,
+    'lrc': 171,
+    'lrc_IQ': 171,
+    'lrc_IR': 171,
+    'lt': 172,
+    'lt_LT': 172,
+    'ltg': 173,
+    'ltg_LV': 173,
+    'lu': 174,
+    'lu_CD': 174,
+    'luo': 175,
+    'luo_KE': 175,
+    'luy': 176,
+    'luy_KE': 176,
+    'lv': 177,
+    'lv_LV': 177,
+    'mai': 178,
+    'mai_IN': 178,
+    'mas': 179,
+    'mas_KE': 179,
+    'mas_TZ': 179,
+    'mdf': 7,
+    'mdf_RU': 7,
+    'mer': 180,
+    'mer_KE': 180,
+    'mfe': 181,
+    'mfe_MU': 181,
+    'mg': 182,
+    'mg_MG': 182,
+    'mgh': 183,
+    'mgh_MZ': 183,
+    'mgo': 184,
+    'mgo_CM': 184,
+    'mhn': 7,
+    'mhn_IT': 7,
+    'mi': 185,
+    'mi_NZ': 185,
+    'mic': 7,
+    'mic_CA': 7,
+    'mk': 186,
+    'mk_MK': 186,
+    'ml': 187,
+    'ml_IN': 187,
+    'mn': 188,
+    'mn_MN': 188,
+    'mn_Mong': 7,
+    'mn_Mong_CN': 7,
+    'mn_Mong_MN': 189,
+    'mni': 190,
+    'mni_Beng': 190,
+    'mni_Beng_IN': 190,
+    'mni_Mtei': 7,
+    'mni_Mtei_IN': 7,
+    'moh': 7,
+    'moh_CA': 7,
+    'mr': 191,
+    'mr_IN': 191,
+    'ms': 192,
+    'ms_Arab': 193,
+    'ms_Arab_BN': 193,
+    'ms_Arab_MY': 193,
+    'ms_BN': 192,
+    'ms_ID': 192,
+    'ms_MY': 192,
+    'ms_SG': 192,
+    'mt': 194,
+    'mt_MT': 194,
+    'mua': 195,
+    'mua_CM': 195,
+    'mus': 196,
+    'mus_US': 196,
+    'my': 197,
+    'my_MM': 197,
+    'myv': 198,
+    'myv_RU': 198,
+    'mzn': 199,
+    'mzn_IR': 199,
+    'naq': 200,
+    'naq_NA': 200,
+    'nb': 201,
+    'nb_NO': 201,
+    'nb_SJ': 201,
+    'nd': 202,
+    'nd_ZW': 202,
+    'nds': 203,
+    'nds_DE': 203,
+    'nds_NL': 203,
+    'ne': 204,
+    'ne_IN': 204,
+    'ne_NP': 204,
+    'nl': 205,
+    'nl_AW': 205,
+    'nl_BE': 205,
+    'nl_BQ': 205,
+    'nl_CW': 205,
+    'nl_NL': 205,
+    'nl_SR': 205,
+    'nl_SX': 205,
+    'nmg': 206,
+    'nmg_CM': 206,
+    'nn': 207,
+    'nn_NO': 207,
+    'nnh': 208,
+    'nnh_CM': 208,
+    'no': 201,
+    'nqo': 209,
+    'nqo_GN': 209,
+    'nr': 210,
+    'nr_ZA': 210,
+    'nso': 211,
+    'nso_ZA': 211,
+    'nus': 212,
+    'nus_SS': 212,
+    'nv': 7,
+    'nv_US': 7,
+    'ny': 213,
+    'ny_MW': 213,
+    'nyn': 46,
+    'nyn_UG': 46,
+    'oc': 214,
+    'oc_ES': 215,
+    'oc_FR': 214,
+    'om': 216,
+    'om_ET': 216,
+    'om_KE': 216,
+    'or': 217,
+    'or_IN': 217,
+    'os': 218,
+    'os_GE': 218,
+    'os_RU': 218,
+    'osa': 219,
+    'osa_US': 219,
+    'pa': 220,
+    'pa_Arab': 221,
+    'pa_Arab_PK': 221,
+    'pa_Guru': 220,
+    'pa_Guru_IN': 220,
+    'pap': 222,
+    'pap_AW': 222,
+    'pap_CW': 222,
+    'pcm': 223,
+    'pcm_NG': 223,
+    'pis': 224,
+    'pis_SB': 224,
+    'pl': 225,
+    'pl_PL': 225,
+    'prg': 226,
+    'prg_PL': 226,
+    'ps': 227,
+    'ps_AF': 227,
+    'ps_PK': 227,
+    'pt': 228,
+    'pt_AO': 229,
+    'pt_BR': 228,
+    'pt_CH': 229,
+    'pt_CV': 229,
+    'pt_GQ': 229,
+    'pt_GW': 229,
+    'pt_LU': 229,
+    'pt_MO': 229,
+    'pt_MZ': 229,
+    'pt_PT': 229,
+    'pt_ST': 229,
+    'pt_TL': 229,
+    'qu': 230,
+    'qu_BO': 230,
+    'qu_EC': 230,
+    'qu_PE': 230,
+    'quc': 7,
+    'quc_GT': 7,
+    'raj': 231,
+    'raj_IN': 231,
+    'rhg': 7,
+    'rhg_Rohg': 7,
+    'rhg_Rohg_BD': 7,
+    'rhg_Rohg_MM': 7,
+    'rif': 232,
+    'rif_MA': 232,
+    'rm': 233,
+    'rm_CH': 233,
+    'rn': 234,
+    'rn_BI': 234,
+    'ro': 235,
+    'ro_MD': 236,
+    'ro_RO': 235,
+    'rof': 237,
+    'rof_TZ': 237,
+    'ru': 238,
+    'ru_BY': 238,
+    'ru_KG': 238,
+    'ru_KZ': 238,
+    'ru_MD': 238,
+    'ru_RU': 238,
+    'ru_UA': 238,
+    'rw': 239,
+    'rw_RW': 239,
+    'rwk': 126,
+    'rwk_TZ': 126,
+    'sa': 240,
+    'sa_IN': 240,
+    'sah': 241,
+    'sah_RU': 241,
+    'saq': 242,
+    'saq_KE': 242,
+    'sat': 243,
+    'sat_Deva': 7,
+    'sat_Deva_IN': 7,
+    'sat_Olck': 243,
+    'sat_Olck_IN': 243,
+    'sbp': 244,
+    'sbp_TZ': 244,
+    'sc': 245,
+    'sc_IT': 245,
+    'scn': 246,
+    'scn_IT': 246,
+    'sd': 247,
+    'sd_Arab': 247,
+    'sd_Arab_PK': 247,
+    'sd_Deva': 248,
+    'sd_Deva_IN': 248,
+    'sdh': 7,
+    'sdh_IQ': 7,
+    'sdh_IR': 7,
+    'se': 249,
+    'se_FI': 250,
+    'se_NO': 249,
+    'se_SE': 249,
+    'seh': 251,
+    'seh_MZ': 251,
+    'ses': 60,
+    'ses_ML': 60,
+    'sg': 252,
+    'sg_CF': 252,
+    'shi': 253,
+    'shi_Latn': 254,
+    'shi_Latn_MA': 254,
+    'shi_Tfng': 253,
+    'shi_Tfng_MA': 253,
+    'shn': 7,
+    'shn_MM': 7,
+    'shn_TH': 7,
+    'si': 255,
+    'si_LK': 255,
+    'sid': 256,
+    'sid_ET': 256,
+    'sk': 257,
+    'sk_SK': 257,
+    'skr': 258,
+    'skr_PK': 258,
+    'sl': 259,
+    'sl_SI': 259,
+    'sma': 7,
+    'sma_NO': 7,
+    'sma_SE': 7,
+    'smj': 7,
+    'smj_NO': 7,
+    'smj_SE': 7,
+    'smn': 260,
+    'smn_FI': 260,
+    'sms': 7,
+    'sms_FI': 7,
+    'sn': 261,
+    'sn_ZW': 261,
+    'so': 262,
+    'so_DJ': 262,
+    'so_ET': 262,
+    'so_KE': 262,
+    'so_SO': 262,
+    'sq': 263,
+    'sq_AL': 263,
+    'sq_MK': 263,
+    'sq_XK': 263,
+    'sr': 264,
+    'sr_Cyrl': 264,
+    'sr_Cyrl_BA': 265,
+    'sr_Cyrl_ME': 266,
+    'sr_Cyrl_RS': 264,
+    'sr_Cyrl_XK': 266,
+    'sr_Latn': 267,
+    'sr_Latn_BA': 268,
+    'sr_Latn_ME': 269,
+    'sr_Latn_RS': 267,
+    'sr_Latn_XK': 269,
+    'ss': 270,
+    'ss_SZ': 270,
+    'ss_ZA': 270,
+    'ssy': 271,
+    'ssy_ER': 271,
+    'st': 272,
+    'st_LS': 272,
+    'st_ZA': 272,
+    'su': 273,
+    'su_Latn': 273,
+    'su_Latn_ID': 273,
+    'sv': 274,
+    'sv_AX': 274,
+    'sv_FI': 274,
+    'sv_SE': 274,
+    'sw': 275,
+    'sw_CD': 275,
+    'sw_KE': 275,
+    'sw_TZ': 275,
+    'sw_UG': 275,
+    'syr': 276,
+    'syr_IQ': 276,
+    'syr_SY': 276,
+    'szl': 277,
+    'szl_PL': 277,
+    'ta': 278,
+    'ta_IN': 278,
+    'ta_LK': 278,
+    'ta_MY': 278,
+    'ta_SG': 278,
+    'te': 279,
+    'te_IN': 279,
+    'teo': 280,
+    'teo_KE': 280,
+    'teo_UG': 280,
+    'tg': 281,
+    'tg_TJ': 281,
+    'th': 282,
+    'th_TH': 282,
+    'ti': 283,
+    'ti_ER': 283,
+    'ti_ET': 283,
+    'tig': 284,
+    'tig_ER': 284,
+    'tk': 285,
+    'tk_TM': 285,
+    'tn': 286,
+    'tn_BW': 286,
+    'tn_ZA': 286,
+    'to': 287,
+    'to_TO': 287,
+    'tok': 288,
+    'tok_001': 288,
+    'tpi': 289,
+    'tpi_PG': 289,
+    'tr': 290,
+    'tr_CY': 290,
+    'tr_TR': 290,
+    'trv': 291,
+    'trv_TW': 291,
+    'trw': 292,
+    'trw_PK': 292,
+    'ts': 293,
+    'ts_ZA': 293,
+    'tt': 294,
+    'tt_RU': 294,
+    'twq': 60,
+    'twq_NE': 60,
+    'tyv': 7,
+    'tyv_RU': 7,
+    'tzm': 295,
+    'tzm_MA': 295,
+    'ug': 296,
+    'ug_CN': 296,
+    'uk': 297,
+    'uk_UA': 297,
+    'ur': 298,
+    'ur_IN': 298,
+    'ur_PK': 298,
+    'uz': 299,
+    'uz_Arab': 300,
+    'uz_Arab_AF': 300,
+    'uz_Cyrl': 301,
+    'uz_Cyrl_UZ': 301,
+    'uz_Latn': 299,
+    'uz_Latn_UZ': 299,
+    'vai': 302,
+    'vai_Latn': 303,
+    'vai_Latn_LR': 303,
+    'vai_Vaii': 302,
+    'vai_Vaii_LR': 302,
+    've': 304,
+    've_ZA': 304,
+    'vec': 305,
+    'vec_IT': 305,
+    'vi': 306,
+    'vi_VN': 306,
+    'vmw': 307,
+    'vmw_MZ': 307,
+    'vo': 308,
+    'vo_001': 308,
+    'vun': 126,
+    'vun_TZ': 126,
+    'wa': 7,
+    'wa_BE': 7,
+    'wae': 309,
+    'wae_CH': 309,
+    'wal': 310,
+    'wal_ET': 310,
+    'wbp': 7,
+    'wbp_AU': 7,
+    'wo': 311,
+    'wo_SN': 311,
+    'xh': 312,
+    'xh_ZA': 312,
+    'xnr': 313,
+    'xnr_IN': 313,
+    'xog': 314,
+    'xog_UG': 314,
+    'yav': 315,
+    'yav_CM': 315,
+    'yi': 316,
+    'yi_UA': 316,
+    'yo': 317,
+    'yo_BJ': 318,
+    'yo_NG': 317,
+    'yrl': 319,
+    'yrl_BR': 319,
+    'yrl_CO': 319,
+    'yrl_VE': 319,
+    'yue': 320,
+    'yue_Hans': 321,
+    'yue_Hans_CN': 321,
+    'yue_Hant': 320,
+    'yue_Hant_CN': 320,
+    'yue_Hant_HK': 320,
+    'yue_Hant_MO': 320,
+    'za': 322,
+    'za_CN': 322,
+    'zgh': 253,
+    'zgh_MA': 253,
+    'zh': 321,
+    'zh_Hans': 321,
+    'zh_Hans_CN': 321,
+    'zh_Hans_HK': 321,
+    'zh_Hans_MO': 321,
+    'zh_Hans_MY': 321,
+    'zh_Hans_SG': 321,
+    'zh_Hant': 323,
+    'zh_Hant_HK': 323,
+    'zh_Hant_MO': 323,
+    'zh_Hant_MY': 323,
+    'zh_Hant_TW': 323,
+    'zh_Latn': 7,
+    'zh_Latn_CN': 7,
+    'zu': 324,
+    'zu_ZA': 324,
+}
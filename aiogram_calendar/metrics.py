@@ -0,0 +1,94 @@
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict
+
+
+class CalendarObserver:
+    """Receives calendar events for metrics and tracing, every method is no-op by default
+
+    Pass instance to calendar as `observer`, without it calendar doesn't measure anything.
+    Methods are called synchronously on the hot path and should be cheap.
+    """
+
+    def on_action(self, act: str, seconds: float) -> None:
+        """Callback with action act was processed by process_selection in seconds"""
+
+    def on_render(self, view: str, seconds: float, cached: bool) -> None:
+        """Keyboard view ('start', 'month' or 'days') was returned, cached is True if it came from keyboard cache"""
+
+    def on_api_call(self, method: str, seconds: float) -> None:
+        """Calendar waited seconds for Telegram API method"""
+
+    def on_rejected(self, date: datetime, reason: str) -> None:
+        """Selected date was rejected, reason is 'min_date', 'max_date' or 'unavailable'"""
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "avg": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class MetricsAggregator(CalendarObserver):
+    "In-memory observer aggregating counts and timings, use snapshot() to export them"
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.actions: Dict[str, _Timing] = defaultdict(_Timing)
+        self.renders: Dict[str, _Timing] = defaultdict(_Timing)
+        self.api_calls: Dict[str, _Timing] = defaultdict(_Timing)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.rejected: Counter = Counter()
+
+    def on_action(self, act: str, seconds: float) -> None:
+        self.actions[act].add(seconds)
+
+    def on_render(self, view: str, seconds: float, cached: bool) -> None:
+        self.renders[view].add(seconds)
+        if cached:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def on_api_call(self, method: str, seconds: float) -> None:
+        self.api_calls[method].add(seconds)
+
+    def on_rejected(self, date: datetime, reason: str) -> None:
+        self.rejected[reason] += 1
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    def snapshot(self) -> dict:
+        """Returns collected metrics as plain dict"""
+        return {
+            "actions": {act: timing.as_dict() for act, timing in self.actions.items()},
+            "renders": {view: timing.as_dict() for view, timing in self.renders.items()},
+            "api_calls": {method: timing.as_dict() for method, timing in self.api_calls.items()},
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "rejected": dict(self.rejected),
+        }
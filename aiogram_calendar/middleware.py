@@ -0,0 +1,36 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from .common import get_user_locale
+from .registry import CalendarRegistry, default_registry
+
+
+class CalendarMiddleware(BaseMiddleware):
+    """Injects shared calendar for user's locale into handler data
+
+    Register it on router or dispatcher observers (e.g. `dp.message.middleware(CalendarMiddleware())`
+    and `dp.callback_query.middleware(...)`), handlers then receive calendar as `calendar` argument.
+
+    Parameters:
+    registry (CalendarRegistry): registry to take calendars from, shared default registry if None
+    data_key (str): name of handler argument to inject calendar as
+    options: keyword arguments identifying calendar in registry, e.g. min_date and max_date
+    """
+
+    def __init__(self, registry: CalendarRegistry = None, data_key: str = "calendar", **options) -> None:
+        self.registry = registry if registry is not None else default_registry
+        self.data_key = data_key
+        self.options = options
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        locale = await get_user_locale(user) if user else None
+        data[self.data_key] = self.registry.get(locale, **self.options)
+        return await handler(event, data)
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from typing import List, Optional, Set
+
+from .calendar import Calendar
+from .common import CalendarWindow
+from .keyboard import Button, Keyboard
+from .schemas import CalendarActions, highlight, packed
+
+logger = logging.getLogger(__name__)
+
+NAV_DAYS_FIRST_ROW = 2  # index of first row of days, after navigation and weekdays rows
+
+
+class NavigationCalendar(Calendar):
+    """Single screen calendar: days of month with month and year arrows, Cancel and Today buttons
+
+    Uses the same CalendarCallback schema and process_selection as the dialog Calendar, so both can't be
+    handled by one filter in the same bot. After every render previous and next months are rendered
+    in background (`prefetch=True`), so moving one month is answered from the keyboard cache.
+    """
+
+    days_view = "nav"
+    days_first_row = NAV_DAYS_FIRST_ROW
+
+    def __init__(self, *args, prefetch: bool = True, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefetch = prefetch
+        self._prefetching: Set[asyncio.Task] = set()  # strong references to running prefetch tasks
+
+    async def _start_keyboard(self, year: Optional[int], month: Optional[int], window: CalendarWindow) -> Keyboard:
+        today = window.today
+        if year is None or year <= 0:
+            year = today.year
+        if not month or month <= 0:
+            month = today.month
+        return await self._days_keyboard(*window.clamp(year, month), window)
+
+    async def _days_keyboard(self, year: int, month: int, window: CalendarWindow) -> Keyboard:
+        keyboard = await super()._days_keyboard(year, month, window)
+        if self.prefetch:
+            self._prefetch_adjacent(year, month, window)
+        return keyboard
+
+    def _prefetch_adjacent(self, year: int, month: int, window: CalendarWindow) -> None:
+        """Schedules background renders of previous and next months which aren't cached yet"""
+        if self.keyboard_cache is None:
+            return
+        today = window.today.date()
+        prev_month = window.clamp(*((year - 1, 12) if month == 1 else (year, month - 1)))
+        next_month = window.clamp(*((year + 1, 1) if month == 12 else (year, month + 1)))
+        for adjacent in {prev_month, next_month}:
+            if adjacent == (year, month):
+                continue
+            # with availability provider the task warms its cache as well, so it's scheduled anyway
+            key = self._cache_key((self.days_view,) + adjacent, window)
+            if self.availability is None and self.keyboard_cache.peek(key, today, self._labels) is not None:
+                continue
+            task = asyncio.ensure_future(self._prefetch_month(*adjacent, window))
+            self._prefetching.add(task)
+            task.add_done_callback(self._prefetching.discard)
+
+    async def _prefetch_month(self, year: int, month: int, window: CalendarWindow) -> None:
+        try:
+            # base class render, so prefetched months don't prefetch their neighbours in turn
+            keyboard = await Calendar._days_keyboard(self, year, month, window)
+            self._prebuild(keyboard)
+        except Exception:
+            logger.exception("Failed to prefetch calendar keyboard of %d-%02d", year, month)
+
+    def _build_days_kb(self, window: CalendarWindow, year: int, month: int) -> Keyboard:
+        today = window.today
+        now_month, now_year = today.month, today.year
+        is_current_month = now_month == month and now_year == year
+        blank = Button(text=" ", callback_data=self.ignore_callback)
+
+        kb = []
+        # First row - year and month arrows around month caption
+        nav_row = [
+            Button(
+                text="<<",
+                callback_data=packed(CalendarActions.prev_y, year, month, 1)
+            ) if year > window.min_year else blank,
+            Button(
+                text="<",
+                callback_data=packed(CalendarActions.prev_m, year, month, 1)
+            ) if (year, month) > (window.min_year, window.min_month) else blank,
+        ]
+        caption = f"{self._labels.months[month - 1]} {year}"
+        nav_row.append(Button(
+            text=highlight(caption) if is_current_month else caption,
+            callback_data=self.ignore_callback
+        ))
+        nav_row.append(Button(
+            text=">",
+            callback_data=packed(CalendarActions.next_m, year, month, 1)
+        ) if (year, month) < (window.max_year, window.max_month) else blank)
+        nav_row.append(Button(
+            text=">>",
+            callback_data=packed(CalendarActions.next_y, year, month, 1)
+        ) if year < window.max_year else blank)
+        kb.append(nav_row)
+
+        # Second row - Weekday labels
+        now_weekday = today.weekday() if is_current_month else -1
+        kb.append([
+            Button(
+                text=highlight(weekday) if weekday_idx == now_weekday else weekday,
+                callback_data=self.ignore_callback
+            )
+            for weekday_idx, weekday in enumerate(self._labels.days_of_week)
+        ])
+
+        # Calendar days, same cells as in dialog calendar
+        kb.extend(self._days_rows(today, year, month))
+
+        # Last row - Cancel and Today (days of current month)
+        kb.append([
+            Button(
+                text=self._labels.cancel_caption,
+                callback_data=packed(CalendarActions.cancel, year, month, 1)
+            ),
+            Button(
+                text=self._labels.today_caption,
+                callback_data=packed(CalendarActions.start, now_year, -1, -1)
+            ),
+        ])
+
+        return Keyboard(kb, row_width=7, resize_keyboard=True)
+
+    def _warm_views(self, months_ahead: Optional[int], window: CalendarWindow) -> List[tuple]:
+        """Returns (cache key, builder, builder args) of days keyboards of the first month of window
+        and `months_ahead` following ones (all months of window if None)
+        """
+        return self._days_views(months_ahead, window)
+
+    # Year and month selection screens of dialog calendar aren't used
+    _selection_handlers = {
+        act: handler for act, handler in Calendar._selection_handlers.items()
+        if act not in (CalendarActions.set_y, CalendarActions.set_m)
+    }
@@ -0,0 +1,116 @@
+from contextvars import ContextVar
+from datetime import datetime
+from functools import partial
+from typing import Optional, Tuple
+
+from aiogram.types import CallbackQuery
+
+from .calendar import Calendar, NOT_SELECTED
+from .common import CalendarWindow
+from .grid import DayCell
+from .keyboard import Button, Keyboard
+from .schemas import CalendarActions, CalendarCallback
+from .state import CalendarStateStore, MemoryStateStore, message_token
+
+# Range shown by the callback being processed, set per task so shared calendars stay stateless
+_selection: ContextVar[Optional[Tuple[datetime, datetime]]] = ContextVar("calendar_selection", default=None)
+
+
+class RangeCalendar(Calendar):
+    """Dialog calendar selecting a range of dates, e.g. check-in and check-out
+
+    First day click stores range start for the message in `state_store` (MemoryStateStore by default),
+    second one completes the range unless it includes unavailable days. Selected days are highlighted by
+    re-rendering only the affected rows of the cached days keyboard. process_selection returns
+    (True, (start, end)) once the range is complete and keeps the keyboard with the range highlighted.
+    """
+
+    def __init__(self, *args, state_store: CalendarStateStore = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.state_store = state_store if state_store is not None else MemoryStateStore()
+
+    async def _get_anchor(self, query: CallbackQuery, pop: bool = False) -> Optional[datetime]:
+        token = message_token(query.message)
+        value = await (self.state_store.pop(token) if pop else self.state_store.get(token))
+        return datetime.fromisoformat(value) if value else None
+
+    async def _days_keyboard(self, year: int, month: int, window: CalendarWindow) -> Keyboard:
+        keyboard = await super()._days_keyboard(year, month, window)
+        selection = _selection.get()
+        if selection is None:
+            return keyboard
+        return self._highlight_selection(keyboard, year, month, *selection)
+
+    def _highlight_selection(self, keyboard: Keyboard, year: int, month: int, start: datetime, end: datetime):
+        """Returns copy of days keyboard with days from start to end highlighted, only affected rows are rebuilt"""
+        month_start, month_end = (year, month, 1), (year, month, 31)
+        first = max((start.year, start.month, start.day), month_start)
+        last = min((end.year, end.month, end.day), month_end)
+        if first > last:
+            return keyboard
+        return self._replace_days(keyboard, year, month, range(first[2], last[2] + 1), self._selected_button)
+
+    def _selected_button(self, cell: DayCell, button: Button) -> Button:
+        if button.callback_data == self.ignore_callback:
+            return button  # past and unavailable days inside the range stay struck
+        return Button(cell.selected, button.callback_data)
+
+    async def _check_range(self, start: datetime, end: datetime, query: CallbackQuery) -> bool:
+        """Returns True if no day from start to end is unavailable, otherwise answers query with the reason"""
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            first = start.day if (year, month) == (start.year, start.month) else 1
+            last = end.day if (year, month) == (end.year, end.month) else 31
+            blocked = [day for day in await self._unavailable_days(year, month) if first <= day <= last]
+            if blocked:
+                if self.observer is not None:
+                    self.observer.on_rejected(end, "unavailable")
+                await self._api_call("answerCallbackQuery", query.answer(
+                    f'The range includes unavailable date {datetime(year, month, min(blocked)).strftime("%d/%m/%Y")}',
+                    show_alert=self.show_alerts
+                ))
+                return False
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return True
+
+    async def _process_range_day(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        date = datetime(data.year, data.month, data.day)
+        if not await self._check_date(date, query):
+            return NOT_SELECTED
+        anchor = await self._get_anchor(query, pop=True)
+        if anchor is None:
+            # first click - remember range start and highlight it
+            await self.state_store.set(message_token(query.message), date.isoformat())
+            _selection.set((date, date))
+            await self._show_keyboard(query, partial(self._days_keyboard, data.year, data.month, window))
+            return NOT_SELECTED
+        start, end = min(anchor, date), max(anchor, date)
+        if not await self._check_range(start, end, query):
+            # first clicked day is kept, so another end of the range can be picked
+            await self.state_store.set(message_token(query.message), anchor.isoformat())
+            return NOT_SELECTED
+        _selection.set((start, end))
+        await self._show_keyboard(query, partial(self._days_keyboard, data.year, data.month, window))
+        return True, (start, end)
+
+    async def _process_cancel(self, query: CallbackQuery, data: CalendarCallback, window: CalendarWindow) -> tuple:
+        await self.state_store.pop(message_token(query.message))
+        return await super()._process_cancel(query, data, window)
+
+    _selection_handlers = {
+        **Calendar._selection_handlers,
+        CalendarActions.day: _process_range_day,
+        CalendarActions.cancel: _process_cancel,
+    }
+
+    async def process_selection(self, query: CallbackQuery, data: CalendarCallback) -> tuple:
+        """Processes callback of calendar keyboard
+
+        Returns (True, (start, end)) once the range is selected, (False, None) otherwise.
+        """
+        anchor = await self._get_anchor(query)
+        token = _selection.set((anchor, anchor) if anchor is not None else None)
+        try:
+            return await super().process_selection(query, data)
+        finally:
+            _selection.reset(token)
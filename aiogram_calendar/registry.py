@@ -0,0 +1,63 @@
+import threading
+from datetime import datetime
+from typing import Dict, Hashable, Tuple, Type
+
+from .calendar import Calendar
+from .common import GenericCalendar
+
+
+class CalendarRegistry:
+    """Hands out shared, frozen calendar instances per locale and options
+
+    Creating calendar per update allocates labels and options every time, registry creates one instance
+    per distinct (locale, options) and reuses it. Instances are frozen, so they are safe to share
+    between concurrent tasks and threads. Options must be hashable.
+
+    Parameters:
+    calendar_class (Type[GenericCalendar]): class of calendars to create, Calendar by default
+    defaults: keyword arguments passed to every calendar, e.g. keyboard_cache or observer
+    """
+
+    def __init__(self, calendar_class: Type[GenericCalendar] = Calendar, **defaults) -> None:
+        self.calendar_class = calendar_class
+        self.defaults = defaults
+        self._instances: Dict[Hashable, GenericCalendar] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        locale: str = None,
+        min_date: datetime = None,
+        max_date: datetime = None,
+        **options
+    ) -> GenericCalendar:
+        """Returns shared calendar for locale, dates range and options, creating it on first request"""
+        key = (locale or None, min_date, max_date, tuple(sorted(options.items())))
+        calendar = self._instances.get(key)
+        if calendar is None:
+            with self._lock:
+                calendar = self._instances.get(key)
+                if calendar is None:
+                    calendar = self._create(locale, min_date, max_date, options)
+                    self._instances[key] = calendar
+        return calendar
+
+    def _create(self, locale: str, min_date: datetime, max_date: datetime, options: dict) -> GenericCalendar:
+        calendar = self.calendar_class(locale=locale, **{**self.defaults, **options})
+        if min_date or max_date:
+            calendar.set_dates_range(min_date, max_date)
+        calendar.freeze()
+        return calendar
+
+    def items(self) -> Tuple[Tuple[Hashable, GenericCalendar], ...]:
+        return tuple(self._instances.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+default_registry = CalendarRegistry()
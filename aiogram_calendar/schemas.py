@@ -1,5 +1,6 @@
-from typing import Optional, List
+from typing import Optional, List, NamedTuple, Tuple
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +27,48 @@ class CalendarCallback(CallbackData, prefix="calendar"):
     day: Optional[int] = None
 
 
+PACKED_CACHE_SIZE = 4096  # covers every action x day of the navigable window
+
+
+@lru_cache(maxsize=PACKED_CACHE_SIZE)
+def packed(act: CalendarActions, year: int = None, month: int = None, day: int = None) -> str:
+    """Returns packed CalendarCallback data, memoized so every payload is validated and formatted once"""
+    return CalendarCallback(act=act, year=year, month=month, day=day).pack()
+
+
+class CalendarPayload(NamedTuple):
+    "Lightweight decoded calendar callback data, has the same attributes as CalendarCallback"
+    act: str
+    year: Optional[int]
+    month: Optional[int]
+    day: Optional[int]
+
+
+CALLBACK_PREFIX = CalendarCallback.__prefix__ + CalendarCallback.__separator__
+
+
+def _optional_int(value: str) -> Optional[int]:
+    return int(value) if value else None
+
+
+@lru_cache(maxsize=PACKED_CACHE_SIZE)
+def decode_callback(data: str) -> Optional[CalendarPayload]:
+    """Decodes packed CalendarCallback data without pydantic, returns None if data is not a calendar callback
+
+    Decoded payloads are memoized, repeated clicks on the same button cost a dict lookup.
+    """
+    if not data.startswith(CALLBACK_PREFIX):
+        return None
+    parts = data[len(CALLBACK_PREFIX):].split(CalendarCallback.__separator__)
+    if len(parts) != 4:
+        return None
+    act, year, month, day = parts
+    try:
+        return CalendarPayload(act, _optional_int(year), _optional_int(month), _optional_int(day))
+    except ValueError:
+        return None
+
+
 class CalendarLabels(BaseModel):
     "Schema to pass labels for calendar. Can be used to put in different languages"
     days_of_week: List[str] = Field(default=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"], 
@@ -38,8 +81,24 @@ class CalendarLabels(BaseModel):
     today_caption: str = Field(default='Today', description='Caprion for Cancel button')
 
 
+class Labels(NamedTuple):
+    "Immutable labels calendar is rendered with, compact internal counterpart of CalendarLabels"
+    days_of_week: Tuple[str, ...]
+    months: Tuple[str, ...]
+    cancel_caption: str = 'Cancel'
+    today_caption: str = 'Today'
+
+
+
 HIGHLIGHT_FORMAT = "[{}]"
 
 
 def highlight(text):
     return HIGHLIGHT_FORMAT.format(text)
+
+
+RANGE_HIGHLIGHT_FORMAT = "·{}·"
+
+
+def highlight_range(text):
+    return RANGE_HIGHLIGHT_FORMAT.format(text)
@@ -0,0 +1,199 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from datetime import date
+from typing import Hashable, Iterable, Optional
+
+from .keyboard import Keyboard
+
+try:
+    import fcntl
+except ImportError:  # Windows: rebuilds aren't serialized between processes, os.replace keeps them atomic anyway
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AGCK"
+VERSION = 1
+HEADER = struct.Struct("<4sHII")  # magic, version, date ordinal, number of entries
+INDEX_ENTRY = struct.Struct("<QQI")  # key hash, offset of record, length of record
+KEY_LENGTH = struct.Struct("<H")  # record is key length, key, keyboard JSON
+REOPEN_INTERVAL = 1.0  # min seconds between checks whether stale or missing file was rebuilt
+
+
+def _key_bytes(key: Hashable) -> bytes:
+    # cache keys are tuples of str, int and None, their repr is the same in every process
+    return repr(key).encode()
+
+
+def _key_hash(key: bytes) -> int:
+    # builtin hash() of str is randomized per process, the file needs a stable one
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class SharedKeyboardCache:
+    """Keyboards of the current date serialized into a memory-mapped file shared by worker processes of a host
+
+    File is a read-only table of keyboard JSONs (packed callback data and texts) keyed by keyboard cache key
+    (labels, window, view, year, month) with the date in its header. Workers map it, so its pages are kept
+    in memory once per host, and read a keyboard only on local cache miss. Set the same instance options
+    in every worker and pass it to calendars as `shared_cache`, local `keyboard_cache` can be small or None.
+
+    File is built by `rebuild` (run by warm_up, so schedule_warm_up rebuilds it at date rollover):
+    only one process per host renders it, written to a temporary file and atomically moved in place
+    with os.replace, readers pick new file up on their next lookup.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._date: Optional[date] = None
+        self._count = 0
+        self._stat: Optional[tuple] = None
+        self._checked = 0.0
+
+    def get(self, key: Hashable, today: date) -> Optional[Keyboard]:
+        """Returns keyboard of key from the file if it was built for today, otherwise None"""
+        with self._lock:
+            if self._date != today and not self._reopen(today):
+                self.misses += 1
+                return None
+            data = self._find(_key_bytes(key))
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Keyboard.from_json(data)
+
+    def _find(self, key: bytes) -> Optional[str]:
+        """Binary search of key in index of mapped file"""
+        key_hash = _key_hash(key)
+        mm = self._mmap
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_hash = INDEX_ENTRY.unpack_from(mm, HEADER.size + mid * INDEX_ENTRY.size)[0]
+            if mid_hash < key_hash:
+                lo = mid + 1
+            else:
+                hi = mid
+        # equal hashes are adjacent, the key stored in record resolves collisions
+        while lo < self._count:
+            entry_hash, offset, length = INDEX_ENTRY.unpack_from(mm, HEADER.size + lo * INDEX_ENTRY.size)
+            if entry_hash != key_hash:
+                break
+            key_length = KEY_LENGTH.unpack_from(mm, offset)[0]
+            start = offset + KEY_LENGTH.size
+            if mm[start:start + key_length] == key:
+                return mm[start + key_length:offset + length].decode()
+            lo += 1
+        return None
+
+    def _reopen(self, today: date) -> bool:
+        """Maps file again if it was rebuilt since it was mapped, returns True if mapped file is for today"""
+        now = time.monotonic()
+        if now - self._checked < REOPEN_INTERVAL:
+            return False
+        self._checked = now
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        stat_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stat_key != self._stat:
+            try:
+                self._map(stat_key)
+            except (OSError, ValueError, struct.error):
+                logger.warning("Failed to map shared keyboard cache %s", self.path, exc_info=True)
+                return False
+        return self._date == today
+
+    def _map(self, stat_key: tuple) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap, self._date, self._count = None, None, 0
+        with open(self.path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, ordinal, count = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            mm.close()
+            logger.warning("Ignoring shared keyboard cache %s of unknown format", self.path)
+            return
+        self._mmap, self._date, self._count, self._stat = mm, date.fromordinal(ordinal), count, stat_key
+
+    def is_fresh(self, today: date) -> bool:
+        with self._lock:
+            self._checked = 0.0
+            return self._date == today or self._reopen(today)
+
+    def rebuild(self, calendars: Iterable, months_ahead: Optional[int] = None, force: bool = False) -> int:
+        """Renders keyboards of calendars (see Calendar._warm_views) into a new file, returns number of them
+
+        Keyboards of all months of calendars' windows are rendered unless `months_ahead` is set.
+        Skipped (returns 0) if the file is already built for today, unless forced, or if another
+        process is rebuilding it right now.
+        """
+        calendars = list(calendars)
+        if not calendars:
+            return 0
+        today = calendars[0].get_window().today.date()
+        if not force and self.is_fresh(today):
+            return 0
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return 0
+            if not force and self.is_fresh(today):
+                return 0  # rebuilt by another process while the lock was checked
+            records = {}
+            for calendar in calendars:
+                window = calendar.get_window()
+                for key, build, args in calendar._warm_views(months_ahead, window):
+                    records[_key_bytes(calendar._cache_key(key, window))] = build(window, *args).to_json().encode()
+            self._write(today, records)
+        with self._lock:
+            self._checked = 0.0
+            self._reopen(today)
+        return len(records)
+
+    def _write(self, today: date, records: dict) -> None:
+        index, blobs = [], []
+        offset = HEADER.size + INDEX_ENTRY.size * len(records)
+        for key, data in records.items():
+            record = KEY_LENGTH.pack(len(key)) + key + data
+            index.append((_key_hash(key), offset, len(record)))
+            blobs.append(record)
+            offset += len(record)
+        index.sort()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".keyboards-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, today.toordinal(), len(records)))
+                f.writelines(INDEX_ENTRY.pack(*entry) for entry in index)
+                f.writelines(blobs)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap, self._date, self._count, self._stat = None, None, 0, None
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,163 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Message
+
+STATE_MAX_ENTRIES = 100000  # max number of pickers with state kept by MemoryStateStore
+STATE_TTL = 3600  # seconds of inactivity after which picker state is dropped
+EXPIRE_BATCH = 32  # max number of expired entries dropped per write
+
+
+def message_token(message: Message) -> str:
+    """Returns short token identifying picker by its message, so callback data doesn't need to carry it"""
+    return f"{message.chat.id}:{message.message_id}"
+
+
+class TTLCache:
+    """Bounded mapping with least recently used eviction and expiring entries
+
+    Entries are kept in order of expiration, so every operation is O(1): expired entries are dropped
+    lazily on reads and in batches of at most `EXPIRE_BATCH` from the oldest end on writes.
+    With `sliding=True` reads prolong entries and move them to the end (LRU), otherwise entries expire
+    `ttl` seconds after they were written and the oldest written entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        sliding: bool = True,
+        timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sliding = sliding
+        self.timer = timer
+        self._data: OrderedDict = OrderedDict()  # key -> (expires at, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        now = self.timer()
+        if expires <= now:
+            del self._data[key]
+            return default
+        if self.sliding:
+            self._data[key] = (now + self.ttl, value)
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = self.timer()
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        self.expire(now)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.pop(key, None)
+        if item is None or item[0] <= self.timer():
+            return default
+        return item[1]
+
+    def expire(self, now: float = None, batch: int = EXPIRE_BATCH) -> int:
+        """Drops up to batch expired entries, returns number of dropped ones"""
+        if now is None:
+            now = self.timer()
+        dropped = 0
+        while dropped < batch and self._data:
+            key, (expires, _) = next(iter(self._data.items()))
+            if expires > now:
+                break
+            del self._data[key]
+            dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CalendarStateStore(ABC):
+    """Interface of storage for picker state that doesn't fit into 64 bytes of callback data
+
+    State is stored by token (see `message_token`), values must be JSON-serializable
+    to be usable with any backend.
+    """
+
+    @abstractmethod
+    async def get(self, token: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, token: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    async def pop(self, token: str) -> Optional[Any]:
+        """Deletes state of token and returns it"""
+
+
+class MemoryStateStore(CalendarStateStore):
+    "In-process state store, bounded by number of entries, entries expire after `ttl` seconds of inactivity"
+
+    def __init__(self, maxsize: int = STATE_MAX_ENTRIES, ttl: float = STATE_TTL) -> None:
+        self._cache = TTLCache(maxsize, ttl)
+
+    async def get(self, token: str) -> Optional[Any]:
+        return self._cache.get(token)
+
+    async def set(self, token: str, value: Any) -> None:
+        self._cache.set(token, value)
+
+    async def pop(self, token: str) -> Optional[Any]:
+        return self._cache.pop(token)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class FSMStateStore(CalendarStateStore):
+    """State store on top of aiogram FSM storage (MemoryStorage, RedisStorage, ...)
+
+    Token of `message_token` is kept as data of storage key of its chat with user_id 0, which no real user has,
+    and message id as thread_id, so the default destiny works with default key builders. Record is deleted
+    on pop, expiration of abandoned pickers is up to the storage (e.g. data_ttl of RedisStorage).
+    MemoryStorage never expires records, use MemoryStateStore for in-process state.
+    """
+
+    def __init__(self, storage: BaseStorage, bot_id: int) -> None:
+        self.storage = storage
+        self.bot_id = bot_id
+
+    def _key(self, token: str) -> StorageKey:
+        chat_id, _, message_id = token.rpartition(":")
+        return StorageKey(bot_id=self.bot_id, chat_id=int(chat_id), user_id=0, thread_id=int(message_id))
+
+    async def get(self, token: str) -> Optional[Any]:
+        key = self._key(token)
+        if isinstance(self.storage, MemoryStorage) and key not in self.storage.storage:
+            return None  # reading MemoryStorage creates record of the key
+        data = await self.storage.get_data(key)
+        return data.get("value")
+
+    async def set(self, token: str, value: Any) -> None:
+        await self.storage.set_data(self._key(token), {"value": value})
+
+    async def pop(self, token: str) -> Optional[Any]:
+        value = await self.get(token)
+        key = self._key(token)
+        if isinstance(self.storage, MemoryStorage):
+            self.storage.storage.pop(key, None)
+        elif value is not None:
+            await self.storage.set_data(key, {})  # storages delete the record of empty data
+        return value
@@ -0,0 +1,74 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aiogram_calendar import AvailabilityCache, AvailabilityProvider, Calendar, FixedClock, RangeCalendar
+from aiogram_calendar.schemas import CalendarActions, CalendarCallback
+
+TODAY = datetime(2026, 10, 18)
+
+
+class Booked(AvailabilityProvider):
+    def __init__(self, *days: int) -> None:
+        self.days = days
+
+    async def unavailable_days(self, year, month):
+        return self.days if (year, month) == (2026, 11) else ()
+
+
+def make_query() -> MagicMock:
+    query = MagicMock()
+    query.message.chat.id = 1
+    query.message.message_id = 1
+    query.message.reply_markup = None
+    query.message.edit_reply_markup = AsyncMock()
+    query.answer = AsyncMock()
+    return query
+
+
+def day_texts(markup) -> list:
+    return [button.text for row in markup.inline_keyboard[3:-1] for button in row]
+
+
+@pytest.mark.asyncio
+async def test_providers_without_key_are_cached_separately():
+    cache = AvailabilityCache()
+    assert await cache.get(Booked(5), 2026, 11) == {5}
+    assert await cache.get(Booked(6), 2026, 11) == {6}
+
+
+@pytest.mark.asyncio
+async def test_unavailable_day_is_struck_and_rejected():
+    calendar = Calendar(clock=FixedClock(TODAY), availability=Booked(20), availability_cache=AvailabilityCache())
+    markup = await calendar.start_calendar(2026, 11)
+    assert " 20 " not in day_texts(markup)
+    assert " 19 " in day_texts(markup)
+
+    query = make_query()
+    data = CalendarCallback(act=CalendarActions.day, year=2026, month=11, day=20)
+    assert await calendar.process_selection(query, data) == (False, None)
+    query.answer.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_overlaid_keyboard_is_memoized():
+    calendar = Calendar(clock=FixedClock(TODAY), availability=Booked(20), availability_cache=AvailabilityCache())
+    window = calendar.get_window()
+    first = await calendar._days_keyboard(2026, 11, window)
+    assert await calendar._days_keyboard(2026, 11, window) is first
+
+
+@pytest.mark.asyncio
+async def test_range_over_unavailable_day_is_rejected():
+    calendar = RangeCalendar(clock=FixedClock(TODAY), availability=Booked(20), availability_cache=AvailabilityCache())
+    query = make_query()
+
+    def click(day: int) -> CalendarCallback:
+        return CalendarCallback(act=CalendarActions.day, year=2026, month=11, day=day)
+
+    assert await calendar.process_selection(query, click(18)) == (False, None)
+    assert await calendar.process_selection(query, click(22)) == (False, None)
+    # first day is kept, so another end can be picked
+    selected = await calendar.process_selection(query, click(19))
+    assert selected == (True, (datetime(2026, 11, 18), datetime(2026, 11, 19)))
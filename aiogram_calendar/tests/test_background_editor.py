@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aiogram_calendar import BackgroundEditor, Calendar, EditCoalescer, FixedClock
+from aiogram_calendar.schemas import CalendarActions, CalendarCallback
+
+
+def make_query(log: list) -> MagicMock:
+    async def edit_reply_markup(reply_markup=None):
+        await asyncio.sleep(0.05)
+        log.append("edit")
+
+    async def delete_reply_markup():
+        log.append("delete")
+
+    query = MagicMock()
+    query.message.chat.id = 1
+    query.message.message_id = 1
+    query.message.reply_markup = None
+    query.message.edit_reply_markup = edit_reply_markup
+    query.message.delete_reply_markup = delete_reply_markup
+    query.answer = AsyncMock()
+    return query
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("last", [
+    CalendarCallback(act=CalendarActions.day, year=2026, month=12, day=5),
+    CalendarCallback(act=CalendarActions.cancel, year=2026, month=12, day=1),
+])
+async def test_edits_pending_on_close_are_dropped(last):
+    log = []
+    editor = BackgroundEditor(limit=1)
+    calendar = Calendar(
+        clock=FixedClock(datetime(2026, 10, 18)), background_editor=editor, edit_coalescer=EditCoalescer(window=0)
+    )
+    query = make_query(log)
+    for month in (10, 11):
+        await calendar.process_selection(query, CalendarCallback(act=CalendarActions.next_m, year=2026, month=month))
+    await asyncio.sleep(0.01)  # first edit is running, second one waits for the semaphore
+
+    await calendar.process_selection(query, last)
+    await editor.wait()
+    assert log == ["delete"]
+    assert editor.pending == 0
+    assert not editor.errors
+
+
+@pytest.mark.asyncio
+async def test_cancel_of_other_message_keeps_edits():
+    done = []
+    editor = BackgroundEditor()
+
+    async def edit():
+        await asyncio.sleep(0.01)
+        done.append(True)
+
+    editor.spawn(edit(), key=(1, 1))
+    await editor.cancel((1, 2))
+    await editor.wait()
+    assert done == [True]
@@ -0,0 +1,42 @@
+from datetime import date
+
+from aiogram_calendar import KeyboardCache
+
+DAY = date(2026, 10, 18)
+NEXT_DAY = date(2026, 10, 19)
+
+
+def test_dates_of_different_timezones_are_kept():
+    cache = KeyboardCache()
+    cache.set("start", DAY, "a")
+    cache.set("start", NEXT_DAY, "b")
+    assert cache.get("start", DAY) == "a"
+    assert cache.get("start", NEXT_DAY) == "b"
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_keyboard_of_other_date_misses():
+    cache = KeyboardCache()
+    cache.set("start", DAY, "a")
+    assert cache.get("start", NEXT_DAY) is None
+    assert cache.peek("start", NEXT_DAY) is None
+
+
+def test_stale_dates_are_dropped():
+    cache = KeyboardCache()
+    cache.set("start", DAY, "a")
+    cache.set("start", NEXT_DAY, "b")
+    cache.set("start", date(2026, 10, 21), "c")
+    assert len(cache) == 2
+    assert cache.peek("start", DAY) is None
+    assert cache.peek("start", NEXT_DAY) == "b"
+
+
+def test_least_recently_used_is_evicted():
+    cache = KeyboardCache(maxsize=2)
+    cache.set("a", DAY, 1)
+    cache.set("b", DAY, 2)
+    cache.get("a", DAY)
+    cache.set("c", DAY, 3)
+    assert cache.peek("b", DAY) is None
+    assert cache.peek("a", DAY) == 1
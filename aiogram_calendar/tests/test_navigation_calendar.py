@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aiogram_calendar import FixedClock, KeyboardCache, NavigationCalendar
+from aiogram_calendar.schemas import CalendarActions, CalendarCallback, packed
+
+TODAY = datetime(2026, 10, 18)
+BLANK = " "
+
+
+def make_calendar(**kwargs) -> NavigationCalendar:
+    kwargs.setdefault("keyboard_cache", KeyboardCache())
+    kwargs.setdefault("prefetch", False)
+    return NavigationCalendar(clock=FixedClock(TODAY), **kwargs)
+
+
+def make_query() -> MagicMock:
+    query = MagicMock()
+    query.message.chat.id = 1
+    query.message.message_id = 1
+    query.message.edit_reply_markup = AsyncMock()
+    query.message.delete_reply_markup = AsyncMock()
+    query.answer = AsyncMock()
+    return query
+
+
+def nav_texts(markup) -> list:
+    return [button.text for button in markup.inline_keyboard[0]]
+
+
+def shown_month(query: MagicMock) -> str:
+    markup = query.message.edit_reply_markup.call_args.kwargs["reply_markup"]
+    return markup.inline_keyboard[0][2].text
+
+
+@pytest.mark.asyncio
+async def test_first_month_has_no_back_arrows():
+    markup = await make_calendar().start_calendar()
+    assert nav_texts(markup) == [BLANK, BLANK, "[Oct 2026]", ">", ">>"]
+
+
+@pytest.mark.asyncio
+async def test_last_month_has_no_forward_arrows():
+    markup = await make_calendar().start_calendar(2027, 12)
+    assert nav_texts(markup) == ["<<", "<", "Dec 2027", BLANK, BLANK]
+
+
+@pytest.mark.asyncio
+async def test_start_outside_window_is_clamped():
+    calendar = make_calendar()
+    assert nav_texts(await calendar.start_calendar(2025, 3))[2] == "[Oct 2026]"
+    assert nav_texts(await calendar.start_calendar(2030, 3))[2] == "Dec 2027"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("act, year, month, expected", [
+    (CalendarActions.next_m, 2027, 12, "Dec 2027"),
+    (CalendarActions.next_y, 2027, 5, "May 2027"),
+    (CalendarActions.next_y, 2026, 11, "Nov 2027"),
+    (CalendarActions.prev_m, 2026, 10, "[Oct 2026]"),
+    (CalendarActions.prev_y, 2027, 3, "[Oct 2026]"),
+    (CalendarActions.next_m, 2026, 12, "Jan 2027"),
+])
+async def test_navigation_stays_in_window(act, year, month, expected):
+    query = make_query()
+    result = await make_calendar().process_selection(query, CalendarCallback(act=act, year=year, month=month, day=1))
+    assert result == (False, None)
+    assert shown_month(query) == expected
+
+
+@pytest.mark.asyncio
+async def test_today_button_returns_to_current_month():
+    calendar = make_calendar()
+    markup = await calendar.start_calendar(2027, 6)
+    today_button = markup.inline_keyboard[-1][1]
+    assert today_button.text == "Today"
+    assert today_button.callback_data == packed(CalendarActions.start, 2026, -1, -1)
+
+    query = make_query()
+    data = CalendarCallback.unpack(today_button.callback_data)
+    assert await calendar.process_selection(query, data) == (False, None)
+    assert shown_month(query) == "[Oct 2026]"
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fills_cache_with_adjacent_months():
+    cache = KeyboardCache()
+    calendar = make_calendar(keyboard_cache=cache, prefetch=True)
+    window = calendar.get_window()
+    await calendar.start_calendar(2027, 3, window)
+    await asyncio.gather(*calendar._prefetching)
+
+    today = window.today.date()
+    for year, month in ((2027, 2), (2027, 4)):
+        key = calendar._cache_key((calendar.days_view, year, month), window)
+        assert cache.peek(key, today, calendar._labels) is not None
+    key = calendar._cache_key((calendar.days_view, 2027, 5), window)
+    assert cache.peek(key, today, calendar._labels) is None
+
+
+@pytest.mark.asyncio
+async def test_prefetched_month_is_served_from_cache():
+    cache = KeyboardCache()
+    calendar = make_calendar(keyboard_cache=cache, prefetch=True)
+    await calendar.start_calendar()
+    await asyncio.gather(*calendar._prefetching)
+
+    hits = cache.hits
+    query = make_query()
+    await calendar.process_selection(query, CalendarCallback(act=CalendarActions.next_m, year=2026, month=10, day=1))
+    assert cache.hits == hits + 1
+    assert shown_month(query) == "Nov 2026"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("act", [CalendarActions.set_y, CalendarActions.set_m])
+async def test_year_and_month_selection_is_ignored(act):
+    query = make_query()
+    result = await make_calendar().process_selection(query, CalendarCallback(act=act, year=2027, month=3, day=-1))
+    assert result == (False, None)
+    query.message.edit_reply_markup.assert_not_called()
+    query.answer.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_day_selection():
+    query = make_query()
+    result = await make_calendar().process_selection(
+        query, CalendarCallback(act=CalendarActions.day, year=2026, month=11, day=5)
+    )
+    assert result == (True, datetime(2026, 11, 5))
+    query.message.delete_reply_markup.assert_awaited_once()
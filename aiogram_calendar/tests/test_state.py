@@ -0,0 +1,73 @@
+from typing import Any, Dict, Mapping, Optional
+
+import pytest
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from aiogram_calendar.state import CalendarStateStore, FSMStateStore
+
+TOKEN = "-1001234:56"
+
+
+class KeyBuildingStorage(BaseStorage):
+    "Storage keyed like RedisStorage with default key builder, deletes records of empty data"
+
+    def __init__(self) -> None:
+        self.key_builder = DefaultKeyBuilder()
+        self.records: Dict[str, Dict[str, Any]] = {}
+
+    async def set_state(self, key: StorageKey, state=None) -> None:
+        raise NotImplementedError
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        redis_key = self.key_builder.build(key, "data")
+        if data:
+            self.records[redis_key] = dict(data)
+        else:
+            self.records.pop(redis_key, None)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        return dict(self.records.get(self.key_builder.build(key, "data"), {}))
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_class", [MemoryStorage, KeyBuildingStorage])
+async def test_fsm_state_store_roundtrip(storage_class):
+    storage = storage_class()
+    store = FSMStateStore(storage, bot_id=42)
+    assert await store.get(TOKEN) is None
+    await store.set(TOKEN, "2026-10-18")
+    assert await store.get(TOKEN) == "2026-10-18"
+    assert await store.pop(TOKEN) == "2026-10-18"
+    assert await store.pop(TOKEN) is None
+    records = storage.storage if storage_class is MemoryStorage else storage.records
+    assert len(records) == 0
+
+
+@pytest.mark.asyncio
+async def test_fsm_state_store_keeps_user_data():
+    storage = MemoryStorage()
+    user_key = StorageKey(bot_id=42, chat_id=-1001234, user_id=7)
+    await storage.set_data(user_key, {"name": "x"})
+    store = FSMStateStore(storage, bot_id=42)
+    await store.set(TOKEN, "2026-10-18")
+    await store.pop(TOKEN)
+    assert await storage.get_data(user_key) == {"name": "x"}
+
+
+def test_incomplete_state_store_fails_on_instantiation():
+    class NoPop(CalendarStateStore):
+        async def get(self, token):
+            return None
+
+        async def set(self, token, value):
+            pass
+
+    with pytest.raises(TypeError):
+        NoPop()
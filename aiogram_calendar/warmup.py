@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import sys
+from concurrent.futures import Executor
+from datetime import datetime, time, timedelta
+from time import perf_counter
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from .keyboard import Keyboard
+from .registry import CalendarRegistry, default_registry
+
+logger = logging.getLogger(__name__)
+
+ROLLOVER_DELAY = 1  # seconds after midnight to re-warm at, so the clock surely shows the new date
+
+
+class WarmUpReport(NamedTuple):
+    "Result of warm_up: number of keyboards, seconds it took and bytes the warmed keyboards take"
+    keyboards: int
+    seconds: float
+    memory: int
+
+
+def keyboards_size(keyboards: Iterable[Keyboard]) -> int:
+    """Returns approximate number of bytes taken by keyboards with their markups, shared objects are counted once"""
+    seen = set()
+    size = 0
+    stack = list(keyboards)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type) or callable(obj):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (tuple, list, set, frozenset)):
+            stack.extend(obj)
+        else:
+            # plain objects, slotted Keyboard and pydantic models of markup
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if slot != "__dict__" and hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+    return size
+
+
+async def warm_up(
+    locales: Iterable[Optional[str]] = (None,),
+    months_ahead: Optional[int] = 1,
+    registry: CalendarRegistry = default_registry,
+    executor: Optional[Executor] = None,
+    **options
+) -> WarmUpReport:
+    """Pre-renders keyboards of calendars users of locales will get, so first users don't pay the render cost
+
+    Calendars are taken from registry with `options` (e.g. min_date, max_date), so the keyboard cache
+    entries they share with handlers are filled. Every locale is rendered by `Calendar.warm_keyboards`
+    in executor (default thread pool of the loop), the event loop isn't blocked meanwhile.
+    Keyboards are cached in this process, so process pools can't be used. With `shared_cache` set on
+    calendars its file is rebuilt first with the same keyboards if it isn't built for today yet,
+    pass `months_ahead=None` to put all months of the window into it.
+    """
+    loop = asyncio.get_running_loop()
+    started = perf_counter()
+    calendars = [registry.get(locale, **options) for locale in locales]
+    shared_cache = calendars[0].shared_cache if calendars else None
+    if shared_cache is not None:
+        # one worker of the host renders the shared file, the others find it fresh and read from it
+        await loop.run_in_executor(executor, shared_cache.rebuild, calendars, months_ahead)
+    results = await asyncio.gather(*(
+        loop.run_in_executor(executor, calendar.warm_keyboards, months_ahead) for calendar in calendars
+    ))
+    keyboards = [keyboard for result in results for keyboard in result]
+    report = WarmUpReport(len(keyboards), perf_counter() - started, keyboards_size(keyboards))
+
+    cache = calendars[0].keyboard_cache if calendars else None
+    if cache is not None and not cache.per_locale and report.keyboards > cache.maxsize:
+        logger.warning(
+            "Warmed %d keyboards, but keyboard cache keeps only %d, increase its maxsize",
+            report.keyboards, cache.maxsize
+        )
+    return report
+
+
+def schedule_warm_up(
+    locales: Iterable[Optional[str]] = (None,),
+    months_ahead: Optional[int] = 1,
+    registry: CalendarRegistry = default_registry,
+    executor: Optional[Executor] = None,
+    on_report: Optional[Callable[[WarmUpReport], None]] = None,
+    **options
+) -> asyncio.Task:
+    """Starts background task running warm_up right after every date rollover of calendars' clock
+
+    Keyboards highlight today, so the cache is dropped at midnight and would be cold again.
+    Reports are logged and passed to `on_report` if set. Cancel the task to stop re-warming.
+    """
+    locales = tuple(locales)
+    clock = registry.get(locales[0] if locales else None, **options).clock
+
+    async def rewarm() -> None:
+        while True:
+            now = clock.now()
+            midnight = datetime.combine(now.date() + timedelta(days=1), time())
+            await asyncio.sleep((midnight - now).total_seconds() + ROLLOVER_DELAY)
+            try:
+                report = await warm_up(locales, months_ahead, registry, executor, **options)
+            except Exception:
+                logger.exception("Calendar keyboards re-warm failed")
+                continue
+            logger.info(
+                "Re-warmed %d calendar keyboards in %.3f s, %d bytes",
+                report.keyboards, report.seconds, report.memory
+            )
+            if on_report is not None:
+                on_report(report)
+
+    return asyncio.ensure_future(rewarm())
@@ -0,0 +1,50 @@
+"""Micro-benchmark of inbound callback decoding: decode_callback vs. CalendarCallback.unpack
+
+Run from the repository root:
+    python -m benchmarks.bench_decode
+"""
+import timeit
+import tracemalloc
+
+from aiogram_calendar import CalendarCallback, decode_callback
+from aiogram_calendar.schemas import CalendarActions, packed
+
+NUMBER = 100000
+PAYLOADS = [
+    packed(CalendarActions.day, 2026, 11, 15),
+    packed(CalendarActions.next_m, 2026, 11, 1),
+    packed(CalendarActions.set_y, 2026, -1, -1),
+    packed(CalendarActions.ignore),
+]
+
+
+def allocated_per_call(func, payload: str, number: int = 1000) -> float:
+    """Returns average number of bytes allocated and kept alive by decoding payload"""
+    results = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(number):
+        results.append(func(payload))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / number
+
+
+def bench(label: str, func, payload: str) -> float:
+    seconds = timeit.timeit(lambda: func(payload), number=NUMBER)
+    per_call = seconds / NUMBER * 1e9
+    print(f"{label:<16} {payload:<30} {per_call:8.0f} ns/call {allocated_per_call(func, payload):8.0f} B/call")
+    return per_call
+
+
+def main() -> None:
+    uncached_decode = decode_callback.__wrapped__
+    for payload in PAYLOADS:
+        unpack = bench("unpack", CalendarCallback.unpack, payload)
+        uncached = bench("decode uncached", uncached_decode, payload)
+        cached = bench("decode", decode_callback, payload)
+        print(f"{'speedup':<16} {payload:<30} {unpack / uncached:8.1f}x uncached, {unpack / cached:.1f}x memoized")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark of date selection flows: dialog Calendar vs. single screen NavigationCalendar
+
+For a target date in every month of the navigable window, a simulated first user (cold keyboard cache)
+opens the calendar and clicks the shortest path to the date:
+    dialog:     year -> month -> day
+    navigation: ">>" while a year or more away, ">" for the remaining months, then day
+Reports clicks per selected date and process_selection latency per click. Navigation is measured with
+and without adjacent month prefetch; prefetch runs between clicks (user's think time) and isn't timed.
+
+Run from the repository root:
+    python -m benchmarks.bench_navigation
+"""
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from aiogram_calendar import Calendar, FixedClock, KeyboardCache, NavigationCalendar, decode_callback
+from aiogram_calendar.schemas import CalendarActions, packed
+
+from .mocks import MockCallbackQuery, MockMessage
+from .suite import TODAY, percentile
+
+TARGET_DAY = 20
+
+
+def dialog_path(year: int, month: int, day: int) -> List[str]:
+    return [
+        packed(CalendarActions.set_y, year, -1, -1),
+        packed(CalendarActions.set_m, year, month, -1),
+        packed(CalendarActions.day, year, month, day),
+    ]
+
+
+def navigation_path(year: int, month: int, day: int) -> List[str]:
+    path = []
+    current_year, current_month = TODAY.year, TODAY.month
+    while (year - current_year) * 12 + month - current_month >= 12:
+        path.append(packed(CalendarActions.next_y, current_year, current_month, 1))
+        current_year += 1
+    while (current_year, current_month) < (year, month):
+        path.append(packed(CalendarActions.next_m, current_year, current_month, 1))
+        current_year, current_month = (current_year + 1, 1) if current_month == 12 else (current_year, current_month + 1)
+    path.append(packed(CalendarActions.day, year, month, day))
+    return path
+
+
+def targets(calendar: Calendar) -> List[Tuple[int, int, int]]:
+    window = calendar.get_window()
+    year, month = window.min_year, window.min_month
+    result = []
+    while (year, month) <= (window.max_year, window.max_month):
+        result.append((year, month, TARGET_DAY))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return result
+
+
+async def select(calendar: Calendar, path: List[str]) -> Tuple[List[int], int]:
+    """Opens calendar and clicks path, returns click latencies in ns and number of API calls"""
+    message = MockMessage()
+    message.reply_markup = await calendar.start_calendar()
+    query = MockCallbackQuery(message)
+    latencies = []
+    for data in path:
+        await asyncio.sleep(0)  # user's think time, background prefetch runs here
+        await asyncio.sleep(0)
+        started = time.perf_counter_ns()
+        selected, _ = await calendar.process_selection(query, decode_callback(data))
+        latencies.append(time.perf_counter_ns() - started)
+    assert selected, "path didn't select a date"
+    return latencies, len(message.calls)
+
+
+async def run_flow(name: str, make_calendar, make_path) -> Dict:
+    clicks, latencies, api_calls = [], [], []
+    for target in targets(make_calendar(None)):
+        calendar = make_calendar(KeyboardCache())  # first user of the day, nothing cached
+        path = make_path(*target)
+        click_latencies, calls = await select(calendar, path)
+        clicks.append(len(path))
+        latencies.extend(click_latencies)
+        api_calls.append(calls)
+    latencies.sort()
+    result = {
+        "clicks_avg": statistics.mean(clicks),
+        "clicks_max": max(clicks),
+        "api_calls_avg": statistics.mean(api_calls),
+        "p50_us": percentile(latencies, 0.5) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "per_date_us": sum(latencies) / len(clicks) / 1000,
+    }
+    print(
+        f"{name:<24} clicks avg {result['clicks_avg']:5.2f} max {result['clicks_max']:3}"
+        f"  api calls {result['api_calls_avg']:5.2f}  click p50 {result['p50_us']:7.1f} us"
+        f"  p99 {result['p99_us']:7.1f} us  per date {result['per_date_us']:8.1f} us"
+    )
+    return result
+
+
+async def run() -> None:
+    clock = FixedClock(TODAY)
+    print(f"target: day {TARGET_DAY} of every month of the window, today {TODAY:%Y-%m-%d}")
+    await run_flow(
+        "dialog", lambda cache: Calendar(clock=clock, keyboard_cache=cache), dialog_path
+    )
+    await run_flow(
+        "navigation", lambda cache: NavigationCalendar(clock=clock, keyboard_cache=cache), navigation_path
+    )
+    await run_flow(
+        "navigation, no prefetch",
+        lambda cache: NavigationCalendar(clock=clock, keyboard_cache=cache, prefetch=False),
+        navigation_path
+    )
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
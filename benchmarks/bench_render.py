@@ -0,0 +1,188 @@
+"""Micro-benchmark of days keyboard rendering: prebuilt month grid vs. legacy per-cell string work
+
+Run from the repository root:
+    python -m benchmarks.bench_render
+"""
+import asyncio
+import calendar
+import timeit
+from datetime import datetime
+
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+from aiogram_calendar import Calendar, CalendarCallback
+from aiogram_calendar.schemas import CalendarActions, highlight
+
+NUMBER = 2000
+
+
+class LegacyCalendar(Calendar):
+    "Calendar with days keyboard rendered the way it was before the month grid index"
+
+    async def _get_days_kb(self, year: int, month: int):
+        """Creates an inline keyboard with calendar days of month for specified year and month"""
+        today = datetime.now()
+        now_weekday = self._labels.days_of_week[today.weekday()]
+        now_month, now_year, now_day = today.month, today.year, today.day
+        min_year, max_year = now_year, now_year + 1  # Restrict to current and next year
+        min_month = now_month if year == min_year else 1  # Minimum month in min_year
+        max_month = 12  # Maximum month in max_year
+
+        def highlight_month():
+            month_str = self._labels.months[month - 1]
+            if now_month == month and now_year == year:
+                return highlight(month_str)
+            return month_str
+
+        def highlight_weekday():
+            if now_month == month and now_year == year and now_weekday == weekday:
+                return highlight(weekday)
+            return weekday
+
+        def format_day_string():
+            # For edge case (last week with empty Sunday), don't pad days in last row
+            if is_edge_case and week_idx == len(month_calendar) - 1:
+                return f"{day}"  # No padding in edge case row
+            return f" {day:2} "  # Normal padding for other row
+
+        def highlight_day():
+            day_string = format_day_string()
+            # Strikethrough days before today in the current month and year
+            if year == now_year and month == now_month and day < now_day:
+                return ''.join(c + '\u0335' for c in day_string)  # Short stroke overlay
+            elif now_month == month and now_year == year and now_day == day:
+                return highlight(day_string.strip() if len(day_string.strip()) == 2 else day_string)
+            return day_string
+
+        kb = []
+        # First row - Year navigation
+        year_row = []
+        if year > min_year:
+            year_row.append(InlineKeyboardButton(
+                text="<<",
+                callback_data=CalendarCallback(act=CalendarActions.prev_y, year=year, month=month, day=1).pack()
+            ))
+        else:
+            year_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+        
+        year_row.append(InlineKeyboardButton(
+            text=str(year) if year != now_year else highlight(year),
+            callback_data=CalendarCallback(act=CalendarActions.start, year=year, month=-1, day=-1).pack()
+        ))
+        
+        if year < max_year:
+            year_row.append(InlineKeyboardButton(
+                text=">>",
+                callback_data=CalendarCallback(act=CalendarActions.next_y, year=year, month=month, day=1).pack()
+            ))
+        else:
+            year_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+        
+        kb.append(year_row)
+
+        # Second row - Month navigation
+        month_row = []
+        # Show "<" only if not at min boundary (min_month of min_year)
+        if not (year == min_year and month <= min_month):
+            month_row.append(InlineKeyboardButton(
+                text="<",
+                callback_data=CalendarCallback(act=CalendarActions.prev_m, year=year, month=month, day=1).pack()
+            ))
+        else:
+            month_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+        
+        month_row.append(InlineKeyboardButton(
+            text=highlight_month(),
+            callback_data=CalendarCallback(act=CalendarActions.set_y, year=year, month=-1, day=-1).pack()
+        ))
+        
+        # Show ">" only if not at max boundary (max_month of max_year)
+        if not (year == max_year and month >= max_month):
+            month_row.append(InlineKeyboardButton(
+                text=">",
+                callback_data=CalendarCallback(act=CalendarActions.next_m, year=year, month=month, day=1).pack()
+            ))
+        else:
+            month_row.append(InlineKeyboardButton(text=" ", callback_data=self.ignore_callback))
+        
+        kb.append(month_row)
+
+        # Third row - Weekday labels
+        week_days_labels_row = []
+        for weekday in self._labels.days_of_week:
+            week_days_labels_row.append(InlineKeyboardButton(
+                text=highlight_weekday(), callback_data=self.ignore_callback))
+        kb.append(week_days_labels_row)
+
+        # Calendar days
+        month_calendar = calendar.monthcalendar(year, month)
+        for week_idx, week in enumerate(month_calendar):
+            days_row = []
+            
+            # Check if this is the last week with only first cell empty (month ends on Sunday)
+            is_edge_case = (week_idx == len(month_calendar) - 1 and  # Last week
+                week[6] == 0 and  # Sunday is empty
+                all(d > 0 for d in week[:6]))  # Monday-Saturday are non-empty
+            
+            for day_idx, day in enumerate(week):
+                if day == 0:
+                    if is_edge_case and day_idx == 6:
+                        # Use a special invisible character that maintains width
+                        display_text = " ⠀ "  # U+202F (narrow no-break space)
+                    else:
+                        display_text = "    "  # Normal empty cell
+                    callback = self.ignore_callback
+                else:
+                    display_text = highlight_day()
+                    if year == now_year and month == now_month and day < now_day:
+                        callback = self.ignore_callback
+                    else:
+                        callback = CalendarCallback(
+                            act=CalendarActions.day, 
+                            year=year, 
+                            month=month, 
+                            day=day
+                        ).pack()
+                
+                days_row.append(InlineKeyboardButton(
+                    text=display_text,
+                    callback_data=callback
+                ))
+            kb.append(days_row)
+
+        # Last row with cancel button only
+        cancel_row = [
+            InlineKeyboardButton(
+                text=self._labels.cancel_caption,
+                callback_data=CalendarCallback(act=CalendarActions.cancel, year=year, month=month, day=1).pack()
+            )
+        ]
+        kb.append(cancel_row)
+
+        return InlineKeyboardMarkup(row_width=7, inline_keyboard=kb, resize_keyboard=True)
+
+
+def bench(label: str, calendar_obj: Calendar, year: int, month: int) -> float:
+    loop = asyncio.new_event_loop()
+    try:
+        seconds = timeit.timeit(
+            lambda: loop.run_until_complete(calendar_obj._get_days_kb(year, month)), number=NUMBER
+        )
+    finally:
+        loop.close()
+    per_call = seconds / NUMBER * 1e6
+    print(f"{label:<10} {year}-{month:02}: {per_call:8.1f} us/render, {NUMBER / seconds:8.0f} renders/s")
+    return per_call
+
+
+def main() -> None:
+    today = datetime.now()
+    next_month = (today.year + today.month // 12, today.month % 12 + 1)
+    for year, month in [(today.year, today.month), next_month]:
+        legacy = bench("legacy", LegacyCalendar(keyboard_cache=None), year, month)
+        grid = bench("grid", Calendar(keyboard_cache=None), year, month)
+        print(f"{'speedup':<10} {year}-{month:02}: {legacy / grid:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
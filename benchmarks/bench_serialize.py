@@ -0,0 +1,61 @@
+"""Micro-benchmark of per-edit request serialization: prebuilt JSON reply_markup vs. aiogram model
+
+Measures what aiogram does with EditMessageReplyMarkup before sending it: method creation and
+form data preparation, with markup passed as InlineKeyboardMarkup or as Keyboard.to_json() string.
+
+Run from the repository root:
+    python -m benchmarks.bench_serialize
+"""
+import asyncio
+import timeit
+from datetime import datetime
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import EditMessageReplyMarkup
+
+from aiogram_calendar import Calendar, FixedClock
+
+NUMBER = 2000
+CHAT_ID, MESSAGE_ID = 1, 1
+
+
+def form_fields(session: AiohttpSession, bot: Bot, method: EditMessageReplyMarkup) -> dict:
+    return {field[0]["name"]: field[2] for field in session.build_form_data(bot, method)._fields}
+
+
+def main() -> None:
+    session = AiohttpSession()
+    bot = Bot("42:TOKEN", session=session)
+    calendar = Calendar(clock=FixedClock(datetime(2026, 10, 18)))
+    window = calendar.get_window()
+    keyboard = asyncio.run(calendar._days_keyboard(2026, 11, window))
+    markup, markup_json = keyboard.markup(), keyboard.to_json()
+
+    def model_edit():
+        method = EditMessageReplyMarkup(chat_id=CHAT_ID, message_id=MESSAGE_ID, reply_markup=markup)
+        return session.build_form_data(bot, method)
+
+    def json_edit():
+        method = EditMessageReplyMarkup.model_construct(
+            chat_id=CHAT_ID, message_id=MESSAGE_ID, reply_markup=markup_json
+        )
+        return session.build_form_data(bot, method)
+
+    model_fields = form_fields(session, bot, EditMessageReplyMarkup(
+        chat_id=CHAT_ID, message_id=MESSAGE_ID, reply_markup=markup
+    ))
+    json_fields = form_fields(session, bot, EditMessageReplyMarkup.model_construct(
+        chat_id=CHAT_ID, message_id=MESSAGE_ID, reply_markup=markup_json
+    ))
+    assert set(model_fields) == set(json_fields), (model_fields.keys(), json_fields.keys())
+
+    model_us = timeit.timeit(model_edit, number=NUMBER) / NUMBER * 1e6
+    json_us = timeit.timeit(json_edit, number=NUMBER) / NUMBER * 1e6
+    print(f"model markup  {model_us:8.1f} us/edit  ({len(model_fields['reply_markup'])} bytes)")
+    print(f"prebuilt json {json_us:8.1f} us/edit  ({len(json_fields['reply_markup'])} bytes)")
+    print(f"saved         {model_us - json_us:8.1f} us/edit, {model_us / json_us:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark of host memory taken by keyboards of several worker processes: local caches vs. shared file
+
+Every worker holds all keyboards of LOCALES for the whole window, either in its own KeyboardCache
+(with prebuilt JSON) or read from SharedKeyboardCache mapped from one file. While all workers are alive,
+their proportional set sizes (PSS, shared pages split between processes) are summed, so the total is
+what the host actually spends. Workers rendering without any cache give the floor that is subtracted.
+Linux only (reads /proc/self/smaps_rollup).
+
+Run from the repository root:
+    python -m benchmarks.bench_shared_cache [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from aiogram_calendar import Calendar, FixedClock, SharedKeyboardCache
+
+from .suite import LOCALES, TODAY
+
+CHILD = """
+import sys
+from datetime import datetime
+from aiogram_calendar import Calendar, FixedClock, KeyboardCache, SharedKeyboardCache
+
+mode, path, today = sys.argv[1], sys.argv[2], datetime.fromisoformat(sys.argv[3])
+locales = sys.argv[4:]
+cache = KeyboardCache(maxsize=100000) if mode == "local" else None
+shared = SharedKeyboardCache(path) if mode == "shared" else None
+calendars = [
+    Calendar(locale=locale, clock=FixedClock(today), keyboard_cache=cache, shared_cache=shared, serialized_markup=True)
+    for locale in locales
+]
+keyboards = 0
+for calendar in calendars:
+    keyboards += len(calendar.warm_keyboards(months_ahead=None))
+assert mode != "shared" or shared.misses == 0, "shared file doesn't have all keyboards"
+print(keyboards, flush=True)
+sys.stdin.readline()  # measured while all workers are alive
+with open("/proc/self/smaps_rollup") as f:
+    pss = next(int(line.split()[1]) for line in f if line.startswith("Pss:"))
+print(pss, flush=True)
+"""
+
+
+def host_pss(mode: str, workers: int, path: str) -> tuple:
+    """Returns (total PSS of workers in KiB, keyboards per worker)"""
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", CHILD, mode, path, TODAY.isoformat(), *LOCALES],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(workers)
+    ]
+    keyboards = [int(process.stdout.readline()) for process in processes]
+    for process in processes:
+        process.stdin.write("\n")
+        process.stdin.flush()
+    total = sum(int(process.stdout.readline()) for process in processes)
+    for process in processes:
+        process.wait()
+    return total, keyboards[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keyboards.bin")
+        shared = SharedKeyboardCache(path)
+        count = shared.rebuild(Calendar(locale=locale, clock=FixedClock(TODAY), keyboard_cache=None) for locale in LOCALES)
+        print(f"{len(LOCALES)} locales, {count} keyboards, shared file {os.path.getsize(path) / 1024:.0f} KiB")
+        shared.close()
+
+        for workers in args.workers:
+            floor, _ = host_pss("none", workers, path)
+            local, keyboards = host_pss("local", workers, path)
+            mapped, _ = host_pss("shared", workers, path)
+            print(
+                f"{workers:2} workers x {keyboards} keyboards: host memory over floor"
+                f"  local caches {(local - floor) / 1024:7.1f} MiB  shared file {(mapped - floor) / 1024:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
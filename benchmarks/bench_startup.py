@@ -0,0 +1,76 @@
+"""Startup benchmark of a fresh worker process: import time and resident memory
+
+Every sample runs in a new interpreter which imports aiogram_calendar and resolves labels of LOCALES,
+either from the prebuilt locale table (default path) or from Babel CLDR data (as before the table).
+Import of aiogram alone is measured too, as the floor both paths share. Linux/macOS only (uses resource).
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from .suite import LOCALES
+
+CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+mode, locales = sys.argv[1], sys.argv[2:]
+import aiogram
+if mode != "aiogram":
+    import aiogram_calendar
+    if mode == "table":
+        for locale in locales:
+            aiogram_calendar.get_calendar_labels(locale)
+    else:
+        import babel
+        from aiogram_calendar.common import babel_labels
+        for locale in locales:
+            babel_labels(locale)
+elapsed = time.perf_counter() - started
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_kb = rss // 1024 if sys.platform == "darwin" else rss
+print(json.dumps({"seconds": elapsed, "rss_kb": rss_kb, "babel": "babel" in sys.modules}))
+"""
+
+MODES = {
+    "aiogram": "import aiogram only",
+    "babel": "calendar + Babel labels",
+    "table": "calendar + table labels",
+}
+
+
+def sample(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode, *LOCALES], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per mode, medians are reported")
+    args = parser.parse_args()
+
+    print(f"{len(LOCALES)} locales, median of {args.runs} fresh processes")
+    results = {}
+    for mode, label in MODES.items():
+        samples = [sample(mode) for _ in range(args.runs)]
+        results[mode] = {
+            "seconds": statistics.median(s["seconds"] for s in samples),
+            "rss_kb": statistics.median(s["rss_kb"] for s in samples),
+            "babel": samples[0]["babel"],
+        }
+        r = results[mode]
+        print(f"{label:26} {r['seconds'] * 1000:8.1f} ms  {r['rss_kb'] / 1024:7.1f} MiB  babel imported: {r['babel']}")
+
+    babel, table = results["babel"], results["table"]
+    print(f"{'table saves':26} {(babel['seconds'] - table['seconds']) * 1000:8.1f} ms  "
+          f"{(babel['rss_kb'] - table['rss_kb']) / 1024:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Local stand-in of Telegram Bot API for offline load tests
+
+Serves answerCallbackQuery, editMessageReplyMarkup and sendMessage on 127.0.0.1 with configurable latency,
+counts calls per method and keeps the last reply markup of every message, so a driver can click
+buttons the bot has actually shown. Point aiogram Bot at it with `TelegramAPIServer.from_base(stub.base_url)`.
+"""
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+NOT_FOUND = {"ok": False, "error_code": 404, "description": "Not Found: method not found"}
+
+
+class BotAPIStub:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.markups: Dict[Tuple[int, int], Optional[dict]] = {}  # (chat id, message id) -> reply markup
+        self.last_message: Dict[int, int] = {}  # chat id -> id of last message sent to it
+        self._next_message_id = 1
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    async def start(self) -> str:
+        """Starts server on a free local port, returns its base URL"""
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        handler = getattr(self, f"_{method}", None)
+        if handler is None:
+            return web.json_response(NOT_FOUND, status=404)
+        params = dict(await request.post())
+        self.calls[method] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.json_response({"ok": True, "result": handler(params)})
+
+    @staticmethod
+    def _markup(params: dict) -> Optional[dict]:
+        markup = params.get("reply_markup")
+        return json.loads(markup) if markup else None
+
+    def _answerCallbackQuery(self, params: dict) -> bool:
+        return True
+
+    def _editMessageReplyMarkup(self, params: dict) -> bool:
+        # True is what Telegram returns for inline messages, aiogram accepts it for chat messages as well
+        self.markups[(int(params["chat_id"]), int(params["message_id"]))] = self._markup(params)
+        return True
+
+    def _sendMessage(self, params: dict) -> dict:
+        chat_id = int(params["chat_id"])
+        message_id = self._next_message_id
+        self._next_message_id += 1
+        markup = self._markup(params)
+        self.markups[(chat_id, message_id)] = markup
+        self.last_message[chat_id] = message_id
+        message = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "text": params.get("text", ""),
+        }
+        if markup is not None:
+            message["reply_markup"] = markup
+        return message
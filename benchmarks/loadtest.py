@@ -0,0 +1,236 @@
+"""Offline end-to-end load test of calendar handlers inside aiogram Dispatcher
+
+Synthetic users open the calendar with a message and click through process_selection flows to a random
+date of the window. Their updates are fed to a Dispatcher as raw webhook updates. The Bot sends real
+HTTP requests to a local Bot API stub (see bot_api_stub), and every click uses a button of the
+keyboard the stub last received for the message.
+Reports throughput, handler latency percentiles, API calls per selected date and memory growth.
+
+Run from the repository root:
+    python -m benchmarks.loadtest [--users 2000] [--concurrency 500] [--latency 0.05]
+        [--calendar dialog|navigation] [--background] [--coalesce 0.3] [--serialized] [--json results.json]
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import random
+import resource
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from aiogram import Bot, Dispatcher, F
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.types import CallbackQuery, Message
+
+from aiogram_calendar import (
+    BackgroundEditor, Calendar, CalendarFilter, CalendarMiddleware, CalendarRegistry, EditCoalescer,
+    FixedClock, KeyboardCache, NavigationCalendar
+)
+
+from .bench_navigation import dialog_path, navigation_path, targets
+from .bot_api_stub import BotAPIStub
+from .suite import TODAY, percentile
+
+TOKEN = "42:LOADTEST"
+OPEN_TEXT = "calendar"
+KEYBOARD_TIMEOUT = 10  # seconds user waits for button to appear before giving up (counted as error)
+KEYBOARD_POLL = 0.005
+CALENDARS = {"dialog": (Calendar, dialog_path), "navigation": (NavigationCalendar, navigation_path)}
+
+
+def rss_bytes() -> int:
+    """Returns current resident set size, peak RSS where /proc isn't available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+def build_dispatcher(registry: CalendarRegistry) -> Dispatcher:
+    dp = Dispatcher()
+    dp.message.middleware(CalendarMiddleware(registry=registry))
+    dp.callback_query.middleware(CalendarMiddleware(registry=registry))
+
+    @dp.message(F.text == OPEN_TEXT)
+    async def open_calendar(message: Message, calendar: Calendar):
+        await message.answer("Please select a date: ", reply_markup=await calendar.start_calendar())
+
+    @dp.callback_query(CalendarFilter())
+    async def process_calendar(callback_query: CallbackQuery, callback_data, calendar: Calendar):
+        selected, date = await calendar.process_selection(callback_query, callback_data)
+        if selected:
+            await callback_query.message.answer(f'You selected {date.strftime("%d/%m/%Y")}')
+
+    return dp
+
+
+class Driver:
+    """Plays synthetic users, each in its own private chat, and collects handler latencies"""
+
+    def __init__(self, dp: Dispatcher, bot: Bot, stub: BotAPIStub, path_of, think_time: float) -> None:
+        self.dp = dp
+        self.bot = bot
+        self.stub = stub
+        self.path_of = path_of
+        self.think_time = think_time
+        self.latencies: List[int] = []
+        self.selected = 0
+        self.errors = 0
+        self._update_ids = itertools.count(1)
+
+    async def _feed(self, update: dict) -> None:
+        started = time.perf_counter_ns()
+        try:
+            await self.dp.feed_raw_update(self.bot, update)
+        except Exception:
+            self.errors += 1
+        self.latencies.append(time.perf_counter_ns() - started)
+
+    def _user(self, user_id: int) -> dict:
+        return {"id": user_id, "is_bot": False, "first_name": f"user{user_id}", "language_code": "en"}
+
+    async def _shown_markup(self, chat_id: int, message_id: int, data: str) -> Optional[dict]:
+        """Returns markup of message once it has button with data, like a user waiting for background edit"""
+        deadline = time.perf_counter() + KEYBOARD_TIMEOUT
+        while True:
+            markup = self.stub.markups.get((chat_id, message_id))
+            rows = (markup or {}).get("inline_keyboard", ())
+            if any(button["callback_data"] == data for row in rows for button in row):
+                return markup
+            if time.perf_counter() > deadline:
+                return None
+            await asyncio.sleep(KEYBOARD_POLL)
+
+    async def run_user(self, user_id: int, target) -> None:
+        chat = {"id": user_id, "type": "private"}
+        await self._feed({"update_id": next(self._update_ids), "message": {
+            "message_id": 1, "date": int(time.time()), "chat": chat, "from": self._user(user_id), "text": OPEN_TEXT,
+        }})
+        message_id = self.stub.last_message.get(user_id)
+        if message_id is None:
+            self.errors += 1
+            return
+        for data in self.path_of(*target):
+            if self.think_time:
+                await asyncio.sleep(self.think_time)
+            markup = await self._shown_markup(user_id, message_id, data)
+            if markup is None:
+                self.errors += 1
+                return
+            message = {"message_id": message_id, "date": int(time.time()), "chat": chat, "text": "Please select a date: "}
+            message["reply_markup"] = markup
+            await self._feed({"update_id": next(self._update_ids), "callback_query": {
+                "id": str(next(self._update_ids)), "from": self._user(user_id), "chat_instance": str(user_id),
+                "message": message, "data": data,
+            }})
+        if self.stub.last_message.get(user_id) != message_id:
+            self.selected += 1  # handler answered with "You selected ..." message
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    stub = BotAPIStub(latency=args.latency)
+    base_url = await stub.start()
+    session = AiohttpSession(api=TelegramAPIServer.from_base(base_url), limit=args.connections)
+    bot = Bot(TOKEN, session=session)
+
+    calendar_class, path_of = CALENDARS[args.calendar]
+    background_editor = BackgroundEditor() if args.background else None
+    options = dict(
+        clock=FixedClock(TODAY),  # click paths are planned from TODAY
+        keyboard_cache=KeyboardCache(),
+        background_editor=background_editor,
+        edit_coalescer=EditCoalescer(window=args.coalesce) if args.coalesce is not None else None,
+        serialized_markup=args.serialized,
+    )
+    registry = CalendarRegistry(calendar_class, **options)
+    dp = build_dispatcher(registry)
+    driver = Driver(dp, bot, stub, path_of, args.think_time)
+
+    random.seed(args.seed)
+    dates = targets(registry.get("en"))
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def user(user_id: int) -> None:
+        async with semaphore:
+            await driver.run_user(user_id, random.choice(dates))
+
+    gc.collect()
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(user(user_id) for user_id in range(1, args.users + 1)))
+        if background_editor is not None:
+            await background_editor.wait()
+        elapsed = time.perf_counter() - started
+    finally:
+        await session.close()
+        await stub.close()
+    gc.collect()
+    rss_after = rss_bytes()
+
+    latencies = sorted(driver.latencies)
+    api_calls = sum(stub.calls.values())
+    result = {
+        "calendar": args.calendar,
+        "users": args.users,
+        "concurrency": args.concurrency,
+        "latency_s": args.latency,
+        "updates": len(latencies),
+        "selected": driver.selected,
+        "errors": driver.errors,
+        "seconds": round(elapsed, 3),
+        "updates_per_sec": round(len(latencies) / elapsed, 1),
+        "dates_per_sec": round(driver.selected / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.5) / 1e6, 2),
+        "p95_ms": round(percentile(latencies, 0.95) / 1e6, 2),
+        "p99_ms": round(percentile(latencies, 0.99) / 1e6, 2),
+        "max_ms": round(latencies[-1] / 1e6, 2),
+        "api_calls": dict(stub.calls),
+        "api_calls_per_date": round(api_calls / driver.selected, 2) if driver.selected else None,
+        "rss_growth_bytes": rss_after - rss_before,
+    }
+    print(
+        f"{args.calendar}: {args.users} users, concurrency {args.concurrency}, API latency {args.latency * 1000:.0f} ms\n"
+        f"  {result['updates']} updates in {elapsed:.2f} s: {result['updates_per_sec']:.0f} updates/s, "
+        f"{result['dates_per_sec']:.0f} selected dates/s, {driver.errors} errors\n"
+        f"  handler latency p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  p99 {result['p99_ms']} ms"
+        f"  max {result['max_ms']} ms\n"
+        f"  API calls per selected date {result['api_calls_per_date']}: {result['api_calls']}\n"
+        f"  RSS growth {result['rss_growth_bytes'] / 2 ** 20:.1f} MiB"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500, help="users clicking at the same time")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every Bot API call takes")
+    parser.add_argument("--connections", type=int, default=100, help="connection limit of bot session")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds between clicks of a user")
+    parser.add_argument("--calendar", choices=CALENDARS, default="dialog")
+    parser.add_argument("--background", action="store_true", help="answer at once, edit with BackgroundEditor")
+    parser.add_argument("--coalesce", type=float, default=None, help="EditCoalescer window in seconds")
+    parser.add_argument("--serialized", action="store_true", help="send edits as prebuilt JSON")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="save results as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    result["python"] = sys.version.split()[0]
+    result["date"] = datetime.now().isoformat(timespec="seconds")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
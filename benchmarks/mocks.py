@@ -0,0 +1,42 @@
+"""Offline stand-ins for aiogram CallbackQuery and Message, recording API calls instead of sending them"""
+import asyncio
+from typing import List, Optional, Tuple
+
+from aiogram.types import InlineKeyboardMarkup
+
+
+class MockChat:
+    def __init__(self, chat_id: int) -> None:
+        self.id = chat_id
+
+
+class MockMessage:
+    def __init__(self, chat_id: int = 1, message_id: int = 1, latency: float = 0) -> None:
+        self.chat = MockChat(chat_id)
+        self.message_id = message_id
+        self.reply_markup: Optional[InlineKeyboardMarkup] = None
+        self.latency = latency
+        self.calls: List[Tuple[str, object]] = []
+
+    async def _api_call(self, method: str, payload: object = None) -> bool:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.calls.append((method, payload))
+        return True
+
+    async def edit_reply_markup(self, reply_markup: InlineKeyboardMarkup = None, **kwargs) -> bool:
+        self.reply_markup = reply_markup
+        return await self._api_call("editMessageReplyMarkup", reply_markup)
+
+    async def delete_reply_markup(self, **kwargs) -> bool:
+        self.reply_markup = None
+        return await self._api_call("editMessageReplyMarkup")
+
+
+class MockCallbackQuery:
+    def __init__(self, message: MockMessage, data: str = None) -> None:
+        self.message = message
+        self.data = data
+
+    async def answer(self, text: str = None, **kwargs) -> bool:
+        return await self.message._api_call("answerCallbackQuery", text)
@@ -0,0 +1,159 @@
+"""Offline benchmark suite for keyboard rendering and callback processing
+
+Measures ops/sec, p50/p99 latency and memory allocated per operation with tracemalloc,
+for cold (keyboard cache disabled) and warm (cached) renders, every process_selection action
+and calendars of many locales. Results can be saved as JSON to track regressions between releases.
+
+Run from the repository root:
+    python -m benchmarks.suite [--json results.json] [--iterations 2000]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List
+
+from aiogram_calendar import Calendar, FixedClock, KeyboardCache, decode_callback, get_calendar_labels
+from aiogram_calendar.schemas import CalendarActions, packed
+
+from .mocks import MockCallbackQuery, MockMessage
+
+TODAY = datetime(2026, 10, 18, 12, 0)
+LOCALES = [
+    "en", "uk", "ru", "de", "fr", "es", "it", "pt", "pl", "tr", "ar", "fa", "he", "hi", "bn",
+    "zh", "ja", "ko", "vi", "th", "id", "nl", "sv", "fi", "cs", "el", "ro", "hu", "ka", "kk",
+]
+
+
+def percentile(samples: List[int], fraction: float) -> int:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def measure(name: str, op: Callable[[], Awaitable], iterations: int) -> Dict:
+    """Runs op iterations times and returns its throughput, latency percentiles and allocations"""
+    await op()  # warm up lazy imports and caches which are meant to be warm
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        op_started = time.perf_counter_ns()
+        await op()
+        samples.append(time.perf_counter_ns() - op_started)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+
+    # peak of traced memory during one op approximates memory allocated per op
+    allocation_runs = max(1, iterations // 10)
+    peaks = 0
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(allocation_runs):
+        op_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await op()
+        peaks += tracemalloc.get_traced_memory()[1] - op_before
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    result = {
+        "name": name,
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / elapsed, 1),
+        "p50_us": round(percentile(samples, 0.5) / 1000, 2),
+        "p99_us": round(percentile(samples, 0.99) / 1000, 2),
+        "allocated_bytes_per_op": round(peaks / allocation_runs, 1),
+        "retained_bytes_per_op": round(retained / allocation_runs, 1),
+    }
+    print(
+        f"{name:<40} {result['ops_per_sec']:>10.0f} ops/s  p50 {result['p50_us']:>9.1f} us"
+        f"  p99 {result['p99_us']:>9.1f} us  alloc {result['allocated_bytes_per_op']:>8.0f} B/op  retained {result['retained_bytes_per_op']:>7.0f} B/op"
+    )
+    return result
+
+
+def render_ops(calendar: Calendar) -> Dict[str, Callable[[], Awaitable]]:
+    year, month = TODAY.year, TODAY.month
+    return {
+        "start_calendar": lambda: calendar.start_calendar(),
+        "_get_month_kb": lambda: calendar._get_month_kb(year),
+        "_get_days_kb current month": lambda: calendar._get_days_kb(year, month),
+        "_get_days_kb next year": lambda: calendar._get_days_kb(year + 1, month),
+    }
+
+
+def selection_payloads() -> Dict[str, str]:
+    year, month = TODAY.year, TODAY.month
+    return {
+        CalendarActions.ignore.value: packed(CalendarActions.ignore),
+        CalendarActions.set_y.value: packed(CalendarActions.set_y, year, -1, -1),
+        CalendarActions.start.value: packed(CalendarActions.start, year, -1, -1),
+        CalendarActions.set_m.value: packed(CalendarActions.set_m, year, month + 1, -1),
+        CalendarActions.day.value: packed(CalendarActions.day, year, month + 1, 15),
+        CalendarActions.cancel.value: packed(CalendarActions.cancel, year, month, 1),
+        CalendarActions.prev_y.value: packed(CalendarActions.prev_y, year + 1, month, 1),
+        CalendarActions.next_y.value: packed(CalendarActions.next_y, year, month, 1),
+        CalendarActions.prev_m.value: packed(CalendarActions.prev_m, year, month + 1, 1),
+        CalendarActions.next_m.value: packed(CalendarActions.next_m, year, month, 1),
+    }
+
+
+async def run(iterations: int) -> Dict:
+    clock = FixedClock(TODAY)
+    results = {"renders": [], "selections": [], "locales": []}
+
+    for label, cache in (("cold", None), ("warm", KeyboardCache())):
+        calendar = Calendar(locale="en", clock=clock, keyboard_cache=cache)
+        for name, op in render_ops(calendar).items():
+            results["renders"].append(await measure(f"{label} {name}", op, iterations))
+
+    message = MockMessage()
+    for label, cache in (("cold", None), ("warm", KeyboardCache())):
+        calendar = Calendar(locale="en", clock=clock, keyboard_cache=cache)
+        for act, payload in selection_payloads().items():
+            query = MockCallbackQuery(message, payload)
+
+            async def op(query=query, calendar=calendar):
+                message.calls.clear()
+                return await calendar.process_selection(query, decode_callback(query.data))
+
+            results["selections"].append(await measure(f"{label} process_selection {act}", op, iterations))
+
+    locale_iterations = max(1, iterations // 10)
+    for locale in LOCALES:
+        async def op(locale=locale):
+            calendar = Calendar(locale=locale, clock=clock, keyboard_cache=None)
+            return await calendar._get_days_kb(TODAY.year, TODAY.month)
+
+        get_calendar_labels.cache_clear()
+        first_started = time.perf_counter()
+        await op()
+        first_render_us = round((time.perf_counter() - first_started) * 1e6, 1)
+        result = await measure(f"locale {locale} construct + render", op, locale_iterations)
+        result["first_render_us"] = first_render_us
+        results["locales"].append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="path to save machine-readable results to")
+    parser.add_argument("--iterations", type=int, default=2000, help="iterations per benchmark")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations))
+    results["meta"] = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import asyncio
 import sys
 from datetime import datetime
 
-from aiogram_calendar import Calendar, CalendarCallback, get_user_locale
+from aiogram_calendar import Calendar, CalendarFilter, CalendarMiddleware
 from aiogram import Bot, Dispatcher, F
 from aiogram.enums import ParseMode
 from aiogram.filters import CommandStart
@@ -16,6 +16,9 @@ from config import API_TOKEN
 
 # All handlers should be attached to the Router (or Dispatcher)
 dp = Dispatcher()
+# Injects shared calendar for user's locale into handlers as `calendar` argument
+dp.message.middleware(CalendarMiddleware())
+dp.callback_query.middleware(CalendarMiddleware())
 
 # Initialising keyboard
 kb = [
@@ -30,19 +33,15 @@ async def command_start_handler(message: Message) -> None:
     await message.reply(f"Hello, {hbold(message.from_user.full_name)}! Select a date", reply_markup=start_kb)
 
 @dp.message(F.text.lower() == 'open calendar')
-async def dialog_cal_handler(message: Message):
+async def dialog_cal_handler(message: Message, calendar: Calendar):
     await message.answer(
         "Please select a date: ",
-        reply_markup=await Calendar(
-            locale=await get_user_locale(message.from_user)
-        ).start_calendar()
+        reply_markup=await calendar.start_calendar()
     )
 
-@dp.callback_query(CalendarCallback.filter())
-async def process_dialog_calendar(callback_query: CallbackQuery, callback_data: CallbackData):
-    selected, date = await Calendar(
-        locale=await get_user_locale(callback_query.from_user)
-    ).process_selection(callback_query, callback_data)
+@dp.callback_query(CalendarFilter())
+async def process_dialog_calendar(callback_query: CallbackQuery, callback_data: CallbackData, calendar: Calendar):
+    selected, date = await calendar.process_selection(callback_query, callback_data)
     if selected:
         await callback_query.message.answer(
             f'You selected {date.strftime("%d/%m/%Y")}',
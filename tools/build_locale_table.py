@@ -0,0 +1,60 @@
+"""Generates aiogram_calendar/locale_data.py - abbreviated day and month names of all CLDR locales
+
+Names are resolved with the same code calendar uses at runtime (common.babel_labels), so table lookups
+give exactly what Babel would. Identical label sets are stored once. Regenerate after Babel upgrade:
+    python -m tools.build_locale_table
+(runs as part of `make build`)
+"""
+import os
+import sys
+
+import babel
+from babel import localedata
+from babel.localedata import locale_identifiers
+
+from aiogram_calendar.common import babel_labels
+
+OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "aiogram_calendar", "locale_data.py")
+
+
+def build_table():
+    """Returns (label sets, locale -> index of its label set)"""
+    label_sets, indexes, locales = [], {}, {}
+    for identifier in sorted(locale_identifiers()):
+        # merged data of one locale can leak into cached parents of the next ones (e.g. after 'ann' root
+        # months resolve to 'M01'), so each locale is resolved from freshly loaded data
+        localedata._cache.clear()
+        names = babel_labels(identifier)
+        if names is None:
+            continue
+        if names not in indexes:
+            indexes[names] = len(label_sets)
+            label_sets.append(names)
+        locales[identifier] = indexes[names]
+    return label_sets, locales
+
+
+def render(label_sets, locales) -> str:
+    lines = [
+        f"# Generated by tools/build_locale_table.py from Babel {babel.__version__} CLDR data, do not edit",
+        "# (days, months) abbreviated names, shared by locales with identical names",
+        "LABEL_SETS = (",
+    ]
+    lines.extend(f"    ({days!r}, {months!r})," for days, months in label_sets)
+    lines.append(")")
+    lines.append("LOCALES = {")
+    lines.extend(f"    {identifier!r}: {index}," for identifier, index in locales.items())
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    output = sys.argv[1] if len(sys.argv) > 1 else OUTPUT
+    label_sets, locales = build_table()
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(render(label_sets, locales))
+    print(f"{len(locales)} locales, {len(label_sets)} distinct label sets -> {output}")
+
+
+if __name__ == "__main__":
+    main()